@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de leitura dos JSON legados - SINDPLAST
+Compara pico de memória (RSS) e tempo de json.load com a leitura incremental
+de Scripts/leitor_json.py. Cada medição roda em um subprocesso separado para
+que o pico de RSS de uma não contamine a outra.
+
+Uso:
+    python Benchmarks/bench_leitura_json.py --registros 200000
+    python Benchmarks/bench_leitura_json.py --arquivo Data/Socios.json --chave Socio
+"""
+
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPTS_DIR = os.path.join(BACKEND_DIR, 'Scripts')
+
+MEDICAO = r'''
+import json, resource, sys, time
+sys.path.insert(0, {scripts!r})
+from leitor_json import iterar_registros
+
+inicio = time.perf_counter()
+total = 0
+if {modo!r} == 'json.load':
+    with open({arquivo!r}, 'r', encoding='utf-8') as f:
+        for registro in json.load(f).get({chave!r}, []):
+            total += 1
+else:
+    for registro in iterar_registros({arquivo!r}, {chave!r}):
+        total += 1
+duracao = time.perf_counter() - inicio
+pico_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{'registros': total, 'segundos': duracao, 'pico_rss_mb': pico_kb / 1024}}))
+'''
+
+
+def gerar_socios(caminho, quantidade):
+    """Arquivo no formato do export legado ({"Socio": [...]})"""
+    aleatorio = random.Random(42)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        f.write('{\n"Socio": [\n')
+        for i in range(quantidade):
+            registro = {
+                'SNOME': f'SÓCIO DE TESTE {i}',
+                'SIDENT': str(aleatorio.randint(1000000, 9999999)),
+                'SDNASC': '1980-05-17T04:00:00.000Z',
+                'SNATURAL': 'MANAUS',
+                'SSEXO': aleatorio.choice(['MASCULINO', 'FEMININO']),
+                'SEND': f'RUA {i}, {aleatorio.randint(1, 999)}',
+                'SBAIRRO': 'DISTRITO INDUSTRIAL',
+                'SCEP': '69075110',
+                'SPAI': 'NOME DO PAI', 'SMAE': 'NOME DA MÃE',
+                'SATIV': aleatorio.random() > 0.3,
+                'SMAT': str(i), 'ECODIG': aleatorio.randint(1, 300),
+                'SVALORME': 25.0, 'SFONE': '9236171800',
+                'SOBS': 'OBSERVAÇÃO ' * aleatorio.randint(0, 20),
+            }
+            f.write(('\t' if i == 0 else ',\n\t') + json.dumps(registro, ensure_ascii=False))
+        f.write('\n]\n}')
+
+
+def medir(modo, arquivo, chave):
+    codigo = MEDICAO.format(scripts=SCRIPTS_DIR, modo=modo, arquivo=arquivo, chave=chave)
+    saida = subprocess.run([sys.executable, '-c', codigo], capture_output=True, text=True, check=True)
+    return json.loads(saida.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--arquivo', help='arquivo JSON existente (padrão: gera um sintético)')
+    parser.add_argument('--chave', default='Socio')
+    parser.add_argument('--registros', type=int, default=100000, help='registros do arquivo sintético')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        arquivo = args.arquivo
+        if not arquivo:
+            arquivo = os.path.join(diretorio, 'Socios.json')
+            gerar_socios(arquivo, args.registros)
+        tamanho_mb = os.path.getsize(arquivo) / (1024 * 1024)
+        print(f'Arquivo: {arquivo} ({tamanho_mb:.1f} MB)')
+        print(f"{'modo':<14}{'registros':>12}{'segundos':>10}{'pico RSS MB':>14}")
+        for modo in ('json.load', 'incremental'):
+            r = medir(modo, arquivo, args.chave)
+            print(f"{modo:<14}{r['registros']:>12}{r['segundos']:>10.2f}{r['pico_rss_mb']:>14.1f}")
+
+
+if __name__ == '__main__':
+    main()
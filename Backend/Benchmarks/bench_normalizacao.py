@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Micro-benchmark da normalização - SINDPLAST
+Custo por milhão de registros das funções de normalizacao.py (versões em
+lote), comparado com a implementação anterior baseada em re.sub(r'[^\\d]', ...)
+que existia nos scripts de migração.
+
+Uso:
+    python Benchmarks/bench_normalizacao.py --registros 200000 --repeticoes 3
+"""
+
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import normalizacao  # noqa: E402
+
+
+# Implementação anterior (copiada dos scripts de migração), como referência
+def _cnpj_anterior(cnpj):
+    if not cnpj:
+        return None
+    cnpj_limpo = re.sub(r'[^\d]', '', str(cnpj))
+    if len(cnpj_limpo) != 14:
+        return cnpj
+    return f"{cnpj_limpo[:2]}.{cnpj_limpo[2:5]}.{cnpj_limpo[5:8]}/{cnpj_limpo[8:12]}-{cnpj_limpo[12:]}"
+
+
+def _telefone_anterior(telefone):
+    if not telefone:
+        return None
+    telefone_limpo = re.sub(r'[^\d]', '', str(telefone))
+    if len(telefone_limpo) == 10:
+        return f"({telefone_limpo[:2]}) {telefone_limpo[2:6]}-{telefone_limpo[6:]}"
+    elif len(telefone_limpo) == 11:
+        return f"({telefone_limpo[:2]}) {telefone_limpo[2:7]}-{telefone_limpo[7:]}"
+    else:
+        return telefone
+
+
+def _cep_anterior(cep):
+    if not cep:
+        return None
+    cep_limpo = re.sub(r'[^\d]', '', str(cep))
+    if len(cep_limpo) == 8:
+        return f"{cep_limpo[:5]}-{cep_limpo[5:]}"
+    else:
+        return cep
+
+
+def gerar_dados(quantidade):
+    aleatorio = random.Random(7)
+    cnpjs, cpfs, telefones, ceps = [], [], [], []
+    for _ in range(quantidade):
+        cnpj = f'{aleatorio.randrange(10 ** 14):014d}'
+        cnpjs.append(cnpj if aleatorio.random() < 0.5 else normalizacao.formatar_cnpj(cnpj))
+        cpf = f'{aleatorio.randrange(10 ** 11):011d}'
+        cpfs.append(cpf if aleatorio.random() < 0.5 else normalizacao.formatar_cpf(cpf))
+        telefones.append(aleatorio.choice([
+            aleatorio.randrange(30000000, 99999999),
+            f'92{aleatorio.randrange(30000000, 99999999)}',
+            f'(92) 9{aleatorio.randrange(10000000, 99999999)}',
+            None,
+        ]))
+        ceps.append(f'690{aleatorio.randrange(100000):05d}')
+    return {'cnpj': cnpjs, 'cpf': cpfs, 'telefone': telefones, 'cep': ceps}
+
+
+def medir(funcao, valores, repeticoes):
+    melhor = float('inf')
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao(valores)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, default=200000)
+    parser.add_argument('--repeticoes', type=int, default=3)
+    args = parser.parse_args()
+
+    dados = gerar_dados(args.registros)
+    casos = [
+        ('digitos (cnpj)', 'cnpj', lambda v: [re.sub(r'[^\d]', '', str(x)) for x in v], normalizacao.digitos_lote),
+        ('formatar_cnpj', 'cnpj', lambda v: [_cnpj_anterior(x) for x in v], normalizacao.formatar_cnpj_lote),
+        ('formatar_telefone', 'telefone', lambda v: [_telefone_anterior(x) for x in v],
+         normalizacao.formatar_telefone_lote),
+        ('formatar_cep', 'cep', lambda v: [_cep_anterior(x) for x in v], normalizacao.formatar_cep_lote),
+        ('validar_cpf', 'cpf', None, normalizacao.validar_cpf_lote),
+        ('validar_cnpj', 'cnpj', None, normalizacao.validar_cnpj_lote),
+    ]
+
+    escala = 1_000_000 / args.registros
+    print(f'{args.registros} registros por caso, melhor de {args.repeticoes}; tempos em s por milhão de registros')
+    print(f"{'função':<20}{'anterior':>10}{'atual':>10}{'ganho':>8}")
+    for nome, chave, anterior, atual in casos:
+        valores = dados[chave]
+        if anterior is not None:
+            assert [str(x) for x in anterior(valores)] == [str(x) for x in atual(valores)], nome
+        t_atual = medir(atual, valores, args.repeticoes) * escala
+        if anterior is None:
+            print(f"{nome:<20}{'-':>10}{t_atual:>10.3f}{'-':>8}")
+            continue
+        t_anterior = medir(anterior, valores, args.repeticoes) * escala
+        print(f'{nome:<20}{t_anterior:>10.3f}{t_atual:>10.3f}{t_anterior / t_atual:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
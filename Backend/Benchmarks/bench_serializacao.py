@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da serialização das listagens - SINDPLAST
+Compara, sobre a tabela inteira de sócios (e de empresas), o caminho antigo
+das listagens com o atual:
+
+    orm     select(Socio) -> instâncias do ORM -> to_dict() -> jsonify()
+    linhas  select(colunas) -> linhas do Core -> serializador_linhas()
+            -> codificar_json() (orjson quando instalado)
+
+Cada caminho é medido por etapa (leitura, dicionarios, json) e no total, em
+linhas por segundo. Antes de medir, confere que os dois JSON decodificados
+são idênticos (mesma forma de to_dict()). Os resultados são gravados em
+Benchmarks/resultados/serializacao_<escala>_<data>.json.
+
+Uso:
+    python Benchmarks/bench_serializacao.py --escala 100k
+    python Benchmarks/bench_serializacao.py --escala 100k --comparar Benchmarks/resultados/serializacao_100k_<data>.json
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+DIR_BENCHMARKS = os.path.dirname(os.path.abspath(__file__))
+DIR_BACKEND = os.path.dirname(DIR_BENCHMARKS)
+sys.path.insert(0, DIR_BENCHMARKS)
+sys.path.insert(0, DIR_BACKEND)
+
+from flask import current_app  # noqa: E402
+from sqlalchemy import func, select  # noqa: E402
+
+import estatisticas  # noqa: E402
+import gerador_dados  # noqa: E402
+import serializacao  # noqa: E402
+from app import create_app  # noqa: E402
+from banco import criar_engine  # noqa: E402
+from models import Empresa, Socio, db, inicializar_banco  # noqa: E402
+
+RECURSOS = {
+    'socios': (Socio, serializacao.CAMPOS_SOCIO, Socio.IdSocio),
+    'empresas': (Empresa, serializacao.CAMPOS_EMPRESA, Empresa.IdEmpresa),
+}
+
+ETAPAS = ('leitura', 'dicionarios', 'json')
+
+
+def caminho_orm(modelo, campos, ordem):
+    inicio = time.perf_counter()
+    instancias = db.session.execute(select(modelo).order_by(ordem)).scalars().all()
+    t_leitura = time.perf_counter()
+    itens = [instancia.to_dict() for instancia in instancias]
+    t_dicionarios = time.perf_counter()
+    corpo = current_app.json.response(itens).get_data()
+    t_json = time.perf_counter()
+    db.session.expunge_all()
+    return corpo, {'leitura': t_leitura - inicio, 'dicionarios': t_dicionarios - t_leitura, 'json': t_json - t_dicionarios}
+
+
+def caminho_linhas(modelo, campos, ordem):
+    inicio = time.perf_counter()
+    chaves = list(campos)
+    serializar = serializacao.serializador_linhas(chaves, campos)
+    linhas = db.session.execute(select(*serializacao.atributos(modelo, chaves, campos)).order_by(ordem)).all()
+    t_leitura = time.perf_counter()
+    itens = [serializar(linha) for linha in linhas]
+    t_dicionarios = time.perf_counter()
+    corpo = serializacao.codificar_json(itens)
+    t_json = time.perf_counter()
+    return corpo, {'leitura': t_leitura - inicio, 'dicionarios': t_dicionarios - t_leitura, 'json': t_json - t_dicionarios}
+
+
+CAMINHOS = {'orm': caminho_orm, 'linhas': caminho_linhas}
+
+
+def conferir(recurso, modelo, campos, ordem):
+    """Falha se o JSON do caminho novo diferir do de to_dict()"""
+    antigo, _ = caminho_orm(modelo, campos, ordem)
+    novo, _ = caminho_linhas(modelo, campos, ordem)
+    antigo, novo = json.loads(antigo), json.loads(novo)
+    if antigo != novo:
+        diferentes = [i for i, (a, b) in enumerate(zip(antigo, novo)) if a != b]
+        exemplo = diferentes[0] if diferentes else min(len(antigo), len(novo))
+        raise SystemExit(f'{recurso}: saída diferente de to_dict() ({len(diferentes)} itens, '
+                         f'{len(antigo)} x {len(novo)}); primeiro no índice {exemplo}')
+    return len(novo)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--escala', default='100k', help='10k, 100k, 1m ou número de sócios')
+    parser.add_argument('--banco', help='URL do banco (padrão: SQLite em Benchmarks/dados)')
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--recursos', default='socios,empresas')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior')
+    args = parser.parse_args()
+
+    socios = gerador_dados.escala_socios(args.escala)
+    os.makedirs(gerador_dados.DIR_DADOS, exist_ok=True)
+    url = args.banco or f'sqlite:///{os.path.join(gerador_dados.DIR_DADOS, f"bench_{args.escala}.db")}'
+
+    engine = criar_engine(url)
+    inicializar_banco(engine)
+    with engine.connect() as conn:
+        existentes = conn.scalar(select(func.count()).select_from(Socio))
+    engine.dispose()
+    if existentes < socios:
+        print(f'Populando {url} com {socios} sócios...')
+        gerador_dados.popular_banco(url, socios)
+
+    app = create_app({'SQLALCHEMY_DATABASE_URI': url, 'SESSION_SWEEP_INTERVAL': 0})
+    encoder = 'orjson' if serializacao.orjson is not None else 'provider do Flask'
+    print(f'Serialização ({args.repeticoes} repetições, {url}, JSON: {encoder})')
+
+    resultados = {}
+    vazao = {}
+    with app.app_context():
+        for recurso in args.recursos.split(','):
+            modelo, campos, ordem = RECURSOS[recurso]
+            linhas = conferir(recurso, modelo, campos, ordem)
+            print(f'\n{recurso}: {linhas} linhas, saída idêntica a to_dict()')
+            for nome, caminho in CAMINHOS.items():
+                amostras = [caminho(modelo, campos, ordem)[1] for _ in range(args.repeticoes)]
+                for etapa in ETAPAS:
+                    resultados[f'{recurso}_{nome}_{etapa}'] = estatisticas.resumo([a[etapa] for a in amostras])
+                total = estatisticas.resumo([sum(a.values()) for a in amostras])
+                resultados[f'{recurso}_{nome}_total'] = total
+                vazao[f'{recurso}_{nome}'] = round(linhas / (total['p50Ms'] / 1000))
+                etapas = '  '.join(f'{etapa} {resultados[f"{recurso}_{nome}_{etapa}"]["p50Ms"]:.0f} ms'
+                                   for etapa in ETAPAS)
+                print(f'  {nome:<7} {vazao[f"{recurso}_{nome}"]:>10,} linhas/s   ({etapas})')
+            print(f'  ganho   {vazao[f"{recurso}_linhas"] / vazao[f"{recurso}_orm"]:.1f}x')
+
+    dados = {
+        'metadados': estatisticas.metadados(benchmark='serializacao', escala=args.escala, banco=url,
+                                            repeticoes=args.repeticoes, json=encoder),
+        'resultados': resultados,
+        'linhasPorSegundo': vazao,
+    }
+    caminho = estatisticas.salvar(f'serializacao_{args.escala}', dados)
+    print(f'\nResultados: {caminho}')
+
+    if args.comparar:
+        anterior = estatisticas.carregar(args.comparar)
+        if estatisticas.comparar(resultados, anterior['resultados']):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
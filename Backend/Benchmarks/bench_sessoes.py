@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark de backends de sessão - SINDPLAST
+Compara memória, SQL e o armazenamento em arquivos do Flask-Session
+simulando logins concorrentes seguidos de leituras da sessão (/me).
+
+Uso:
+    python Benchmarks/bench_sessoes.py --threads 16 --logins 200
+    DATABASE_URL=postgresql://... python Benchmarks/bench_sessoes.py --backends sql
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from flask import Flask, jsonify, session
+from sqlalchemy import create_engine, event
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sessoes  # noqa: E402
+
+
+def criar_app(backend, diretorio, engine, sessoes_existentes):
+    app = Flask(__name__)
+    app.config['SECRET_KEY'] = 'benchmark'
+    app.config['SESSION_BACKEND'] = backend
+    app.config['SESSION_TYPE'] = 'filesystem'
+    app.config['SESSION_FILE_DIR'] = os.path.join(diretorio, 'flask_session')
+    app.config['SESSION_SWEEP_INTERVAL'] = 0
+    armazenamento = sessoes.init_app(app, obter_engine=lambda: engine)
+
+    @app.route('/login', methods=['POST'])
+    def login():
+        session['user_id'] = threading.get_ident()
+        session['usuario'] = 'benchmark'
+        session['perfil'] = 'Administrador'
+        return jsonify({'success': True})
+
+    @app.route('/me')
+    def me():
+        return jsonify({'user_id': session.get('user_id')})
+
+    # Sessões antigas já presentes (ex.: o diretório flask_session acumulado)
+    if sessoes_existentes:
+        cliente = app.test_client()
+        for _ in range(sessoes_existentes):
+            cliente.post('/login')
+            cliente.delete_cookie('session')
+    return app, armazenamento
+
+
+def executar(app, threads, logins, leituras):
+    latencias = []
+    erros = []
+    lock = threading.Lock()
+    barreira = threading.Barrier(threads)
+
+    def trabalhador():
+        locais = []
+        barreira.wait()
+        for _ in range(logins):
+            cliente = app.test_client()
+            inicio = time.perf_counter()
+            resposta = cliente.post('/login')
+            locais.append(time.perf_counter() - inicio)
+            for _ in range(leituras):
+                inicio = time.perf_counter()
+                resposta = cliente.get('/me')
+                locais.append(time.perf_counter() - inicio)
+                if resposta.json.get('user_id') is None:
+                    erros.append(1)
+        with lock:
+            latencias.extend(locais)
+
+    inicio = time.perf_counter()
+    workers = [threading.Thread(target=trabalhador) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    duracao = time.perf_counter() - inicio
+
+    latencias.sort()
+    return {
+        'requisicoes': len(latencias),
+        'req_s': len(latencias) / duracao,
+        'p50_ms': statistics.median(latencias) * 1000,
+        'p95_ms': latencias[int(len(latencias) * 0.95) - 1] * 1000,
+        'p99_ms': latencias[int(len(latencias) * 0.99) - 1] * 1000,
+        'sessoes_perdidas': len(erros),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backends', default='memory,sql,filesystem')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--logins', type=int, default=100, help='logins por thread')
+    parser.add_argument('--leituras', type=int, default=5, help='requisições /me após cada login')
+    parser.add_argument('--sessoes-existentes', type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as diretorio:
+        url = os.environ.get('DATABASE_URL') or f"sqlite:///{os.path.join(diretorio, 'sessoes.db')}"
+        opcoes = {'execution_options': {'schema_translate_map': {'Sindplast': None}}} if url.startswith('sqlite') else {}
+        engine = create_engine(url, **opcoes)
+        if url.startswith('sqlite'):
+            event.listen(engine, 'connect', lambda conn, _: conn.execute('PRAGMA journal_mode=WAL'))
+        # Tabela de sessões, como no 'flask init-db' (sessoes.py não cria tabelas)
+        sessoes.metadata.create_all(engine)
+
+        print(f"{'backend':<12}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'perdidas':>10}")
+        for backend in args.backends.split(','):
+            app, _ = criar_app(backend, diretorio, engine, args.sessoes_existentes)
+            r = executar(app, args.threads, args.logins, args.leituras)
+            print(f"{backend:<12}{r['req_s']:>10.0f}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+                  f"{r['sessoes_perdidas']:>10}")
+        engine.dispose()
+
+
+if __name__ == '__main__':
+    main()
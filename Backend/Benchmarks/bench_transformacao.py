@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark da normalização de sócios - SINDPLAST
+Mede registros/s de Scripts/transformacao.py com 1..N processos sobre registros
+sintéticos no formato legado e confere que a saída é idêntica (mesma ordem)
+em todas as configurações.
+
+Uso:
+    python Benchmarks/bench_transformacao.py --registros 500000 --processos 1 2 4 8
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scripts'))
+
+from transformacao import TAMANHO_BLOCO, transformar_em_blocos, transformar_socio  # noqa: E402
+
+_EMPRESAS = {}
+
+
+def _inicializar(empresas):
+    global _EMPRESAS
+    _EMPRESAS = empresas
+
+
+def _transformar(socio_json):
+    return transformar_socio(socio_json, _EMPRESAS)
+
+
+def gerar_registros(quantidade, n_empresas=300):
+    aleatorio = random.Random(42)
+    for i in range(quantidade):
+        yield {
+            'SNOME': f'SÓCIO DE TESTE {i}',
+            'SIDENT': str(aleatorio.randint(1000000, 9999999)),
+            'SDNASC': f'19{aleatorio.randint(50, 99)}-0{aleatorio.randint(1, 9)}-1{aleatorio.randint(0, 9)}T04:00:00.000Z',
+            'SDTC': '2010-03-01T04:00:00.000Z',
+            'SDTADMS': '2009-11-20',
+            'SCEP': str(aleatorio.randint(69000000, 69099999)),
+            'SFONE': f'92{aleatorio.randint(30000000, 99999999)}',
+            'SATIV': aleatorio.random() > 0.3,
+            'SMAT': str(i),
+            'ECODIG': aleatorio.randint(1, n_empresas),
+            'SVALORME': 25.0,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--registros', type=int, default=200000)
+    parser.add_argument('--processos', type=int, nargs='+', default=[1, 2, os.cpu_count() or 1])
+    parser.add_argument('--tamanho-bloco', type=int, default=TAMANHO_BLOCO)
+    args = parser.parse_args()
+
+    empresas = {str(i): {'ECGC': f'{i:014d}', 'ENOME': f'EMPRESA {i}'} for i in range(1, 301)}
+    referencia = None
+    print(f'{args.registros} registros, blocos de {args.tamanho_bloco}')
+    print(f"{'processos':>10}{'segundos':>10}{'registros/s':>14}{'speedup':>9}")
+    base = None
+    for processos in args.processos:
+        inicio = time.perf_counter()
+        saida = []
+        for bloco in transformar_em_blocos(gerar_registros(args.registros), _transformar, args.tamanho_bloco,
+                                           processos, _inicializar, (empresas,)):
+            saida.extend(bloco)
+        duracao = time.perf_counter() - inicio
+        if referencia is None:
+            referencia = saida
+        elif saida != referencia:
+            raise SystemExit(f'Saída com {processos} processos difere da primeira execução')
+        base = base or duracao
+        print(f'{processos:>10}{duracao:>10.2f}{args.registros / duracao:>14.0f}{base / duracao:>9.2f}')
+
+
+if __name__ == '__main__':
+    main()
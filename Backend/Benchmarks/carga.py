@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de carga - SINDPLAST
+Simula usuários do frontend em paralelo contra uma instância rodando (flask
+run, gunicorn...) e mede vazão, latência (p50/p95/p99) e taxa de erro por
+etapa dos fluxos:
+
+    turno       troca de turno: login, /me e permissões, Dashboard, tela de
+                Sócios (lista completa), busca, detalhe e edição de um sócio
+    relatorios  login, relatório de ativos por empresa e exportações CSV/XLSX
+    consulta    sem login, só rotas de leitura: Dashboard, páginas de sócios,
+                busca, lista de ativos e de empresas (também servidas pelo
+                app_async.py)
+
+Cada usuário virtual tem a própria conexão (keep-alive) e cookies, e repete
+fluxos sorteados conforme --mix até o fim de --duracao (ou --fluxos por
+usuário). --rampa espalha o início dos usuários; com 0 todos entram juntos,
+como na troca de turno.
+
+--dashboard legado refaz as seis listagens que o Dashboard fazia antes de
+/api/dashboard/stats, para comparar as duas versões sob carga.
+
+Os resultados vão para Benchmarks/resultados/carga_<data>.json (mesmo formato
+do bench_api.py) e podem ser comparados com --comparar.
+
+Uso:
+    gunicorn -w 4 -b 127.0.0.1:5000 app:app   # com DATABASE_URL do banco de teste
+    python Benchmarks/carga.py --url http://127.0.0.1:5000 --usuarios 50 --duracao 60
+    python Benchmarks/carga.py --usuarios 20 --mix turno=1 --sem-escrita --dashboard legado
+    uvicorn app_async:app --port 5001
+    python Benchmarks/carga.py --url http://127.0.0.1:5001 --usuarios 300 --mix consulta=1 --pausa 500
+"""
+
+import argparse
+import http.client
+import json
+import random
+import sys
+import threading
+import time
+from collections import defaultdict
+from urllib.parse import quote, urlsplit
+
+import estatisticas
+
+FLUXOS = ('turno', 'relatorios', 'consulta')
+MIX_PADRAO = 'turno=8,relatorios=1'
+
+# Listagens feitas pelo Dashboard antes de /api/dashboard/stats
+DASHBOARD_LEGADO = ('/api/usuarios', '/api/socios', '/api/empresas',
+                    '/api/usuarios', '/api/empresas', '/api/socios')
+
+# Termos digitados na busca de sócios (sobrenomes e prenomes comuns nos dados gerados)
+TERMOS_BUSCA = ('silva', 'santos', 'oliveira', 'conceicao', 'maria', 'jose', 'ferreira', 'souza', 'araujo', 'lima')
+
+
+class ErroHttp(Exception):
+    pass
+
+
+class Coletor:
+    """Latências e erros por etapa, compartilhados entre as threads"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.tempos = defaultdict(list)
+        self.erros = defaultdict(int)
+        self.bytes = defaultdict(int)
+        self.exemplos_erro = {}
+
+    def registrar(self, etapa, duracao, tamanho, erro=None):
+        with self._lock:
+            self.tempos[etapa].append(duracao)
+            self.bytes[etapa] += tamanho
+            if erro is not None:
+                self.erros[etapa] += 1
+                self.exemplos_erro.setdefault(etapa, erro)
+
+
+class UsuarioVirtual:
+    """Uma aba do navegador: conexão própria, cookie de sessão e token JWT"""
+
+    def __init__(self, url, coletor, args, semente):
+        partes = urlsplit(url)
+        classe = http.client.HTTPSConnection if partes.scheme == 'https' else http.client.HTTPConnection
+        self.conexao = classe(partes.hostname, partes.port, timeout=args.timeout)
+        self.coletor = coletor
+        self.args = args
+        self.aleatorio = random.Random(semente)
+        self.cookies = {}
+        self.token = None
+
+    def requisicao(self, etapa, metodo, caminho, corpo=None):
+        """Executa e mede uma requisição; retorna (status, bytes) ou levanta ErroHttp"""
+        cabecalhos = {'Accept': 'application/json'}
+        if self.token:
+            cabecalhos['Authorization'] = f'Bearer {self.token}'
+        if self.cookies:
+            cabecalhos['Cookie'] = '; '.join(f'{nome}={valor}' for nome, valor in self.cookies.items())
+        dados = None
+        if corpo is not None:
+            dados = json.dumps(corpo).encode('utf-8')
+            cabecalhos['Content-Type'] = 'application/json'
+
+        inicio = time.perf_counter()
+        try:
+            try:
+                self.conexao.request(metodo, caminho, body=dados, headers=cabecalhos)
+                resposta = self.conexao.getresponse()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # Conexão keep-alive fechada pelo servidor durante a pausa: reconecta uma vez, como o navegador
+                self.conexao.close()
+                self.conexao.request(metodo, caminho, body=dados, headers=cabecalhos)
+                resposta = self.conexao.getresponse()
+            conteudo = resposta.read()
+        except (OSError, http.client.HTTPException) as e:
+            self.conexao.close()  # reconecta na próxima requisição
+            self.coletor.registrar(etapa, time.perf_counter() - inicio, 0, repr(e))
+            raise ErroHttp(f'{etapa}: {e!r}') from e
+        duracao = time.perf_counter() - inicio
+
+        for valor in resposta.headers.get_all('Set-Cookie') or ():
+            nome, _, resto = valor.partition('=')
+            self.cookies[nome.strip()] = resto.split(';', 1)[0]
+        erro = None
+        if resposta.status >= 400:
+            erro = f'{resposta.status} {conteudo[:200].decode("utf-8", "replace")}'
+        self.coletor.registrar(etapa, duracao, len(conteudo), erro)
+        if erro:
+            raise ErroHttp(f'{etapa}: {erro}')
+        return resposta.status, conteudo
+
+    def json(self, etapa, metodo, caminho, corpo=None):
+        return json.loads(self.requisicao(etapa, metodo, caminho, corpo)[1] or b'null')
+
+    def pausa(self):
+        if self.args.pausa:
+            time.sleep(self.aleatorio.uniform(0.5, 1.5) * self.args.pausa / 1000)
+
+    # Etapas comuns
+
+    def entrar(self):
+        self.cookies.clear()
+        self.token = None
+        resposta = self.json('login', 'POST', '/api/auth/login',
+                             {'usuario': self.args.login, 'senha': self.args.senha})
+        self.token = resposta['access_token']
+        self.requisicao('auth_me', 'GET', '/api/auth/me')
+        self.requisicao('auth_permissoes', 'GET', '/api/auth/me/permissoes')
+        self.pausa()
+
+    def sair(self):
+        self.requisicao('logout', 'POST', '/api/auth/logout')
+
+    # Fluxos
+
+    def turno(self):
+        self.entrar()
+        if self.args.dashboard == 'legado':
+            for caminho in DASHBOARD_LEGADO:
+                self.requisicao('dashboard_legado' + caminho.replace('/api/', '_'), 'GET', caminho)
+        else:
+            self.requisicao('dashboard', 'GET', '/api/dashboard/stats')
+        self.pausa()
+
+        self.requisicao('socios_lista', 'GET', '/api/socios')
+        self.pausa()
+        termo = self.aleatorio.choice(TERMOS_BUSCA)
+        encontrados = self.json('socios_busca', 'GET', f'/api/socios/search?q={quote(termo)}&limit=20')
+        self.pausa()
+        if encontrados:
+            id_socio = self.aleatorio.choice(encontrados)['id']
+            socio = self.json('socios_detalhe', 'GET', f'/api/socios/{id_socio}')
+            self.pausa()
+            if not self.args.sem_escrita:
+                # O formulário reenvia o cadastro completo
+                socio['observacao'] = f'Revisado em {time.strftime("%d/%m/%Y %H:%M")}'
+                socio.pop('id', None)
+                self.requisicao('socios_editar', 'PUT', f'/api/socios/{id_socio}', socio)
+                self.pausa()
+        self.sair()
+
+    def relatorios(self):
+        self.entrar()
+        self.requisicao('relatorio_ativos', 'GET', '/api/relatorios/socios-ativos-por-empresa?semEmpresa=0')
+        self.pausa()
+        self.requisicao('socios_export_csv', 'GET', '/api/socios/export?format=csv&status=ATIVO')
+        self.pausa()
+        self.requisicao('empresas_export_xlsx', 'GET', '/api/empresas/export?format=xlsx')
+        self.sair()
+
+    def consulta(self):
+        self.requisicao('dashboard', 'GET', '/api/dashboard/stats')
+        self.pausa()
+        caminho = '/api/socios?limit=50&ordem=nome'
+        for _ in range(3):
+            pagina = self.json('socios_pagina', 'GET', caminho)
+            self.pausa()
+            if not pagina['next_cursor']:
+                break
+            caminho = f'/api/socios?limit=50&ordem=nome&cursor={quote(pagina["next_cursor"])}'
+        termo = self.aleatorio.choice(TERMOS_BUSCA)
+        self.requisicao('socios_busca', 'GET', f'/api/socios/search?q={quote(termo)}&limit=20')
+        self.pausa()
+        self.requisicao('socios_ativos_stream', 'GET', '/api/socios?status=ATIVO&fields=nome,matricula,razaoSocial&stream=1')
+        self.pausa()
+        self.requisicao('empresas_lista', 'GET', '/api/empresas')
+
+
+def ler_mix(texto):
+    """'turno=8,relatorios=1' -> ([fluxos], [pesos])"""
+    fluxos, pesos = [], []
+    for parte in texto.split(','):
+        nome, _, peso = parte.partition('=')
+        nome = nome.strip()
+        if nome not in FLUXOS:
+            raise argparse.ArgumentTypeError(f'fluxo desconhecido: {nome} (use {", ".join(FLUXOS)})')
+        fluxos.append(nome)
+        pesos.append(float(peso or 1))
+    return fluxos, pesos
+
+
+def executar_usuario(indice, args, coletor, contagem, fim, parar):
+    time.sleep(args.rampa * indice / max(args.usuarios, 1))
+    usuario = UsuarioVirtual(args.url, coletor, args, semente=args.semente + indice)
+    fluxos, pesos = args.mix
+    feitos = 0
+    while not parar.is_set() and time.monotonic() < fim and (not args.fluxos or feitos < args.fluxos):
+        fluxo = usuario.aleatorio.choices(fluxos, pesos)[0]
+        inicio = time.perf_counter()
+        try:
+            getattr(usuario, fluxo)()
+            coletor.registrar(f'fluxo_{fluxo}', time.perf_counter() - inicio, 0)
+        except (ErroHttp, ValueError, KeyError) as e:
+            # Fluxo interrompido: a etapa que falhou já foi contada
+            coletor.registrar(f'fluxo_{fluxo}', time.perf_counter() - inicio, 0, str(e))
+        feitos += 1
+    contagem[indice] = feitos
+
+
+def resumir(coletor, duracao):
+    resultados = {}
+    for etapa, tempos in sorted(coletor.tempos.items()):
+        n = len(tempos)
+        resultados[etapa] = dict(
+            estatisticas.resumo(tempos),
+            porSegundo=round(n / duracao, 2),
+            erros=coletor.erros[etapa],
+            taxaErro=round(coletor.erros[etapa] / n, 4),
+            bytesMedio=int(coletor.bytes[etapa] / n),
+        )
+    return resultados
+
+
+def imprimir(resultados, duracao):
+    print(f'\n{"etapa":<32} {"n":>7} {"req/s":>8} {"p50 ms":>9} {"p95 ms":>9} {"p99 ms":>9} {"erros":>7}')
+    for etapa, r in resultados.items():
+        print(f'{etapa:<32} {r["n"]:>7} {r["porSegundo"]:>8.2f} {r["p50Ms"]:>9.1f} {r["p95Ms"]:>9.1f} '
+              f'{r["p99Ms"]:>9.1f} {r["taxaErro"]:>7.1%}')
+    requisicoes = sum(r['n'] for etapa, r in resultados.items() if not etapa.startswith('fluxo_'))
+    print(f'\n{requisicoes} requisições em {duracao:.1f} s ({requisicoes / duracao:.1f} req/s)')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--url', default='http://127.0.0.1:5000', help='instância da API')
+    parser.add_argument('--usuarios', type=int, default=10, help='usuários simultâneos')
+    parser.add_argument('--duracao', type=float, default=30, help='segundos de carga')
+    parser.add_argument('--fluxos', type=int, default=0, help='fluxos por usuário (0: até o fim da duração)')
+    parser.add_argument('--rampa', type=float, default=0, help='segundos para todos os usuários entrarem')
+    parser.add_argument('--pausa', type=float, default=0, help='pausa média entre etapas em ms (tempo de leitura)')
+    parser.add_argument('--mix', type=ler_mix, default=ler_mix(MIX_PADRAO), help=f'pesos dos fluxos ({MIX_PADRAO})')
+    parser.add_argument('--dashboard', choices=('stats', 'legado'), default='stats')
+    parser.add_argument('--sem-escrita', action='store_true', help='não edita sócios')
+    parser.add_argument('--login', default='Admin')
+    parser.add_argument('--senha', default='Sindplast')
+    parser.add_argument('--timeout', type=float, default=120)
+    parser.add_argument('--semente', type=int, default=1)
+    parser.add_argument('--comparar', help='JSON de uma execução anterior')
+    args = parser.parse_args()
+
+    coletor = Coletor()
+    parar = threading.Event()
+    contagem = [0] * args.usuarios
+    fim = time.monotonic() + args.duracao if not args.fluxos else float('inf')
+    threads = [threading.Thread(target=executar_usuario, args=(i, args, coletor, contagem, fim, parar), daemon=True)
+               for i in range(args.usuarios)]
+
+    print(f'{args.usuarios} usuários contra {args.url} '
+          f'({"%d fluxos cada" % args.fluxos if args.fluxos else "%.0f s" % args.duracao}, rampa {args.rampa:.0f} s)')
+    inicio = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    try:
+        for thread in threads:
+            thread.join()
+    except KeyboardInterrupt:
+        parar.set()
+        print('\nInterrompido: aguardando os fluxos em andamento...')
+        for thread in threads:
+            thread.join()
+    duracao = time.perf_counter() - inicio
+
+    resultados = resumir(coletor, duracao)
+    imprimir(resultados, duracao)
+    for etapa, exemplo in coletor.exemplos_erro.items():
+        print(f'  erro em {etapa}: {exemplo}')
+
+    dados = {
+        'metadados': estatisticas.metadados(
+            benchmark='carga', url=args.url, usuarios=args.usuarios, duracaoS=round(duracao, 2),
+            rampaS=args.rampa, pausaMs=args.pausa, dashboard=args.dashboard, escrita=not args.sem_escrita,
+            mix=dict(zip(*args.mix)), fluxosExecutados=sum(contagem)),
+        'resultados': resultados,
+    }
+    caminho = estatisticas.salvar('carga', dados)
+    print(f'\nResultados: {caminho}')
+
+    if args.comparar:
+        anterior = estatisticas.carregar(args.comparar)
+        if estatisticas.comparar(resultados, anterior['resultados'], metrica='p95Ms'):
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+"""
+Estatísticas e resultados dos benchmarks - SINDPLAST
+Resumo de amostras de tempo (percentis), gravação dos resultados em JSON
+(Benchmarks/resultados/) com os metadados da execução e comparação entre
+duas execuções para apontar regressões.
+"""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+from datetime import datetime
+
+DIR_RESULTADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados')
+
+# Variação do p50 a partir da qual a comparação marca regressão/melhora
+LIMITE_VARIACAO = 0.10
+
+
+def percentil(ordenados, fracao):
+    """Percentil por interpolação linear de uma lista já ordenada"""
+    if not ordenados:
+        return None
+    posicao = (len(ordenados) - 1) * fracao
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+def resumo(tempos):
+    """Resumo em milissegundos de uma lista de durações em segundos"""
+    ordenados = sorted(tempos)
+    if not ordenados:
+        return {'n': 0}
+
+    def ms(valor):
+        return round(valor * 1000, 3)
+
+    return {
+        'n': len(ordenados),
+        'minMs': ms(ordenados[0]),
+        'p50Ms': ms(percentil(ordenados, 0.50)),
+        'p95Ms': ms(percentil(ordenados, 0.95)),
+        'p99Ms': ms(percentil(ordenados, 0.99)),
+        'maxMs': ms(ordenados[-1]),
+        'mediaMs': ms(sum(ordenados) / len(ordenados)),
+    }
+
+
+def _commit_git():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), timeout=10).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def metadados(**extras):
+    dados = {
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'commit': _commit_git(),
+        'python': platform.python_version(),
+        'plataforma': platform.platform(),
+        'cpus': os.cpu_count(),
+    }
+    dados.update(extras)
+    return dados
+
+
+def salvar(nome, dados, diretorio=DIR_RESULTADOS):
+    """Grava dados em diretorio/<nome>_<data>.json e retorna o caminho"""
+    os.makedirs(diretorio, exist_ok=True)
+    caminho = os.path.join(diretorio, f'{nome}_{datetime.now():%Y%m%d_%H%M%S}.json')
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        json.dump(dados, arquivo, ensure_ascii=False, indent=2)
+    return caminho
+
+
+def comparar(atual, anterior, limite=LIMITE_VARIACAO, metrica='p50Ms', saida=sys.stdout):
+    """
+    Imprime a variação de metrica por caso entre duas execuções (dicionários
+    'resultados' dos JSON). Retorna a lista de casos que pioraram além do limite.
+    """
+    regressoes = []
+    print(f'\n{"caso":<42} {"anterior":>10} {"atual":>10} {"variação":>9}', file=saida)
+    for caso in sorted(set(atual) | set(anterior)):
+        novo = (atual.get(caso) or {}).get(metrica)
+        velho = (anterior.get(caso) or {}).get(metrica)
+        if novo is None or velho is None:
+            print(f'{caso:<42} {velho if velho is not None else "-":>10} '
+                  f'{novo if novo is not None else "-":>10} {"":>9}', file=saida)
+            continue
+        variacao = (novo - velho) / velho if velho else 0.0
+        marca = ''
+        if variacao > limite:
+            marca = '  ▲ regressão'
+            regressoes.append(caso)
+        elif variacao < -limite:
+            marca = '  ▼ melhora'
+        print(f'{caso:<42} {velho:>10.2f} {novo:>10.2f} {variacao:>+8.1%}{marca}', file=saida)
+    return regressoes
+
+
+def carregar(caminho):
+    with open(caminho, encoding='utf-8') as arquivo:
+        return json.load(arquivo)
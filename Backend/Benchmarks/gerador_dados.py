@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Gerador de dados sintéticos - SINDPLAST
+Gera empresas e sócios realistas (nomes com acentos, CPF/CNPJ com dígitos
+verificadores válidos, datas, status, distribuição desigual de sócios por
+empresa) de forma reproduzível (semente fixa), em duas formas:
+
+    legado  Data/Empresas.json e Data/Socios.json no formato do sistema antigo
+            (entrada dos scripts de migração)
+    banco   linhas nas tabelas Empresas/Socios (a mesma forma que a migração
+            produz, mais CPF e celular), no banco de DATABASE_URL ou --banco
+
+Escalas: 10k, 100k e 1m sócios (ou --escala N); empresas = sócios / 250
+(mínimo 50).
+
+Uso:
+    python Benchmarks/gerador_dados.py --escala 100k --banco sqlite:///Benchmarks/dados/bench_100k.db
+    python Benchmarks/gerador_dados.py --escala 1m --legado Benchmarks/dados/legado_1m
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import date, datetime, timedelta
+
+DIR_BACKEND = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, DIR_BACKEND)
+sys.path.insert(0, os.path.join(DIR_BACKEND, 'Scripts'))
+
+from transformacao import transformar_empresa, transformar_socio  # noqa: E402
+
+ESCALAS = {'10k': 10_000, '100k': 100_000, '1m': 1_000_000}
+SEMENTE = 20240501
+LINHAS_POR_INSERT = 5000
+DIR_DADOS = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'dados')
+
+PRENOMES = [
+    'JOSÉ', 'MARIA', 'ANTÔNIO', 'FRANCISCA', 'JOÃO', 'ANA', 'FRANCISCO', 'ANTÔNIA', 'CARLOS',
+    'ADRIANA', 'PAULO', 'JULIANA', 'PEDRO', 'MÁRCIA', 'LUCAS', 'FERNANDA', 'LUIZ', 'PATRÍCIA',
+    'MARCOS', 'ALINE', 'LUÍS', 'SANDRA', 'GABRIEL', 'CAMILA', 'RAFAEL', 'AMANDA', 'RAIMUNDO',
+    'BRUNA', 'DANIEL', 'JÉSSICA', 'MARCELO', 'LETÍCIA', 'BRUNO', 'JÚLIA', 'EDUARDO', 'LUCIANA',
+    'FELIPE', 'VANESSA', 'RODRIGO', 'MARIANA', 'CLÁUDIO', 'CONCEIÇÃO', 'SEBASTIÃO', 'LÚCIA',
+    'ÉDSON', 'IRACEMA', 'JOSUÉ', 'GLÓRIA', 'ÍTALO', 'ÂNGELA', 'ÁLVARO', 'CÉLIA', 'OTÁVIO',
+]
+SOBRENOMES = [
+    'SILVA', 'SANTOS', 'OLIVEIRA', 'SOUZA', 'RODRIGUES', 'FERREIRA', 'ALVES', 'PEREIRA', 'LIMA',
+    'GOMES', 'COSTA', 'RIBEIRO', 'MARTINS', 'CARVALHO', 'ALMEIDA', 'LOPES', 'SOARES', 'FERNANDES',
+    'VIEIRA', 'BARBOSA', 'ROCHA', 'DIAS', 'NASCIMENTO', 'ANDRADE', 'MOREIRA', 'NUNES', 'MARQUES',
+    'MACHADO', 'MENDES', 'FREITAS', 'CARDOSO', 'RAMOS', 'GONÇALVES', 'SANTANA', 'TEIXEIRA',
+    'DE JESUS', 'DA CONCEIÇÃO', 'DE ARAÚJO', 'BRAGA', 'DO NASCIMENTO', 'CAVALCANTE', 'MONTEIRO',
+]
+BAIRROS = [
+    'DISTRITO INDUSTRIAL', 'FLORES', 'CIDADE NOVA', 'JORGE TEIXEIRA', 'COMPENSA', 'SÃO JOSÉ OPERÁRIO',
+    'ALEIXO', 'ADRIANÓPOLIS', 'CENTRO', 'JAPIIM', 'COROADO', 'ZUMBI DOS PALMARES', 'ARMANDO MENDES',
+    'TARUMÃ', 'PETRÓPOLIS', 'SANTA ETELVINA', 'NOVO ALEIXO', 'MAUAZINHO', 'COLÔNIA OLIVEIRA MACHADO',
+]
+LOGRADOUROS = ['RUA', 'AV.', 'TRAVESSA', 'BECO', 'ALAMEDA', 'R.']
+RUAS = ['JAVARI', 'TORQUATO TAPAJÓS', 'CUPIÚBA', 'BURITI', 'DJALMA BATISTA', 'GRANDE CIRCULAR',
+        'AUTAZ MIRIM', 'RODRIGO OTÁVIO', 'BUFFON', 'CONSTANTINO NERY', 'MANAQUIRI', 'SÃO JOÃO']
+CIDADES = ['MANAUS/AM'] * 18 + ['ITACOATIARA/AM', 'MANACAPURU/AM']
+FUNCOES = ['OPERADOR DE MÁQUINA', 'AUXILIAR DE PRODUÇÃO', 'INSPETOR DE QUALIDADE', 'ALMOXARIFE',
+           'MECÂNICO', 'ELETRICISTA', 'OPERADOR DE EMPILHADEIRA', 'AUXILIAR ADMINISTRATIVO',
+           'LÍDER DE PRODUÇÃO', 'MONTADOR', 'PREPARADOR DE MÁQUINAS', 'AUXILIAR DE SERVIÇOS GERAIS']
+ESTADOS_CIVIS = ['SOLTEIRO(A)'] * 5 + ['CASADO(A)'] * 4 + ['DIVORCIADO(A)', 'VIÚVO(A)', 'UNIÃO ESTÁVEL']
+NATURALIDADES = ['MANAUS'] * 10 + ['PARINTINS', 'ITACOATIARA', 'BELÉM', 'TEFÉ', 'COARI', 'SANTARÉM']
+SUFIXOS_EMPRESA = ['LTDA', 'S/A', 'EIRELI', 'IND. E COM. LTDA', 'DA AMAZÔNIA LTDA']
+RAMOS_EMPRESA = ['PLÁSTICOS', 'EMBALAGENS', 'INJETADOS', 'TERMOPLÁSTICOS', 'POLÍMEROS', 'COMPONENTES',
+                 'DESCARTÁVEIS', 'FILMES', 'TUBOS E CONEXÕES', 'ISOPOR']
+MOTIVOS_DEMISSAO = ['PEDIDO DE DEMISSÃO', 'DISPENSA SEM JUSTA CAUSA', 'TÉRMINO DE CONTRATO', 'APOSENTADORIA']
+
+
+def escala_socios(valor):
+    return ESCALAS.get(str(valor).lower()) or int(valor)
+
+
+def total_empresas(socios):
+    return max(50, socios // 250)
+
+
+def _dv(numeros, pesos):
+    resto = sum(n * p for n, p in zip(numeros, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def gerar_cpf(aleatorio):
+    numeros = [aleatorio.randint(0, 9) for _ in range(9)]
+    numeros.append(_dv(numeros, range(10, 1, -1)))
+    numeros.append(_dv(numeros, range(11, 1, -1)))
+    return ''.join(map(str, numeros))
+
+
+def gerar_cnpj(aleatorio):
+    numeros = [aleatorio.randint(0, 9) for _ in range(8)] + [0, 0, 0, 1]
+    numeros.append(_dv(numeros, (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)))
+    numeros.append(_dv(numeros, (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)))
+    return ''.join(map(str, numeros))
+
+
+def _data_legado(valor):
+    return f'{valor.isoformat()}T04:00:00.000Z'
+
+
+def _data_aleatoria(aleatorio, inicio, fim):
+    return inicio + timedelta(days=aleatorio.randint(0, (fim - inicio).days))
+
+
+def _nome(aleatorio):
+    partes = [aleatorio.choice(PRENOMES)]
+    if aleatorio.random() < 0.4:
+        partes.append(aleatorio.choice(PRENOMES))
+    partes += aleatorio.sample(SOBRENOMES, aleatorio.choice((1, 2, 2, 3)))
+    return ' '.join(partes)
+
+
+def gerar_empresas_legado(quantidade, semente=SEMENTE):
+    """Empresas no formato do JSON legado (códigos ECODIG 1..quantidade)"""
+    aleatorio = random.Random(semente)
+    for codigo in range(1, quantidade + 1):
+        cnpj = gerar_cnpj(aleatorio)
+        yield {
+            'ECODIG': codigo,
+            'ENOME': (f'{aleatorio.choice(SOBRENOMES)} {aleatorio.choice(RAMOS_EMPRESA)} '
+                      f'{aleatorio.choice(SUFIXOS_EMPRESA)}'),
+            # Metade com máscara, como no arquivo original
+            'ECGC': cnpj if codigo % 2 else f'{cnpj[:2]}.{cnpj[2:5]}.{cnpj[5:8]}/{cnpj[8:12]}-{cnpj[12:]}',
+            'ENFUNC': float(aleatorio.randint(5, 900)),
+            'EFONE1': aleatorio.randint(30000000, 39999999),
+            'EFONE2': aleatorio.choice((None, aleatorio.randint(30000000, 39999999))),
+            'EFAX': aleatorio.choice((None, None, aleatorio.randint(926000000, 926999999))),
+            'EEND': f'{aleatorio.choice(LOGRADOUROS)} {aleatorio.choice(RUAS)}, {aleatorio.randint(1, 3000)}',
+            'EBAIRRO': aleatorio.choice(BAIRROS),
+            'ECID': aleatorio.choice(CIDADES),
+            'ECEP': str(aleatorio.randint(69000000, 69099999)),
+            'EESTADO': 'AM',
+            'EOBS': None,
+            'EDTCON': _data_legado(_data_aleatoria(aleatorio, date(1995, 1, 1), date(2020, 12, 31))),
+            'EVALOR': round(aleatorio.choice((0.0, aleatorio.uniform(100, 5000))), 4),
+        }
+
+
+def gerar_socios_legado(quantidade, n_empresas, semente=SEMENTE):
+    """Sócios no formato do JSON legado; poucas empresas concentram muitos sócios"""
+    aleatorio = random.Random(semente + 1)
+    pesos = [1 / (posicao ** 0.8) for posicao in range(1, n_empresas + 1)]
+    codigos = aleatorio.choices(range(1, n_empresas + 1), weights=pesos, k=quantidade)
+    for i, codigo in enumerate(codigos, 1):
+        admissao = _data_aleatoria(aleatorio, date(1990, 1, 1), date(2024, 6, 30))
+        ativo = aleatorio.random() < 0.7
+        demissao = None if ativo else admissao + timedelta(days=aleatorio.randint(30, 3000))
+        yield {
+            'SMAT': str(i),
+            'SNOME': _nome(aleatorio),
+            'SIDENT': str(aleatorio.randint(1000000, 39999999)),
+            'SDNASC': _data_legado(_data_aleatoria(aleatorio, date(1950, 1, 1), date(2005, 12, 31))),
+            'SNATURAL': aleatorio.choice(NATURALIDADES),
+            'SSEXO': aleatorio.choice(('MASCULINO', 'FEMININO')),
+            'SESTCIVIL': aleatorio.choice(ESTADOS_CIVIS),
+            'SEND': f'{aleatorio.choice(LOGRADOUROS)} {aleatorio.choice(RUAS)}, {aleatorio.randint(1, 3000)}',
+            'SBAIRRO': aleatorio.choice(BAIRROS),
+            'SCEP': str(aleatorio.randint(69000000, 69099999)),
+            'SPAI': _nome(aleatorio) if aleatorio.random() < 0.8 else None,
+            'SMAE': _nome(aleatorio),
+            'SDTC': _data_legado(admissao + timedelta(days=aleatorio.randint(0, 90))),
+            'SATIV': ativo,
+            'SDATMEN': _data_legado(admissao + timedelta(days=30)),
+            'SVALORME': aleatorio.choice((25.0, 30.0, 35.5)),
+            'SDTADMS': admissao.isoformat(),
+            'SCTPS': str(aleatorio.randint(100000, 9999999)),
+            'SFUNCAO': aleatorio.choice(FUNCOES),
+            'ECODIG': codigo,
+            'SDTDEM': _data_legado(demissao) if demissao else None,
+            'SMOTDEM': aleatorio.choice(MOTIVOS_DEMISSAO) if demissao else None,
+            'SCARTA': aleatorio.random() < 0.5,
+            'SCARTEIRA': aleatorio.random() < 0.8,
+            'SFICHA': aleatorio.random() < 0.9,
+            'SOBS': None,
+            'SFONE': f'92{aleatorio.randint(30000000, 99999999)}',
+        }
+
+
+def escrever_json_legado(caminho, chave, registros):
+    """Grava {"chave": [...]} registro a registro (sem montar a lista em memória)"""
+    total = 0
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        arquivo.write('{\n"%s": [\n' % chave)
+        for registro in registros:
+            if total:
+                arquivo.write(',\n')
+            arquivo.write(json.dumps(registro, ensure_ascii=False))
+            total += 1
+        arquivo.write('\n]\n}\n')
+    return total
+
+
+def gerar_legado(diretorio, socios, semente=SEMENTE):
+    """Escreve Empresas.json e Socios.json em diretorio; retorna os caminhos"""
+    os.makedirs(diretorio, exist_ok=True)
+    n_empresas = total_empresas(socios)
+    caminho_empresas = os.path.join(diretorio, 'Empresas.json')
+    caminho_socios = os.path.join(diretorio, 'Socios.json')
+    escrever_json_legado(caminho_empresas, 'Empresa', gerar_empresas_legado(n_empresas, semente))
+    escrever_json_legado(caminho_socios, 'Socio', gerar_socios_legado(socios, n_empresas, semente))
+    return caminho_empresas, caminho_socios
+
+
+def _linhas_socios(socios, n_empresas, empresas_json, semente):
+    """Sócios já no formato das colunas, como a migração grava, mais CPF e celular"""
+    aleatorio = random.Random(semente + 2)
+    for socio_json in gerar_socios_legado(socios, n_empresas, semente):
+        linha = transformar_socio(socio_json, empresas_json)
+        linha['CPF'] = gerar_cpf(aleatorio)
+        linha['Celular'] = f'9{aleatorio.randint(80000000, 99999999)}'
+        linha['Rede Social'] = linha.pop('RedeSocial')
+        yield linha
+
+
+def _inserir(conn, tabela, linhas):
+    total = 0
+    lote = []
+    for linha in linhas:
+        lote.append(linha)
+        if len(lote) >= LINHAS_POR_INSERT:
+            conn.execute(tabela.insert(), lote)
+            total += len(lote)
+            lote = []
+    if lote:
+        conn.execute(tabela.insert(), lote)
+        total += len(lote)
+    return total
+
+
+def popular_banco(url, socios, semente=SEMENTE, limpar=True):
+    """
+    Cria schema e tabelas (se preciso) e insere empresas e sócios em url.
+    Retorna (empresas, socios) inseridos.
+    """
+    from banco import criar_engine
+    from models import Empresa, Socio, inicializar_banco
+
+    n_empresas = total_empresas(socios)
+    empresas_json = {str(e['ECODIG']): e for e in gerar_empresas_legado(n_empresas, semente)}
+    data_cadastro = datetime(2024, 1, 1)
+    tabela_empresas = Empresa.__table__
+    tabela_socios = Socio.__table__
+    engine = criar_engine(url)
+    inicializar_banco(engine)
+    with engine.begin() as conn:
+        if limpar:
+            conn.execute(tabela_socios.delete())
+            conn.execute(tabela_empresas.delete())
+        total_e = _inserir(conn, tabela_empresas,
+                           (transformar_empresa(e, data_cadastro) for e in empresas_json.values()))
+        total_s = _inserir(conn, tabela_socios,
+                           _linhas_socios(socios, n_empresas, empresas_json, semente))
+    engine.dispose()
+    return total_e, total_s
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--escala', default='10k', help='10k, 100k, 1m ou um número de sócios')
+    parser.add_argument('--banco', help='URL do banco a popular (padrão: SQLite em Benchmarks/dados)')
+    parser.add_argument('--legado', help='diretório para Empresas.json/Socios.json no formato legado')
+    parser.add_argument('--sem-banco', action='store_true', help='gera apenas o formato legado')
+    parser.add_argument('--semente', type=int, default=SEMENTE)
+    args = parser.parse_args()
+
+    socios = escala_socios(args.escala)
+    if args.legado:
+        inicio = time.perf_counter()
+        caminhos = gerar_legado(args.legado, socios, args.semente)
+        print(f'Legado: {", ".join(caminhos)} em {time.perf_counter() - inicio:.1f} s')
+    if not args.sem_banco:
+        os.makedirs(DIR_DADOS, exist_ok=True)
+        url = args.banco or f'sqlite:///{os.path.join(DIR_DADOS, f"bench_{args.escala}.db")}'
+        inicio = time.perf_counter()
+        total_e, total_s = popular_banco(url, socios, args.semente)
+        print(f'Banco {url}: {total_e} empresas, {total_s} sócios em {time.perf_counter() - inicio:.1f} s')
+
+
+if __name__ == '__main__':
+    main()
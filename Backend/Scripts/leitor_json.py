@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Leitura incremental dos arquivos JSON legados - SINDPLAST
+Percorre o array de {"Socio": [...]} / {"Empresa": [...]} um registro por vez,
+lendo o arquivo em blocos, para que a memória não cresça com o tamanho do arquivo.
+"""
+
+import json
+
+TAMANHO_BLOCO = 64 * 1024
+
+_ESPACOS = ' \t\n\r'
+
+
+class _Leitor:
+    """Buffer de texto sobre o arquivo, com leitura sob demanda"""
+
+    def __init__(self, arquivo, tamanho_bloco):
+        self.arquivo = arquivo
+        self.tamanho_bloco = tamanho_bloco
+        self.buffer = ''
+        self.pos = 0
+        self.fim = False
+
+    def ler_mais(self):
+        if self.fim:
+            return False
+        bloco = self.arquivo.read(self.tamanho_bloco)
+        if not bloco:
+            self.fim = True
+            return False
+        # Descarta o que já foi consumido antes de crescer o buffer
+        if self.pos:
+            self.buffer = self.buffer[self.pos:]
+            self.pos = 0
+        self.buffer += bloco
+        return True
+
+    def proximo_caractere(self, ignorar=_ESPACOS):
+        """Avança sobre os caracteres ignorados e retorna o próximo (sem consumi-lo)"""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in ignorar:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self.ler_mais():
+                return None
+
+    def esperar(self, caractere):
+        atual = self.proximo_caractere()
+        if atual != caractere:
+            raise ValueError(f'JSON inesperado: esperado {caractere!r}, encontrado {atual!r}')
+        self.pos += 1
+
+    def decodificar_valor(self, decoder):
+        """Decodifica o próximo valor JSON completo, lendo mais blocos se necessário"""
+        self.proximo_caractere()
+        while True:
+            try:
+                valor, fim = decoder.raw_decode(self.buffer, self.pos)
+                # Um valor que termina exatamente no fim do buffer pode estar
+                # incompleto (ex.: número cortado ao meio)
+                if fim < len(self.buffer) or self.fim or not self.ler_mais():
+                    self.pos = fim
+                    return valor
+            except json.JSONDecodeError:
+                if not self.ler_mais():
+                    raise
+
+
+def iterar_registros(caminho, chave, tamanho_bloco=TAMANHO_BLOCO, encoding='utf-8'):
+    """Gera os itens do array em objeto[chave], um de cada vez"""
+    decoder = json.JSONDecoder()
+    with open(caminho, 'r', encoding=encoding) as arquivo:
+        leitor = _Leitor(arquivo, tamanho_bloco)
+        leitor.esperar('{')
+        while True:
+            atual = leitor.proximo_caractere()
+            if atual == '}' or atual is None:
+                return
+            if atual == ',':
+                leitor.pos += 1
+                continue
+            nome = leitor.decodificar_valor(decoder)
+            leitor.esperar(':')
+            if nome != chave:
+                leitor.decodificar_valor(decoder)
+                continue
+
+            leitor.esperar('[')
+            while True:
+                atual = leitor.proximo_caractere(_ESPACOS + ',')
+                if atual == ']':
+                    leitor.pos += 1
+                    break
+                if atual is None:
+                    raise ValueError(f'Arquivo terminou dentro do array {chave!r}')
+                yield leitor.decodificar_valor(decoder)
+
+
+def em_lotes(registros, tamanho):
+    """Agrupa um iterável em listas de até `tamanho` itens"""
+    lote = []
+    for registro in registros:
+        lote.append(registro)
+        if len(lote) >= tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Normalização dos registros legados - SINDPLAST
+Transformação dos registros das migrações de empresas e sócios e um pipeline
+que a aplica em blocos num pool de processos, devolvendo os blocos na mesma
+ordem da entrada. CNPJ, telefone e CEP usam o módulo normalizacao.py do
+Backend, o mesmo da API.
+"""
+
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from leitor_json import em_lotes  # noqa: E402
+from normalizacao import formatar_celular, formatar_cep, formatar_cnpj, formatar_telefone  # noqa: E402,F401
+
+TAMANHO_BLOCO = 2000
+
+
+def extrair_cidade_uf(cidade_uf):
+    """Extrai cidade e UF do campo ECID ("MANAUS/AM" ou "MANAUS")"""
+    if not cidade_uf:
+        return None, None
+    cidade_uf = cidade_uf.strip()
+    if '/' in cidade_uf:
+        partes = cidade_uf.split('/')
+        cidade = partes[0].strip()
+        uf = partes[1].strip() if len(partes) > 1 else None
+    else:
+        cidade = cidade_uf
+        uf = None
+    return cidade, uf
+
+
+def converter_data(data_string):
+    """Converte '2001-02-03' ou '2001-02-03T04:00:00.000Z' para datetime"""
+    if not data_string:
+        return None
+    try:
+        # Remove a parte de horário/timezone se existir
+        if 'T' in data_string:
+            data_string = data_string.split('T')[0]
+        return datetime.strptime(data_string, '%Y-%m-%d')
+    except (TypeError, ValueError):
+        return None
+
+
+def transformar_empresa(empresa_json, data_cadastro=None):
+    """Converte um registro do JSON legado no dicionário de colunas da tabela Empresas"""
+    cidade, uf = extrair_cidade_uf(empresa_json.get('ECID'))
+    n_funcionarios = empresa_json.get('ENFUNC')
+    valor = empresa_json.get('EVALOR')
+    try:
+        valor_contribuicao = Decimal(str(valor)) if valor is not None else None
+    except (InvalidOperation, TypeError):
+        valor_contribuicao = None
+
+    return {
+        'CodEmpresa': str(empresa_json.get('ECODIG', '')),
+        'CNPJ': formatar_cnpj(empresa_json.get('ECGC')),
+        'RazaoSocial': empresa_json.get('ENOME'),
+        'NomeFantasia': empresa_json.get('ENOME'),  # Mesmo valor da razão social
+        'Endereco': empresa_json.get('EEND'),
+        'Numero': None,  # Não disponível no JSON
+        'Complemento': None,  # Não disponível no JSON
+        'Bairro': empresa_json.get('EBAIRRO'),
+        'CEP': formatar_cep(empresa_json.get('ECEP')),
+        'Cidade': cidade,
+        'UF': uf,
+        'Telefone01': formatar_telefone(empresa_json.get('EFONE1')),
+        'Telefone02': formatar_telefone(empresa_json.get('EFONE2')),
+        'Fax': formatar_telefone(empresa_json.get('EFAX')),
+        'Celular': None,  # Não disponível no JSON
+        'WhatsApp': None,  # Não disponível no JSON
+        'Instagram': None,  # Não disponível no JSON
+        'Linkedin': None,  # Não disponível no JSON
+        'NFuncionarios': int(n_funcionarios) if n_funcionarios is not None else None,
+        'DataContribuicao': converter_data(empresa_json.get('EDTCON')),
+        'ValorContribuicao': valor_contribuicao,
+        'DataCadastro': data_cadastro or datetime.now(),
+        'Cadastrante': 'Sistema de Migração',
+        'Observacao': empresa_json.get('EOBS'),
+    }
+
+
+def transformar_socio(socio_json, empresas):
+    """Converte um registro do JSON legado no dicionário de colunas da tabela Socios"""
+    cod_empresa = str(socio_json.get('ECODIG', ''))
+    empresa = empresas.get(cod_empresa, {})
+    # Campos da empresa copiados para o sócio
+    cnpj_empresa = formatar_cnpj(empresa.get('ECGC')) if empresa else None
+    razao_empresa = empresa.get('ENOME') if empresa else None
+
+    return {
+        'Nome': socio_json.get('SNOME'),
+        'RG': socio_json.get('SIDENT'),
+        'Emissor': None,  # Não disponível no JSON
+        'CPF': None,  # Não disponível no JSON
+        'Nascimento': converter_data(socio_json.get('SDNASC')),
+        'Naturalidade': socio_json.get('SNATURAL'),
+        'NaturalidadeUF': None,  # Sempre NULL conforme orientação
+        'Nacionalidade': 'BRASILEIRO',
+        'Sexo': socio_json.get('SSEXO'),
+        'EstadoCivil': socio_json.get('SESTCIVIL'),
+        'Endereco': socio_json.get('SEND'),
+        'Complemento': None,  # Não disponível no JSON
+        'Bairro': socio_json.get('SBAIRRO'),
+        'CEP': formatar_cep(socio_json.get('SCEP')),
+        'Celular': None,  # Não disponível no JSON
+        'RedeSocial': None,  # Não disponível no JSON
+        'Pai': socio_json.get('SPAI'),
+        'Mae': socio_json.get('SMAE'),
+        'DataCadastro': converter_data(socio_json.get('SDTC')),
+        'Cadastrante': 'Sistema de Migração',
+        'Status': 'ATIVO' if socio_json.get('SATIV', True) else 'INATIVO',
+        'Matricula': socio_json.get('SMAT'),
+        'DataMensalidade': converter_data(socio_json.get('SDATMEN')),
+        'ValorMensalidade': socio_json.get('SVALORME'),
+        'DataAdmissao': converter_data(socio_json.get('SDTADMS')),
+        'CTPS': socio_json.get('SCTPS'),
+        'Funcao': socio_json.get('SFUNCAO'),
+        'CodEmpresa': cod_empresa,
+        'CNPJ': cnpj_empresa,
+        'RazaoSocial': razao_empresa,
+        'NomeFantasia': razao_empresa,
+        'DataDemissao': converter_data(socio_json.get('SDTDEM')),
+        'MotivoDemissao': socio_json.get('SMOTDEM'),
+        'Carta': bool(socio_json.get('SCARTA')),
+        'Carteira': bool(socio_json.get('SCARTEIRA')),
+        'Ficha': bool(socio_json.get('SFICHA')),
+        'Observacao': socio_json.get('SOBS'),
+        'Telefone': formatar_telefone(socio_json.get('SFONE')),
+    }
+
+
+def _aplicar_bloco(funcao, bloco):
+    return [funcao(item) for item in bloco]
+
+
+def transformar_em_blocos(itens, funcao, tamanho_bloco=TAMANHO_BLOCO, processos=None,
+                          inicializador=None, argumentos_inicializador=()):
+    """
+    Aplica funcao a cada item e gera listas de resultados, bloco a bloco, na
+    ordem da entrada. Com mais de um processo os blocos são transformados em
+    paralelo, com no máximo 2 blocos por processo em andamento para que a
+    memória continue limitada numa entrada lida incrementalmente.
+
+    funcao e inicializador precisam ser funções de módulo (serializáveis por pickle).
+    """
+    processos = processos or os.cpu_count() or 1
+    if processos <= 1:
+        if inicializador is not None:
+            inicializador(*argumentos_inicializador)
+        for bloco in em_lotes(itens, tamanho_bloco):
+            yield _aplicar_bloco(funcao, bloco)
+        return
+
+    pendentes = []
+    with ProcessPoolExecutor(max_workers=processos, initializer=inicializador,
+                             initargs=argumentos_inicializador) as executor:
+        for bloco in em_lotes(itens, tamanho_bloco):
+            pendentes.append(executor.submit(_aplicar_bloco, funcao, bloco))
+            # Entrega o bloco mais antigo antes de enfileirar demais
+            if len(pendentes) >= processos * 2:
+                yield pendentes.pop(0).result()
+        for futuro in pendentes:
+            yield futuro.result()
@@ -0,0 +1,298 @@
+"""
+API assíncrona de leitura - SINDPLAST
+Serve as rotas somente leitura mais concorridas (listagens de sócios e
+empresas, busca e estatísticas do dashboard) num único processo asyncio
+(Starlette + uvicorn). O PostgreSQL é acessado pelo asyncpg com o pool
+assíncrono do SQLAlchemy: uma consulta lenta suspende só a sua corrotina e
+quem espera por conexão livre não ocupa uma thread.
+
+Modelos, filtros, ?fields=, ordenações, cursores e serializadores são os do
+app.py/serializacao.py, com as mesmas respostas. Escritas, autenticação,
+exportações e as demais rotas continuam no app Flask; o proxy reverso
+encaminha para esta aplicação apenas os GET abaixo.
+
+Os caches (dashboard e índice de busca sem pg_trgm) são por processo e
+expiram por tempo, pois as escritas acontecem em outro processo.
+
+Uso:
+    pip install -r requirements-async.txt
+    uvicorn app_async:app --host 0.0.0.0 --port 5001
+"""
+
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from starlette.applications import Starlette
+from starlette.middleware import Middleware
+from starlette.middleware.cors import CORSMiddleware
+from starlette.responses import Response, StreamingResponse
+from starlette.routing import Route
+
+from app import (CONSULTA_INDICE_EMPRESAS, CONSULTA_INDICE_SOCIOS, ORDENACAO_SOCIOS, consulta_estatisticas_dashboard,
+                 filtros_empresas, filtros_socios, indice_empresas, indice_socios, resumir_estatisticas_dashboard)
+from banco import opcoes_engine_async, preparar_engine, url_assincrona, url_banco
+from busca import SQL_BUSCA_EMPRESAS, SQL_BUSCA_SOCIOS, TAMANHO_MINIMO_TERMO, buscar_postgres_async
+from busca import ler_limite as ler_limite_busca
+from models import Empresa, Socio
+from paginacao import (CursorInvalido, aplicar_keyset, codificar_cursor, decodificar_cursor, expressao_ordem,
+                       ler_limite)
+from serializacao import (CAMPOS_EMPRESA, CAMPOS_SOCIO, ORDENAR_CHAVES, CamposInvalidos, codificar_json,
+                          projecao_linhas)
+from streaming import LINHAS_POR_LOTE, parametro_ativo
+
+logger = logging.getLogger(__name__)
+
+
+def carregar_configuracao():
+    """Configuração padrão, lida do ambiente (mesmos nomes do app.py)"""
+    return {
+        'SQLALCHEMY_DATABASE_URI': url_banco(),
+        'DASHBOARD_CACHE_TTL': int(os.environ.get('DASHBOARD_CACHE_TTL', 30)),
+        # Tempo (segundos) de vida do índice de busca em Python (bancos sem pg_trgm)
+        'BUSCA_INDICE_TTL': int(os.environ.get('BUSCA_INDICE_TTL', 60)),
+    }
+
+
+class CacheTTL:
+    """
+    Valores recalculados no máximo uma vez a cada ttl segundos. Requisições
+    simultâneas aguardam o mesmo cálculo em vez de repeti-lo.
+    """
+
+    def __init__(self):
+        self._valores = {}
+        self._locks = defaultdict(asyncio.Lock)
+
+    async def obter(self, chave, ttl, calcular):
+        async with self._locks[chave]:
+            valor, expira_em = self._valores.get(chave, (None, 0.0))
+            if valor is None or time.monotonic() >= expira_em:
+                valor = await calcular()
+                self._valores[chave] = (valor, time.monotonic() + ttl)
+            return valor
+
+
+def resposta_json(obj, status=200, headers=None):
+    return Response(codificar_json(obj, ORDENAR_CHAVES), status_code=status, headers=headers,
+                    media_type='application/json')
+
+
+def erro(mensagem, status):
+    return resposta_json({'message': mensagem}, status)
+
+
+async def ler_lista(engine, stmt, serializar):
+    """Lê e serializa em lotes; o event loop atende outras requisições entre um lote e outro"""
+    itens = []
+    async with engine.connect() as conexao:
+        resultado = await conexao.stream(stmt.execution_options(yield_per=LINHAS_POR_LOTE))
+        async for lote in resultado.partitions():
+            itens.extend(serializar(linha) for linha in lote)
+    return itens
+
+
+async def gerar_json_array(engine, stmt, serializar):
+    """Versão assíncrona de streaming.gerar_json_array(), lendo de um cursor do servidor"""
+    async with engine.connect() as conexao:
+        resultado = await conexao.stream(stmt.execution_options(yield_per=LINHAS_POR_LOTE))
+        yield b'['
+        primeiro = True
+        try:
+            async for lote in resultado.partitions():
+                bloco = b','.join(codificar_json(serializar(linha), ORDENAR_CHAVES) for linha in lote)
+                yield bloco if primeiro else b',' + bloco
+                primeiro = False
+        except Exception:
+            # Status 200 já enviado: não fecha o array, para o cliente perceber a falha
+            logger.exception('Erro durante a resposta em streaming')
+            return
+        yield b']'
+
+
+def resposta_json_stream(engine, stmt, serializar):
+    return StreamingResponse(gerar_json_array(engine, stmt, serializar), media_type='application/json')
+
+
+# Rotas
+async def get_empresas(request):
+    args = request.query_params
+    try:
+        colunas, serializar = projecao_linhas(Empresa, CAMPOS_EMPRESA, args.get('fields'))
+    except CamposInvalidos as e:
+        return erro(str(e), 400)
+    engine = request.app.state.engine
+    stmt = select(*colunas).where(*filtros_empresas(args)).order_by(Empresa.IdEmpresa)
+    try:
+        if parametro_ativo(args.get('stream')):
+            return resposta_json_stream(engine, stmt, serializar)
+        return resposta_json(await ler_lista(engine, stmt, serializar))
+    except Exception as e:
+        return erro(f'Erro ao buscar empresas: {str(e)}', 500)
+
+
+async def get_socios(request):
+    args = request.query_params
+    engine = request.app.state.engine
+    try:
+        ordem = args.get('ordem', 'id')
+        descendente = ordem.startswith('-')
+        coluna = ORDENACAO_SOCIOS.get(ordem.lstrip('-'))
+        if coluna is None:
+            return erro(f'Ordenação inválida: {ordem}', 400)
+
+        colunas, serializar = projecao_linhas(Socio, CAMPOS_SOCIO, args.get('fields'), extras=[coluna])
+        stmt = select(*colunas).where(*filtros_socios(args))
+
+        # Sem limit/cursor mantém a resposta em lista (compatibilidade com o frontend)
+        if 'limit' not in args and 'cursor' not in args:
+            stmt = stmt.order_by(Socio.IdSocio)
+            if parametro_ativo(args.get('stream')):
+                return resposta_json_stream(engine, stmt, serializar)
+            return resposta_json(await ler_lista(engine, stmt, serializar))
+
+        limite = ler_limite(args.get('limit'))
+        cursor_valor = cursor_id = None
+        if args.get('cursor'):
+            cursor_valor, cursor_id = decodificar_cursor(args['cursor'], ordem)
+
+        expressao = expressao_ordem(coluna, Socio.IdSocio)
+        stmt = aplicar_keyset(stmt, expressao, Socio.IdSocio, cursor_valor, cursor_id, descendente)
+        # Busca um registro a mais para saber se existe próxima página
+        async with engine.connect() as conexao:
+            socios = (await conexao.execute(stmt.limit(limite + 1))).all()
+
+        next_cursor = None
+        if len(socios) > limite:
+            socios = socios[:limite]
+            ultimo = socios[-1]
+            valor = ultimo.IdSocio if coluna is Socio.IdSocio else (getattr(ultimo, coluna.key) or '')
+            next_cursor = codificar_cursor(ordem, valor, ultimo.IdSocio)
+
+        return resposta_json({
+            'items': [serializar(socio) for socio in socios],
+            'next_cursor': next_cursor,
+            'limit': limite
+        })
+    except (CursorInvalido, CamposInvalidos) as e:
+        return erro(str(e), 400)
+    except Exception as e:
+        return erro(f'Erro ao buscar sócios: {str(e)}', 500)
+
+
+async def executar_busca(request, recurso, sql, consulta_indice, montar_indice, campo_desempate):
+    args = request.query_params
+    termo = (args.get('q') or '').strip()
+    if len(termo) < TAMANHO_MINIMO_TERMO:
+        return erro(f'Informe ao menos {TAMANHO_MINIMO_TERMO} caracteres para a busca', 400)
+    limite = ler_limite_busca(args.get('limit'))
+    engine = request.app.state.engine
+
+    if engine.dialect.name == 'postgresql':
+        async with engine.connect() as conexao:
+            resultados = await buscar_postgres_async(conexao, sql, termo, limite)
+    else:
+        async def construir():
+            async with engine.connect() as conexao:
+                return montar_indice((await conexao.execute(consulta_indice)).all())
+
+        indice = await request.app.state.cache.obter(
+            recurso, request.app.state.config['BUSCA_INDICE_TTL'], construir)
+        resultados = indice.buscar(termo, limite, chave_desempate=lambda r: r.get(campo_desempate) or '')
+    return resposta_json(resultados)
+
+
+async def search_socios(request):
+    try:
+        return await executar_busca(request, 'socios', SQL_BUSCA_SOCIOS, CONSULTA_INDICE_SOCIOS,
+                                    indice_socios, 'nome')
+    except Exception as e:
+        return erro(f'Erro ao buscar sócios: {str(e)}', 500)
+
+
+async def search_empresas(request):
+    try:
+        return await executar_busca(request, 'empresas', SQL_BUSCA_EMPRESAS, CONSULTA_INDICE_EMPRESAS,
+                                    indice_empresas, 'razaoSocial')
+    except Exception as e:
+        return erro(f'Erro ao buscar empresas: {str(e)}', 500)
+
+
+async def get_dashboard_stats(request):
+    engine = request.app.state.engine
+    ttl = request.app.state.config['DASHBOARD_CACHE_TTL']
+
+    async def calcular():
+        async with engine.connect() as conexao:
+            return resumir_estatisticas_dashboard(await conexao.execute(consulta_estatisticas_dashboard()))
+
+    try:
+        dados = await request.app.state.cache.obter('dashboard', ttl, calcular)
+        return resposta_json(dados, headers={'Cache-Control': f'private, max-age={ttl}'})
+    except Exception as e:
+        return erro(f'Erro ao calcular estatísticas: {str(e)}', 500)
+
+
+async def get_status(request):
+    return resposta_json({
+        'status': 'online',
+        'name': 'SINDPLAST-AM API',
+        'version': '1.0.0',
+        'modo': 'async'
+    })
+
+
+ROTAS = [
+    Route('/api/socios', get_socios, methods=['GET']),
+    Route('/api/socios/search', search_socios, methods=['GET']),
+    Route('/api/empresas', get_empresas, methods=['GET']),
+    Route('/api/empresas/search', search_empresas, methods=['GET']),
+    Route('/api/dashboard/stats', get_dashboard_stats, methods=['GET']),
+    Route('/api/status', get_status, methods=['GET']),
+]
+
+
+def create_app(config=None):
+    """
+    Cria a aplicação; config (dicionário) sobrepõe a configuração do ambiente.
+    Como no app.py, nenhuma conexão é aberta antes da primeira requisição.
+    """
+    configuracao = carregar_configuracao()
+    if config:
+        configuracao.update(config)
+    url = configuracao['SQLALCHEMY_DATABASE_URI']
+    engine = create_async_engine(url_assincrona(url), **opcoes_engine_async(url))
+    preparar_engine(engine.sync_engine)
+
+    @asynccontextmanager
+    async def ciclo_de_vida(app):
+        yield
+        await engine.dispose()
+
+    app = Starlette(
+        routes=ROTAS,
+        # Mesmo CORS aberto do app Flask (frontend React)
+        middleware=[Middleware(CORSMiddleware, allow_origins=['*'], allow_methods=['GET'], allow_headers=['*'])],
+        lifespan=ciclo_de_vida,
+    )
+    app.state.config = configuracao
+    app.state.engine = engine
+    app.state.cache = CacheTTL()
+    return app
+
+
+# 'app' do módulo (uvicorn app_async:app) criado só no primeiro acesso
+_app = None
+
+def __getattr__(nome):
+    global _app
+    if nome != 'app':
+        raise AttributeError(f'module {__name__!r} has no attribute {nome!r}')
+    if _app is None:
+        _app = create_app()
+    return _app
@@ -3,8 +3,7 @@ from flask_jwt_extended import create_access_token, create_refresh_token, jwt_re
 from werkzeug.security import check_password_hash
 from datetime import timedelta
 import datetime
-from app import db
-from models import Usuario
+from models import Usuario, db
 
 auth_bp = Blueprint('auth', __name__)
 
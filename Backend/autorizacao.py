@@ -0,0 +1,167 @@
+"""
+Autorização por perfil - SINDPLAST
+Resolve as permissões efetivas de cada Perfil (Permissoes.Nome e Permissoes.Tela)
+uma única vez e as mantém em cache, para que cada verificação seja uma busca
+em conjunto. As rotas que alteram Perfil, Permissoes ou PerfilPermissao chamam
+cache_permissoes.invalidar(); o TTL limita a defasagem entre workers.
+
+O perfil do usuário não vem do token: é lido de Usuarios pelo id do JWT (ou
+da sessão) e guardado em perfis_usuarios, invalidado quando o usuário muda.
+
+As rotas de escrita usam requires_permission() com a chave da tela do
+frontend ('empresas', 'socios', 'usuarios', 'perfil', 'permissoes'),
+concedida por uma permissão com esse Nome ou essa Tela. O perfil
+PERFIL_ADMINISTRADOR (padrão 'Administrador', o do Admin criado por init-db)
+tem todas as permissões, para que as primeiras possam ser cadastradas.
+"""
+
+import threading
+import time
+from functools import wraps
+
+from flask import current_app, jsonify, session
+from flask_jwt_extended import get_jwt_identity, verify_jwt_in_request
+from flask_jwt_extended.exceptions import JWTExtendedException
+from jwt.exceptions import PyJWTError
+
+TTL_PADRAO = 60
+PERFIL_ADMINISTRADOR_PADRAO = 'Administrador'
+
+_VAZIO = frozenset()
+
+
+class PermissoesPerfil:
+    __slots__ = ('nomes', 'telas')
+
+    def __init__(self, nomes=_VAZIO, telas=_VAZIO):
+        self.nomes = frozenset(nomes)
+        self.telas = frozenset(telas)
+
+    def possui(self, permissao):
+        return permissao in self.nomes or permissao in self.telas
+
+
+_SEM_PERMISSOES = PermissoesPerfil()
+
+
+class CachePermissoes:
+
+    def __init__(self):
+        self._carregar = None
+        self._por_perfil = None
+        self._carregado_em = 0.0
+        self._lock = threading.Lock()
+
+    def configurar(self, carregar):
+        """carregar() deve retornar um iterável de (perfil, nome_permissao, tela)"""
+        self._carregar = carregar
+        self.invalidar()
+
+    def invalidar(self):
+        with self._lock:
+            self._por_perfil = None
+
+    def _mapa(self):
+        ttl = current_app.config.get('PERMISSOES_CACHE_TTL', TTL_PADRAO)
+        with self._lock:
+            if self._por_perfil is None or time.monotonic() - self._carregado_em >= ttl:
+                nomes, telas = {}, {}
+                for perfil, nome, tela in self._carregar():
+                    if nome:
+                        nomes.setdefault(perfil, set()).add(nome)
+                    if tela:
+                        telas.setdefault(perfil, set()).add(tela)
+                self._por_perfil = {
+                    perfil: PermissoesPerfil(nomes.get(perfil, ()), telas.get(perfil, ()))
+                    for perfil in set(nomes) | set(telas)
+                }
+                self._carregado_em = time.monotonic()
+            return self._por_perfil
+
+    def do_perfil(self, perfil):
+        if not perfil:
+            return _SEM_PERMISSOES
+        return self._mapa().get(perfil, _SEM_PERMISSOES)
+
+
+cache_permissoes = CachePermissoes()
+
+
+class CachePerfisUsuarios:
+    """Perfil de cada usuário (id -> Perfil), com TTL e invalidação por usuário"""
+
+    def __init__(self):
+        self._carregar = None
+        self._perfis = {}
+        self._lock = threading.Lock()
+
+    def configurar(self, carregar):
+        """carregar(id_usuario) deve retornar o Perfil atual do usuário (None se não existir)"""
+        self._carregar = carregar
+        self.invalidar()
+
+    def invalidar(self, id_usuario=None):
+        with self._lock:
+            if id_usuario is None:
+                self._perfis.clear()
+            else:
+                self._perfis.pop(id_usuario, None)
+
+    def do_usuario(self, id_usuario):
+        ttl = current_app.config.get('PERMISSOES_CACHE_TTL', TTL_PADRAO)
+        with self._lock:
+            perfil, carregado_em = self._perfis.get(id_usuario, (None, None))
+            if carregado_em is None or time.monotonic() - carregado_em >= ttl:
+                perfil = self._carregar(id_usuario)
+                self._perfis[id_usuario] = (perfil, time.monotonic())
+            return perfil
+
+
+perfis_usuarios = CachePerfisUsuarios()
+
+
+class TokenInvalido(Exception):
+    """Token JWT enviado, mas expirado, malformado ou com assinatura inválida (401)"""
+
+
+def _id_usuario(valor):
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        return None
+
+
+def perfil_atual():
+    """
+    Perfil atual do usuário autenticado pelo JWT ou, sem token, pela sessão.
+    Levanta TokenInvalido se o token enviado não for válido.
+    """
+    try:
+        token = verify_jwt_in_request(optional=True)
+    except (JWTExtendedException, PyJWTError) as e:
+        raise TokenInvalido(str(e)) from e
+    id_usuario = _id_usuario(get_jwt_identity() if token else session.get('user_id'))
+    if id_usuario is None:
+        return None
+    return perfis_usuarios.do_usuario(id_usuario)
+
+
+def requires_permission(*permissoes):
+    """
+    Exige que o perfil do usuário possua ao menos uma das permissões
+    (por Nome ou por Tela). Responde 401 sem usuário e 403 sem permissão.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            perfil = perfil_atual()
+            if not perfil:
+                return jsonify({'message': 'Usuário não autenticado'}), 401
+            if perfil == current_app.config.get('PERFIL_ADMINISTRADOR', PERFIL_ADMINISTRADOR_PADRAO):
+                return view(*args, **kwargs)
+            efetivas = cache_permissoes.do_perfil(perfil)
+            if not any(efetivas.possui(p) for p in permissoes):
+                return jsonify({'message': 'Acesso negado'}), 403
+            return view(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,182 @@
+"""
+Busca textual de sócios e empresas - SINDPLAST
+Busca sem acentos e ranqueada por similaridade de trigramas.
+
+No PostgreSQL a busca usa pg_trgm + unaccent (ver create_indices_busca.sql).
+Em outros bancos (ex.: SQLite nos testes) usa o IndiceTrigrama em Python,
+que implementa a mesma normalização e a mesma medida de similaridade.
+"""
+
+import re
+import threading
+import unicodedata
+
+from sqlalchemy import text
+
+from normalizacao import digitos
+
+LIMITE_PADRAO = 20
+LIMITE_MAXIMO = 100
+TAMANHO_MINIMO_TERMO = 2
+
+# Mesmo limiar padrão de pg_trgm.word_similarity_threshold
+LIMIAR_SIMILARIDADE = 0.6
+
+_SEPARADORES = re.compile(r'[^0-9a-z]+')
+
+
+def normalizar(texto):
+    """Remove acentos e converte para minúsculas (equivalente a f_unaccent(lower(x)))"""
+    if not texto:
+        return ''
+    decomposto = unicodedata.normalize('NFKD', str(texto))
+    return ''.join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+
+def documento_busca(*campos):
+    """
+    Texto indexado de um registro: os campos concatenados e, para os que contêm
+    pontuação (CPF, CNPJ, RG), também a versão só com dígitos. Deve produzir o
+    mesmo resultado das funções f_busca_* definidas em create_indices_busca.sql.
+    """
+    partes = []
+    for campo in campos:
+        if not campo:
+            continue
+        partes.append(str(campo))
+        so_digitos = digitos(campo)
+        if so_digitos and so_digitos != str(campo):
+            partes.append(so_digitos)
+    return normalizar(' '.join(partes))
+
+
+def trigramas(texto):
+    """Conjunto de trigramas no mesmo formato do pg_trgm (palavras com 2 espaços à esquerda e 1 à direita)"""
+    resultado = set()
+    for palavra in _SEPARADORES.split(texto):
+        if not palavra:
+            continue
+        palavra = f'  {palavra} '
+        for i in range(len(palavra) - 2):
+            resultado.add(palavra[i:i + 3])
+    return resultado
+
+
+def similaridade_palavra(trigramas_termo, trigramas_documento):
+    """Fração dos trigramas do termo presentes no documento (aproxima word_similarity)"""
+    if not trigramas_termo:
+        return 0.0
+    return len(trigramas_termo & trigramas_documento) / len(trigramas_termo)
+
+
+def ler_limite(valor):
+    try:
+        limite = int(valor) if valor else LIMITE_PADRAO
+    except (TypeError, ValueError):
+        limite = LIMITE_PADRAO
+    return max(1, min(limite, LIMITE_MAXIMO))
+
+
+class IndiceTrigrama:
+    """Índice invertido trigrama -> registros, usado quando o banco não é PostgreSQL"""
+
+    def __init__(self):
+        self._postings = {}
+        self._documentos = {}
+        self._registros = {}
+
+    def __len__(self):
+        return len(self._registros)
+
+    def adicionar(self, id_registro, documento, registro):
+        tri = trigramas(documento)
+        self._documentos[id_registro] = tri
+        self._registros[id_registro] = registro
+        for t in tri:
+            self._postings.setdefault(t, set()).add(id_registro)
+
+    def buscar(self, termo, limite=LIMITE_PADRAO, limiar=LIMIAR_SIMILARIDADE, chave_desempate=None):
+        tri_termo = trigramas(normalizar(termo))
+        if not tri_termo:
+            return []
+
+        # Conta quantos trigramas do termo cada candidato possui
+        contagem = {}
+        for t in tri_termo:
+            for id_registro in self._postings.get(t, ()):
+                contagem[id_registro] = contagem.get(id_registro, 0) + 1
+
+        total = len(tri_termo)
+        candidatos = [
+            (quantidade / total, id_registro)
+            for id_registro, quantidade in contagem.items()
+            if quantidade / total >= limiar
+        ]
+
+        def ordem(item):
+            score, id_registro = item
+            desempate = chave_desempate(self._registros[id_registro]) if chave_desempate else ''
+            return (-score, desempate, id_registro)
+
+        candidatos.sort(key=ordem)
+        return [dict(self._registros[i], score=round(s, 4)) for s, i in candidatos[:limite]]
+
+
+class CacheIndices:
+    """Mantém um índice por recurso, reconstruído sob demanda após invalidação"""
+
+    def __init__(self):
+        self._indices = {}
+        self._lock = threading.Lock()
+
+    def obter(self, recurso, construir):
+        with self._lock:
+            indice = self._indices.get(recurso)
+            if indice is None:
+                indice = construir()
+                self._indices[recurso] = indice
+            return indice
+
+    def invalidar(self, recurso=None):
+        with self._lock:
+            if recurso is None:
+                self._indices.clear()
+            else:
+                self._indices.pop(recurso, None)
+
+
+indices_busca = CacheIndices()
+
+
+SQL_BUSCA_SOCIOS = text('''
+    SELECT s."IdSocio" AS id, s."Nome" AS nome, s."CPF" AS cpf, s."RG" AS rg,
+           s."Matricula" AS matricula, s."Status" AS status, s."RazaoSocial" AS "razaoSocial",
+           word_similarity(:termo, "Sindplast".f_busca_socio(s."Nome", s."RG", s."CPF", s."Matricula")) AS score
+    FROM "Sindplast"."Socios" s
+    WHERE :termo <% "Sindplast".f_busca_socio(s."Nome", s."RG", s."CPF", s."Matricula")
+    ORDER BY score DESC, s."Nome", s."IdSocio"
+    LIMIT :limite
+''')
+
+SQL_BUSCA_EMPRESAS = text('''
+    SELECT e."IdEmpresa" AS id, e."CodEmpresa" AS "codEmpresa", e."CNPJ" AS cnpj,
+           e."RazaoSocial" AS "razaoSocial", e."NomeFantasia" AS "nomeFantasia",
+           word_similarity(:termo, "Sindplast".f_busca_empresa(e."RazaoSocial", e."NomeFantasia", e."CNPJ")) AS score
+    FROM "Sindplast"."Empresas" e
+    WHERE :termo <% "Sindplast".f_busca_empresa(e."RazaoSocial", e."NomeFantasia", e."CNPJ")
+    ORDER BY score DESC, e."RazaoSocial", e."IdEmpresa"
+    LIMIT :limite
+''')
+
+
+def buscar_postgres(sessao, sql, termo, limite):
+    """Executa a busca ranqueada no PostgreSQL (pg_trgm)"""
+    termo = normalizar(termo)
+    linhas = sessao.execute(sql, {'termo': termo, 'limite': limite}).mappings()
+    return [dict(linha, score=round(float(linha['score']), 4)) for linha in linhas]
+
+
+async def buscar_postgres_async(conexao, sql, termo, limite):
+    """Como buscar_postgres(), numa AsyncConnection (app_async.py)"""
+    resultado = await conexao.execute(sql, {'termo': normalizar(termo), 'limite': limite})
+    return [dict(linha, score=round(float(linha['score']), 4)) for linha in resultado.mappings()]
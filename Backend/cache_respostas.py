@@ -0,0 +1,258 @@
+"""
+Cache de respostas com ETag - SINDPLAST
+Cache em memória das respostas GET das listagens, chaveado por rota e query
+string. Cada recurso ('socios', 'empresas', 'usuarios') tem um contador de
+versão incrementado pelas rotas de escrita; a versão entra no ETag, então uma
+listagem sem alterações é respondida com 304 (ou com o corpo em cache) sem
+consultar o banco nem serializar.
+
+Os contadores ficam na tabela "Sindplast"."VersoesRecursos" (criada por
+'flask --app app init-db' ou create_versoes_recursos_table.sql), lida a cada
+requisição: uma escrita em um worker invalida as respostas de todos. Os
+corpos continuam em memória, por processo. Com RESPONSE_CACHE_VERSOES=memory
+os contadores são por processo e o ETag inclui um identificador do processo
+e uma janela de tempo (RESPONSE_CACHE_TTL): só serve para um único worker.
+Sem a tabela, as listagens são servidas sem cache.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import wraps
+from urllib.parse import urlencode
+
+from flask import current_app, has_app_context, request
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+
+from streaming import parametro_ativo
+
+logger = logging.getLogger(__name__)
+
+TTL_PADRAO = 60
+MAX_BYTES_PADRAO = 64 * 1024 * 1024
+
+# Muda a cada reinício do processo; evita reaproveitar ETags de contadores zerados
+_ID_PROCESSO = uuid.uuid4().hex[:12]
+
+metadata = MetaData()
+
+tabela_versoes = Table(
+    'VersoesRecursos', metadata,
+    Column('Recurso', String(50), primary_key=True),
+    Column('Versao', Integer, nullable=False),
+    Column('ModificadoEm', DateTime, nullable=False),
+    schema='Sindplast',
+)
+
+_INSERT_UPSERT = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+def _agora():
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+class VersoesMemoria:
+    """Contadores por processo (um único worker)"""
+
+    compartilhadas = False
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._versoes = {}
+
+    def ler(self, recursos):
+        """{recurso: (versao, modificado_em)} dos recursos já alterados"""
+        with self._lock:
+            return {r: self._versoes[r] for r in recursos if r in self._versoes}
+
+    def incrementar(self, recurso):
+        with self._lock:
+            versao = self._versoes.get(recurso, (0, None))[0]
+            self._versoes[recurso] = (versao + 1, _agora())
+
+
+class VersoesSQL:
+    """Contadores na tabela VersoesRecursos, compartilhados entre os workers"""
+
+    compartilhadas = True
+
+    def __init__(self, obter_engine):
+        self._obter_engine = obter_engine
+
+    def ler(self, recursos):
+        with self._obter_engine().connect() as conn:
+            linhas = conn.execute(
+                select(tabela_versoes.c.Recurso, tabela_versoes.c.Versao, tabela_versoes.c.ModificadoEm)
+                .where(tabela_versoes.c.Recurso.in_(recursos))
+            ).all()
+        # DateTime sem fuso, gravado em UTC
+        return {l.Recurso: (l.Versao, l.ModificadoEm.replace(tzinfo=timezone.utc)) for l in linhas}
+
+    def incrementar(self, recurso):
+        engine = self._obter_engine()
+        agora = _agora().replace(tzinfo=None)
+        inserir = _INSERT_UPSERT.get(engine.dialect.name)
+        if inserir is not None:
+            stmt = inserir(tabela_versoes).values(Recurso=recurso, Versao=1, ModificadoEm=agora)
+            with engine.begin() as conn:
+                conn.execute(stmt.on_conflict_do_update(
+                    index_elements=[tabela_versoes.c.Recurso],
+                    set_={'Versao': tabela_versoes.c.Versao + 1, 'ModificadoEm': agora}))
+            return
+
+        atualizar = (update(tabela_versoes).where(tabela_versoes.c.Recurso == recurso)
+                     .values(Versao=tabela_versoes.c.Versao + 1, ModificadoEm=agora))
+        try:
+            with engine.begin() as conn:
+                if conn.execute(atualizar).rowcount == 0:
+                    conn.execute(insert(tabela_versoes).values(Recurso=recurso, Versao=1, ModificadoEm=agora))
+        except IntegrityError:
+            # Outro worker inseriu o recurso entre o UPDATE e o INSERT
+            with engine.begin() as conn:
+                conn.execute(atualizar)
+
+
+class CacheRespostas:
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entradas = OrderedDict()
+        self._bytes = 0
+        self._inicio = _agora()
+        # Fora de uma aplicação configurada por init_app()
+        self._versoes_locais = VersoesMemoria()
+
+    def init_app(self, app, obter_engine=None):
+        """
+        Onde ficam as versões, conforme RESPONSE_CACHE_VERSOES: 'sql' (padrão,
+        requer obter_engine, ex.: lambda: db.engine) ou 'memory'.
+        """
+        modo = app.config.get('RESPONSE_CACHE_VERSOES', 'sql')
+        if modo == 'sql':
+            if obter_engine is None:
+                raise ValueError('RESPONSE_CACHE_VERSOES=sql requer obter_engine')
+            app.extensions['versoes_recursos'] = VersoesSQL(obter_engine)
+        elif modo == 'memory':
+            app.extensions['versoes_recursos'] = VersoesMemoria()
+        else:
+            raise ValueError(f'RESPONSE_CACHE_VERSOES desconhecido: {modo}')
+
+    def _armazenamento(self):
+        if has_app_context():
+            return current_app.extensions.get('versoes_recursos', self._versoes_locais)
+        return self._versoes_locais
+
+    def versoes(self, recursos):
+        """(versões, modificado_em, compartilhadas) dos recursos"""
+        armazenamento = self._armazenamento()
+        versoes = armazenamento.ler(recursos)
+        modificado_em = max((versoes[r][1] if r in versoes else self._inicio for r in recursos),
+                            default=self._inicio)
+        return {r: versoes.get(r, (0, None))[0] for r in recursos}, modificado_em, armazenamento.compartilhadas
+
+    def invalidar(self, recurso):
+        """Chamado após POST/PUT/DELETE: nova versão e descarte das respostas do recurso"""
+        try:
+            self._armazenamento().incrementar(recurso)
+        except Exception:
+            # A escrita já foi gravada; os outros workers só percebem pela janela do ETag
+            logger.exception('Erro ao registrar a nova versão de %s', recurso)
+        with self._lock:
+            for chave in [c for c, e in self._entradas.items() if recurso in e['recursos']]:
+                self._remover(chave)
+
+    def limpar(self):
+        with self._lock:
+            self._entradas.clear()
+            self._bytes = 0
+
+    def obter(self, chave, etag):
+        with self._lock:
+            entrada = self._entradas.get(chave)
+            if entrada is None or entrada['etag'] != etag:
+                return None
+            self._entradas.move_to_end(chave)
+            return entrada
+
+    def guardar(self, chave, etag, recursos, corpo, mimetype, max_bytes):
+        if len(corpo) > max_bytes:
+            return
+        with self._lock:
+            if chave in self._entradas:
+                self._remover(chave)
+            self._entradas[chave] = {'etag': etag, 'recursos': recursos, 'corpo': corpo, 'mimetype': mimetype}
+            self._bytes += len(corpo)
+            # Descarta as menos usadas até caber no limite
+            while self._bytes > max_bytes and self._entradas:
+                self._remover(next(iter(self._entradas)))
+
+    def _remover(self, chave):
+        entrada = self._entradas.pop(chave)
+        self._bytes -= len(entrada['corpo'])
+
+
+cache_respostas = CacheRespostas()
+
+
+def _chave_requisicao():
+    parametros = sorted(request.args.items(multi=True))
+    return f'{request.endpoint}?{urlencode(parametros)}'
+
+
+def _calcular_etag(chave, versoes, compartilhadas, ttl):
+    versoes = ','.join(f'{r}:{v}' for r, v in versoes.items())
+    janela = int(time.time() // ttl) if ttl > 0 else 0
+    # Versões do banco valem para todos os workers; as de memória, só para este processo
+    origem = 'sql' if compartilhadas else _ID_PROCESSO
+    bruto = f'{origem}|{janela}|{versoes}|{chave}'
+    return hashlib.sha1(bruto.encode('utf-8')).hexdigest()
+
+
+def em_cache(*recursos):
+    """
+    Decorator para rotas GET de listagem. Respostas em streaming (?stream=1)
+    não passam pelo cache.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            config = current_app.config
+            if not config.get('RESPONSE_CACHE_ENABLED', True) or parametro_ativo(request.args.get('stream')):
+                return view(*args, **kwargs)
+
+            try:
+                versoes, modificado_em, compartilhadas = cache_respostas.versoes(recursos)
+            except Exception as e:
+                # Ex.: tabela VersoesRecursos ainda não criada (init-db)
+                logger.warning('Versões do cache indisponíveis, resposta sem cache: %s', e)
+                return view(*args, **kwargs)
+
+            chave = _chave_requisicao()
+            etag = _calcular_etag(chave, versoes, compartilhadas, config.get('RESPONSE_CACHE_TTL', TTL_PADRAO))
+
+            if request.if_none_match.contains(etag):
+                resposta = current_app.response_class(status=304)
+            else:
+                entrada = cache_respostas.obter(chave, etag)
+                if entrada is not None:
+                    resposta = current_app.response_class(entrada['corpo'], mimetype=entrada['mimetype'])
+                else:
+                    resposta = current_app.make_response(view(*args, **kwargs))
+                    if resposta.status_code != 200 or resposta.is_streamed:
+                        return resposta
+                    cache_respostas.guardar(chave, etag, recursos, resposta.get_data(), resposta.mimetype,
+                                            config.get('RESPONSE_CACHE_MAX_BYTES', MAX_BYTES_PADRAO))
+
+            resposta.set_etag(etag)
+            resposta.last_modified = modificado_em
+            # Permite guardar, mas obriga o navegador a revalidar com If-None-Match
+            resposta.headers['Cache-Control'] = 'no-cache'
+            return resposta
+        return wrapper
+    return decorator
@@ -0,0 +1,46 @@
+-- Busca sem acentos e ranqueada (/api/socios/search e /api/empresas/search)
+-- Requer as extensões unaccent e pg_trgm
+
+CREATE EXTENSION IF NOT EXISTS unaccent;
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- unaccent() não é IMMUTABLE; o wrapper com dicionário fixo permite usá-lo em índices
+CREATE OR REPLACE FUNCTION "Sindplast".f_unaccent(text)
+RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS
+$$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) $$;
+
+-- Campo + versão só com dígitos (CPF, CNPJ e RG podem ser buscados com ou sem máscara)
+CREATE OR REPLACE FUNCTION "Sindplast".f_doc_busca(text)
+RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE AS
+$$
+    SELECT CASE
+        WHEN $1 IS NULL OR $1 = '' THEN NULL
+        WHEN regexp_replace($1, '\D', '', 'g') IN ('', $1) THEN $1
+        ELSE $1 || ' ' || regexp_replace($1, '\D', '', 'g')
+    END
+$$;
+
+-- Devem produzir o mesmo texto de busca.documento_busca()
+CREATE OR REPLACE FUNCTION "Sindplast".f_busca_socio(nome text, rg text, cpf text, matricula text)
+RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE AS
+$$
+    SELECT "Sindplast".f_unaccent(lower(concat_ws(' ',
+        "Sindplast".f_doc_busca(nome), "Sindplast".f_doc_busca(rg),
+        "Sindplast".f_doc_busca(cpf), "Sindplast".f_doc_busca(matricula))))
+$$;
+
+CREATE OR REPLACE FUNCTION "Sindplast".f_busca_empresa(razao_social text, nome_fantasia text, cnpj text)
+RETURNS text LANGUAGE sql IMMUTABLE PARALLEL SAFE AS
+$$
+    SELECT "Sindplast".f_unaccent(lower(concat_ws(' ',
+        "Sindplast".f_doc_busca(razao_social), "Sindplast".f_doc_busca(nome_fantasia),
+        "Sindplast".f_doc_busca(cnpj))))
+$$;
+
+CREATE INDEX IF NOT EXISTS "IX_Socios_Busca_Trgm"
+    ON "Sindplast"."Socios"
+    USING gin ("Sindplast".f_busca_socio("Nome", "RG", "CPF", "Matricula") gin_trgm_ops);
+
+CREATE INDEX IF NOT EXISTS "IX_Empresas_Busca_Trgm"
+    ON "Sindplast"."Empresas"
+    USING gin ("Sindplast".f_busca_empresa("RazaoSocial", "NomeFantasia", "CNPJ") gin_trgm_ops);
@@ -0,0 +1,11 @@
+-- Índices para o upsert da migração de empresas (Scripts/Sindplast_Migracao_Empresas.py)
+-- O casamento usa o CNPJ só com dígitos ou, sem CNPJ, o CodEmpresa
+
+CREATE INDEX IF NOT EXISTS "IX_Empresas_CNPJ_Digitos"
+    ON "Sindplast"."Empresas" ((regexp_replace("CNPJ", '[^0-9]', '', 'g')));
+
+-- CodEmpresa liga a empresa aos sócios e é a chave da propagação empresa -> sócios,
+-- por isso é único. Duplicados existentes precisam ser resolvidos antes:
+--   SELECT "CodEmpresa", count(*) FROM "Sindplast"."Empresas" GROUP BY 1 HAVING count(*) > 1;
+CREATE UNIQUE INDEX IF NOT EXISTS "UX_Empresas_CodEmpresa" ON "Sindplast"."Empresas" ("CodEmpresa");
+DROP INDEX IF EXISTS "Sindplast"."IX_Empresas_CodEmpresa";
@@ -0,0 +1,26 @@
+-- Índices para a listagem paginada de sócios (keyset em /api/socios)
+-- A ordenação usa COALESCE(coluna, '') + "IdSocio" como desempate
+
+CREATE INDEX IF NOT EXISTS "IX_Socios_Nome_Keyset"
+    ON "Sindplast"."Socios" ((COALESCE("Nome", '')), "IdSocio");
+
+CREATE INDEX IF NOT EXISTS "IX_Socios_Matricula_Keyset"
+    ON "Sindplast"."Socios" ((COALESCE("Matricula", '')), "IdSocio");
+
+CREATE INDEX IF NOT EXISTS "IX_Socios_RazaoSocial_Keyset"
+    ON "Sindplast"."Socios" ((COALESCE("RazaoSocial", '')), "IdSocio");
+
+-- Filtros por igualdade
+CREATE INDEX IF NOT EXISTS "IX_Socios_Status" ON "Sindplast"."Socios" ("Status");
+CREATE INDEX IF NOT EXISTS "IX_Socios_CodEmpresa" ON "Sindplast"."Socios" ("CodEmpresa");
+
+-- Filtros por prefixo (LIKE 'xxx%') em CPF e RG
+CREATE INDEX IF NOT EXISTS "IX_Socios_CPF_Prefixo" ON "Sindplast"."Socios" ("CPF" varchar_pattern_ops);
+CREATE INDEX IF NOT EXISTS "IX_Socios_RG_Prefixo" ON "Sindplast"."Socios" ("RG" varchar_pattern_ops);
+
+-- Relatório de sócios ativos por empresa (/api/relatorios/socios-ativos-por-empresa)
+-- A collation do índice deve ser a mesma de RELATORIO_COLLATION para evitar o sort.
+-- O filtro é upper("Status") = 'ATIVO' ("Ativo" e "ativo" também contam)
+DROP INDEX IF EXISTS "Sindplast"."IX_Socios_Status_CodEmpresa_Nome";
+CREATE INDEX IF NOT EXISTS "IX_Socios_StatusUpper_CodEmpresa_Nome"
+    ON "Sindplast"."Socios" ((upper("Status")), "CodEmpresa", "Nome" COLLATE "pt-BR-x-icu");
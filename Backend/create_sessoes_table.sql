@@ -0,0 +1,10 @@
+-- Sessões do servidor (SESSION_BACKEND=sql)
+
+CREATE TABLE IF NOT EXISTS "Sindplast"."Sessoes" (
+    "IdSessao" VARCHAR(64) PRIMARY KEY,
+    "Dados" TEXT NOT NULL,
+    "ExpiraEm" TIMESTAMP NOT NULL
+);
+
+-- Usado pela limpeza periódica (DELETE ... WHERE "ExpiraEm" <= now())
+CREATE INDEX IF NOT EXISTS "IX_Sessoes_ExpiraEm" ON "Sindplast"."Sessoes" ("ExpiraEm");
@@ -0,0 +1,8 @@
+-- Versões dos recursos do cache de respostas (RESPONSE_CACHE_VERSOES=sql)
+-- Uma linha por recurso ('socios', 'empresas', 'usuarios'), incrementada a cada escrita
+
+CREATE TABLE IF NOT EXISTS "Sindplast"."VersoesRecursos" (
+    "Recurso" VARCHAR(50) PRIMARY KEY,
+    "Versao" INTEGER NOT NULL,
+    "ModificadoEm" TIMESTAMP NOT NULL
+);
@@ -0,0 +1,119 @@
+"""
+Exportação CSV/XLSX - SINDPLAST
+Gera os arquivos no servidor a partir de um cursor do banco (yield_per), com
+memória constante.
+
+CSV: enviado em streaming conforme as linhas chegam; separador ';' e BOM UTF-8
+para abrir direto no Excel em português (decimais com vírgula). Textos que o
+Excel leria como fórmula (=, +, -, @, tab, CR no início) recebem um ' na
+frente (injeção de CSV).
+XLSX: openpyxl em modo write-only, gravado num arquivo temporário e enviado
+ao final (o formato zip não permite enviar antes de terminar). Textos com '='
+no início são gravados como texto, não como fórmula.
+"""
+
+import csv
+import io
+import logging
+import tempfile
+from datetime import date, datetime
+from decimal import Decimal
+
+from flask import Response, send_file, stream_with_context
+
+LINHAS_POR_LOTE = 1000
+SEPARADOR_CSV = ';'
+
+MIMETYPE_XLSX = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+
+# Início de texto que o Excel interpreta como fórmula
+INICIOS_FORMULA = ('=', '+', '-', '@', '\t', '\r')
+
+logger = logging.getLogger(__name__)
+
+
+class FormatoIndisponivel(RuntimeError):
+    """Dependência opcional do formato (openpyxl) não instalada"""
+
+
+def _valor_csv(valor):
+    if valor is None:
+        return ''
+    if isinstance(valor, bool):
+        return 'Sim' if valor else 'Não'
+    if isinstance(valor, (datetime, date)):
+        return valor.isoformat()
+    if isinstance(valor, (Decimal, float)):
+        return str(valor).replace('.', ',')
+    if isinstance(valor, str) and valor.startswith(INICIOS_FORMULA):
+        return "'" + valor
+    return valor
+
+
+def _linhas(sessao, stmt, linhas_por_lote):
+    resultado = sessao.execute(stmt.execution_options(yield_per=linhas_por_lote))
+    try:
+        yield from resultado
+    finally:
+        resultado.close()
+
+
+def resposta_csv(sessao, stmt, cabecalhos, nome_arquivo, linhas_por_lote=LINHAS_POR_LOTE):
+    """Response em streaming com o CSV das linhas de stmt (uma coluna por cabeçalho)"""
+    def gerar():
+        buffer = io.StringIO()
+        escritor = csv.writer(buffer, delimiter=SEPARADOR_CSV, lineterminator='\r\n')
+        buffer.write('\ufeff')
+        escritor.writerow(cabecalhos)
+        # Cabeçalho sai antes da primeira consulta ao banco
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        pendentes = 0
+        try:
+            for linha in _linhas(sessao, stmt, linhas_por_lote):
+                escritor.writerow([_valor_csv(v) for v in linha])
+                pendentes += 1
+                if pendentes >= linhas_por_lote:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+                    pendentes = 0
+        except Exception:
+            # Cabeçalhos já enviados: registra e encerra o arquivo incompleto
+            logger.exception('Erro durante a exportação CSV')
+        yield buffer.getvalue()
+
+    resposta = Response(stream_with_context(gerar()), mimetype='text/csv')
+    resposta.headers['Content-Disposition'] = f'attachment; filename="{nome_arquivo}.csv"'
+    return resposta
+
+
+def resposta_xlsx(sessao, stmt, cabecalhos, nome_arquivo, linhas_por_lote=LINHAS_POR_LOTE):
+    """Planilha write-only (linhas não ficam em memória) enviada de um arquivo temporário"""
+    try:
+        from openpyxl import Workbook
+        from openpyxl.cell import WriteOnlyCell
+    except ImportError:
+        raise FormatoIndisponivel('Exportação XLSX requer o pacote openpyxl')
+
+    planilha = Workbook(write_only=True)
+    aba = planilha.create_sheet(title=nome_arquivo[:31])
+
+    def celula(valor):
+        # O openpyxl grava como fórmula todo texto iniciado por '='
+        if isinstance(valor, str) and valor.startswith('='):
+            texto = WriteOnlyCell(aba, value=valor)
+            texto.data_type = 's'
+            return texto
+        return valor
+
+    aba.append(cabecalhos)
+    for linha in _linhas(sessao, stmt, linhas_por_lote):
+        aba.append([celula(v) for v in linha])
+
+    arquivo = tempfile.TemporaryFile()
+    planilha.save(arquivo)
+    arquivo.seek(0)
+    return send_file(arquivo, mimetype=MIMETYPE_XLSX, as_attachment=True,
+                     download_name=f'{nome_arquivo}.xlsx')
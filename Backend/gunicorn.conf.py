@@ -0,0 +1,30 @@
+"""
+Configuração do Gunicorn - SINDPLAST
+    gunicorn -c gunicorn.conf.py app:app
+
+Com PROMETHEUS_MULTIPROC_DIR definido, as métricas de cada worker ficam em
+arquivos nesse diretório: ele é limpo na subida do servidor e os arquivos
+dos workers encerrados são marcados para que /metrics some só os vivos.
+"""
+
+import os
+import shutil
+
+bind = os.environ.get('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.environ.get('GUNICORN_WORKERS', 4))
+
+
+def on_starting(server):
+    diretorio = os.environ.get('PROMETHEUS_MULTIPROC_DIR')
+    if diretorio:
+        shutil.rmtree(diretorio, ignore_errors=True)
+        os.makedirs(diretorio, exist_ok=True)
+
+
+def child_exit(server, worker):
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        try:
+            from prometheus_client import multiprocess
+        except ImportError:
+            return
+        multiprocess.mark_process_dead(worker.pid)
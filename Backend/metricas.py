@@ -0,0 +1,85 @@
+"""
+Métricas de consultas por rota - SINDPLAST
+Conta as consultas SQL e soma o tempo gasto no banco por endpoint do Flask
+(eventos before/after_cursor_execute do engine). Consultas fora de uma
+requisição (tarefas em segundo plano, CLI) ficam em FORA_DE_REQUISICAO.
+Os dados são de cada processo (worker) e recomeçam quando ele reinicia.
+"""
+
+import threading
+import time
+
+from flask import has_request_context, request
+from sqlalchemy import event
+
+FORA_DE_REQUISICAO = '(fora de requisição)'
+SEM_ROTA = '(sem rota)'  # 404 e afins: agrupados para não criar uma chave por URL
+
+
+class MetricasConsultas:
+
+    def __init__(self):
+        self._rotas = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app, obter_engine):
+        app.extensions['metricas_consultas'] = self
+        with app.app_context():
+            engine = obter_engine()
+        event.listen(engine, 'before_cursor_execute', self._antes)
+        event.listen(engine, 'after_cursor_execute', self._depois)
+        event.listen(engine, 'handle_error', self._erro)
+        app.teardown_request(self._fim_requisicao)
+
+    def _rota(self, nome):
+        rota = self._rotas.get(nome)
+        if rota is None:
+            rota = self._rotas[nome] = {
+                'requisicoes': 0, 'consultas': 0, 'tempoConsultas': 0.0, 'maxConsulta': 0.0,
+            }
+        return rota
+
+    @staticmethod
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('inicio_consultas', []).append(time.perf_counter())
+
+    @staticmethod
+    def _erro(contexto):
+        # Consulta com erro não passa por after_cursor_execute
+        if contexto.connection is not None and contexto.connection.info.get('inicio_consultas'):
+            contexto.connection.info['inicio_consultas'].pop()
+
+    def _depois(self, conn, cursor, statement, parameters, context, executemany):
+        duracao = time.perf_counter() - conn.info['inicio_consultas'].pop()
+        nome = (request.endpoint or SEM_ROTA) if has_request_context() else FORA_DE_REQUISICAO
+        with self._lock:
+            rota = self._rota(nome)
+            rota['consultas'] += 1
+            rota['tempoConsultas'] += duracao
+            if duracao > rota['maxConsulta']:
+                rota['maxConsulta'] = duracao
+
+    def _fim_requisicao(self, erro=None):
+        nome = request.endpoint or SEM_ROTA
+        with self._lock:
+            self._rota(nome)['requisicoes'] += 1
+
+    def metricas(self):
+        with self._lock:
+            rotas = {nome: dict(valores) for nome, valores in self._rotas.items()}
+        resultado = {}
+        for nome, rota in sorted(rotas.items()):
+            consultas = rota['consultas']
+            requisicoes = rota['requisicoes']
+            resultado[nome] = {
+                'requisicoes': requisicoes,
+                'consultas': consultas,
+                'consultasPorRequisicao': round(consultas / requisicoes, 2) if requisicoes else None,
+                'tempoConsultasMs': round(rota['tempoConsultas'] * 1000, 2),
+                'latenciaMediaMs': round(rota['tempoConsultas'] * 1000 / consultas, 3) if consultas else None,
+                'latenciaMaxMs': round(rota['maxConsulta'] * 1000, 2),
+            }
+        return resultado
+
+
+metricas_consultas = MetricasConsultas()
@@ -0,0 +1,137 @@
+"""
+Métricas no formato Prometheus - SINDPLAST
+Histogramas de latência e de tamanho da resposta, requisições em andamento,
+contadores de requisições e de erros, todos por endpoint do Flask
+(get_socios, login, ...), expostos em GET /metrics.
+
+Com vários workers (gunicorn -w N), defina PROMETHEUS_MULTIPROC_DIR com um
+diretório vazio e gravável: cada processo grava seus valores em arquivos
+nesse diretório e /metrics soma os de todos. O gunicorn.conf.py limpa o
+diretório na subida e marca os workers que saem (child_exit).
+
+prometheus_client é opcional: sem o pacote, nada é medido e /metrics responde 501.
+"""
+
+import os
+import time
+
+from flask import Response, g, request
+
+try:
+    from prometheus_client import (CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Gauge,
+                                   Histogram, generate_latest, multiprocess)
+except ImportError:  # pragma: no cover - dependência opcional
+    Counter = None
+
+from metricas import SEM_ROTA
+
+BUCKETS_DURACAO = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+
+
+def disponivel():
+    return Counter is not None
+
+
+if disponivel():
+    DURACAO = Histogram(
+        'sindplast_requisicao_duracao_segundos', 'Duração das requisições HTTP',
+        ['endpoint', 'metodo'], buckets=BUCKETS_DURACAO)
+    BYTES_RESPOSTA = Histogram(
+        'sindplast_resposta_bytes', 'Tamanho do corpo das respostas HTTP',
+        ['endpoint', 'metodo'], buckets=BUCKETS_BYTES)
+    REQUISICOES = Counter(
+        'sindplast_requisicoes', 'Requisições HTTP concluídas',
+        ['endpoint', 'metodo', 'status'])
+    ERROS = Counter(
+        'sindplast_erros', 'Requisições com status 5xx ou exceção não tratada',
+        ['endpoint', 'metodo'])
+    EM_ANDAMENTO = Gauge(
+        'sindplast_requisicoes_em_andamento', 'Requisições HTTP em andamento',
+        ['endpoint'], multiprocess_mode='livesum')
+
+
+class PrometheusIndisponivel(RuntimeError):
+    """prometheus_client não instalado"""
+
+
+def _multiprocesso():
+    return bool(os.environ.get('PROMETHEUS_MULTIPROC_DIR'))
+
+
+class MetricasPrometheus:
+
+    def __init__(self):
+        self.app = None
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['metricas_prometheus'] = self
+        if not disponivel():
+            return
+
+        app.before_request(self._inicio)
+        app.after_request(self._resposta)
+        app.teardown_request(self._fim)
+
+    @staticmethod
+    def _endpoint():
+        return request.endpoint or SEM_ROTA
+
+    def _inicio(self):
+        g._prometheus_inicio = time.perf_counter()
+        EM_ANDAMENTO.labels(self._endpoint()).inc()
+
+    def _resposta(self, resposta):
+        g._prometheus_status = resposta.status_code
+        rotulos = BYTES_RESPOSTA.labels(self._endpoint(), request.method)
+        tamanho = resposta.content_length  # cabeçalho, quando já definido (ex.: send_file)
+        if tamanho is None and resposta.is_streamed:
+            # Tamanho conhecido só ao final do envio
+            resposta.response = self._contar_bytes(resposta.response, rotulos)
+        else:
+            rotulos.observe(tamanho if tamanho is not None else resposta.calculate_content_length() or 0)
+        return resposta
+
+    @staticmethod
+    def _contar_bytes(partes, rotulos):
+        total = 0
+        try:
+            for parte in partes:
+                if isinstance(parte, str):
+                    parte = parte.encode('utf-8')
+                total += len(parte)
+                yield parte
+        finally:
+            rotulos.observe(total)
+            # Fecha o iterável original (stream_with_context libera o contexto no close)
+            if hasattr(partes, 'close'):
+                partes.close()
+
+    def _fim(self, erro=None):
+        inicio = g.pop('_prometheus_inicio', None)
+        if inicio is None:
+            return
+        endpoint = self._endpoint()
+        metodo = request.method
+        status = 500 if erro is not None else g.pop('_prometheus_status', 500)
+        DURACAO.labels(endpoint, metodo).observe(time.perf_counter() - inicio)
+        REQUISICOES.labels(endpoint, metodo, str(status)).inc()
+        if status >= 500:
+            ERROS.labels(endpoint, metodo).inc()
+        EM_ANDAMENTO.labels(endpoint).dec()
+
+
+def resposta_metricas():
+    """Response com as métricas no formato texto do Prometheus (soma dos workers no modo multiprocesso)"""
+    if not disponivel():
+        raise PrometheusIndisponivel('Métricas Prometheus requerem o pacote prometheus_client')
+    if _multiprocesso():
+        registro = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registro)
+    else:
+        registro = REGISTRY
+    return Response(generate_latest(registro), content_type=CONTENT_TYPE_LATEST)
+
+
+metricas_prometheus = MetricasPrometheus()
@@ -0,0 +1,299 @@
+"""
+Modelos do banco de dados - SINDPLAST
+Importável sem criar a aplicação nem abrir conexão: o db é ligado ao app em
+create_app() (app.py) e o schema/usuário Admin são criados explicitamente
+por inicializar_banco() (flask --app app init-db).
+"""
+
+from datetime import datetime
+
+from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import insert, select, text
+from werkzeug.security import generate_password_hash
+
+from banco import SCHEMA
+from cache_respostas import metadata as metadata_cache
+from sessoes import metadata as metadata_sessoes
+
+db = SQLAlchemy()
+
+class Empresa(db.Model):
+    __tablename__ = 'Empresas'
+    # CodEmpresa liga a empresa aos sócios (Socios.CodEmpresa): único
+    __table_args__ = (
+        db.Index('UX_Empresas_CodEmpresa', 'CodEmpresa', unique=True),
+        {'schema': 'Sindplast'},
+    )
+    
+    IdEmpresa = db.Column(db.Integer, primary_key=True)
+    CodEmpresa = db.Column(db.String(10))
+    CNPJ = db.Column(db.String(18))
+    RazaoSocial = db.Column(db.String(500))
+    NomeFantasia = db.Column(db.String(500))
+    Endereco = db.Column(db.String(500))
+    Numero = db.Column(db.String(12))
+    Complemento = db.Column(db.String(500))
+    Bairro = db.Column(db.String(500))
+    CEP = db.Column(db.String(10))
+    Cidade = db.Column(db.String(500))
+    UF = db.Column(db.String(2))
+    Telefone01 = db.Column(db.String(15))
+    Telefone02 = db.Column(db.String(15))
+    Fax = db.Column(db.String(15))
+    Celular = db.Column(db.String(15))
+    WhatsApp = db.Column(db.String(15))
+    Instagram = db.Column(db.String(200))
+    Linkedin = db.Column(db.String(200))
+    NFuncionarios = db.Column(db.Integer)
+    DataContribuicao = db.Column(db.Date)
+    ValorContribuicao = db.Column(db.Numeric(10, 2))
+    DataCadastro = db.Column(db.DateTime)
+    Cadastrante = db.Column(db.String(500))
+    Observacao = db.Column(db.Text)
+    
+    def to_dict(self):
+        return {
+            'id': self.IdEmpresa,
+            'codEmpresa': self.CodEmpresa,
+            'cnpj': self.CNPJ,
+            'razaoSocial': self.RazaoSocial,
+            'nomeFantasia': self.NomeFantasia,
+            'endereco': self.Endereco,
+            'numero': self.Numero,
+            'complemento': self.Complemento,
+            'bairro': self.Bairro,
+            'cep': self.CEP,
+            'cidade': self.Cidade,
+            'uf': self.UF,
+            'telefone01': self.Telefone01,
+            'telefone02': self.Telefone02,
+            'fax': self.Fax,
+            'celular': self.Celular,
+            'whatsapp': self.WhatsApp,
+            'instagram': self.Instagram,
+            'linkedin': self.Linkedin,
+            'nFuncionarios': self.NFuncionarios,
+            'dataContribuicao': self.DataContribuicao.isoformat() if self.DataContribuicao else None,
+            'valorContribuicao': float(self.ValorContribuicao) if self.ValorContribuicao else None,
+            'dataCadastro': self.DataCadastro.isoformat() if self.DataCadastro else None,
+            'cadastrante': self.Cadastrante,
+            'observacao': self.Observacao
+        }
+
+class Socio(db.Model):
+    __tablename__ = 'Socios'
+    __table_args__ = {'schema': 'Sindplast'}
+
+    IdSocio = db.Column(db.Integer, primary_key=True)
+    Nome = db.Column(db.String(400))
+    RG = db.Column(db.String(30))
+    Emissor = db.Column(db.String(100))
+    CPF = db.Column(db.String(14))
+    Nascimento = db.Column(db.Date)
+    Sexo = db.Column(db.String(100))
+    Naturalidade = db.Column(db.String(200))
+    NaturalidadeUF = db.Column(db.String(2))
+    Nacionalidade = db.Column(db.String(150))
+    EstadoCivil = db.Column(db.String(200))
+    Endereco = db.Column(db.String(400))
+    Complemento = db.Column(db.String(500))
+    Bairro = db.Column(db.String(400))
+    CEP = db.Column(db.String(9))
+    Celular = db.Column(db.String(15))
+    RedeSocial = db.Column('Rede Social', db.String(500))
+    Pai = db.Column(db.String(400))
+    Mae = db.Column(db.String(400))
+    DataCadastro = db.Column(db.DateTime)
+    Cadastrante = db.Column(db.String(300))
+    Status = db.Column(db.String(20))
+    # Campos adicionais da tabela Socios
+    Matricula = db.Column(db.String(50))
+    DataMensalidade = db.Column(db.Date)
+    ValorMensalidade = db.Column(db.Numeric(10, 2))
+    DataAdmissao = db.Column(db.Date)
+    CTPS = db.Column(db.String(50))
+    Funcao = db.Column(db.String(200))
+    CodEmpresa = db.Column(db.String(10))
+    CNPJ = db.Column(db.String(18))
+    RazaoSocial = db.Column(db.String(500))
+    NomeFantasia = db.Column(db.String(500))
+    DataDemissao = db.Column(db.Date)
+    MotivoDemissao = db.Column(db.String(500))
+    Carta = db.Column(db.Boolean)
+    Carteira = db.Column(db.Boolean)
+    Ficha = db.Column(db.Boolean)
+    Observacao = db.Column(db.Text)
+    Telefone = db.Column(db.String(15))
+    
+    def to_dict(self):
+        return {
+            'id': self.IdSocio,
+            'nome': self.Nome,
+            'rg': self.RG,
+            'emissor': self.Emissor,
+            'cpf': self.CPF,
+            'nascimento': self.Nascimento.isoformat() if self.Nascimento else None,
+            'sexo': self.Sexo,
+            'naturalidade': self.Naturalidade,
+            'naturalidadeUF': self.NaturalidadeUF,
+            'nacionalidade': self.Nacionalidade,
+            'estadoCivil': self.EstadoCivil,
+            'endereco': self.Endereco,
+            'complemento': self.Complemento,
+            'bairro': self.Bairro,
+            'cep': self.CEP,
+            'celular': self.Celular,
+            'redeSocial': self.RedeSocial,
+            'pai': self.Pai,
+            'mae': self.Mae,
+            'dataCadastro': self.DataCadastro.isoformat() if self.DataCadastro else None,
+            'cadastrante': self.Cadastrante,
+            'status': self.Status,
+            # Campos adicionais
+            'matricula': self.Matricula,
+            'dataMensalidade': self.DataMensalidade.isoformat() if self.DataMensalidade else None,
+            'valorMensalidade': float(self.ValorMensalidade) if self.ValorMensalidade else None,
+            'dataAdmissao': self.DataAdmissao.isoformat() if self.DataAdmissao else None,
+            'ctps': self.CTPS,
+            'funcao': self.Funcao,
+            'codEmpresa': self.CodEmpresa,
+            'cnpj': self.CNPJ,
+            'razaoSocial': self.RazaoSocial,
+            'nomeFantasia': self.NomeFantasia,
+            'dataDemissao': self.DataDemissao.isoformat() if self.DataDemissao else None,
+            'motivoDemissao': self.MotivoDemissao,
+            'carta': self.Carta,
+            'carteira': self.Carteira,
+            'ficha': self.Ficha,
+            'observacao': self.Observacao,
+            'telefone': self.Telefone
+        }
+
+class Funcionario(db.Model):
+    __tablename__ = 'Funcionarios'
+    __table_args__ = {'schema': 'Sindplast'}
+    
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(100), nullable=False)
+    cpf = db.Column(db.String(14), unique=True, nullable=False)
+    cargo = db.Column(db.String(50))
+    data_admissao = db.Column(db.Date)
+    salario = db.Column(db.Float)
+    empresa_id = db.Column(db.Integer, db.ForeignKey('Sindplast.Empresas.IdEmpresa'))
+    
+    def to_dict(self):
+        return {
+            'id': self.id,
+            'nome': self.nome,
+            'cpf': self.cpf,
+            'cargo': self.cargo,
+            'data_admissao': self.data_admissao.isoformat() if self.data_admissao else None,
+            'salario': self.salario,
+            'empresa_id': self.empresa_id
+        }
+
+class Usuario(db.Model):
+    __tablename__ = 'Usuarios'
+    __table_args__ = {'schema': 'Sindplast'}
+
+    IdUsuarios = db.Column(db.Integer, primary_key=True)
+    Nome = db.Column(db.String(300), unique=True)
+    CPF = db.Column(db.String(14), unique=True)
+    Funcao = db.Column(db.String(300), unique=True)
+    Email = db.Column(db.String(400), unique=True)
+    Usuario = db.Column(db.String(200), unique=True)
+    Senha = db.Column(db.String(200), unique=True)
+    Perfil = db.Column(db.String(300), unique=True)
+    Cadastrante = db.Column(db.String(400), nullable=False)
+    DataCadastro = db.Column(db.DateTime)
+
+    def to_dict(self):
+        return {
+            'IdUsuarios': self.IdUsuarios,
+            'Nome': self.Nome,
+            'CPF': self.CPF,
+            'Funcao': self.Funcao,
+            'Email': self.Email,
+            'Usuario': self.Usuario,
+            'Perfil': self.Perfil,
+            'Cadastrante': self.Cadastrante,
+            'DataCadastro': self.DataCadastro.isoformat() if self.DataCadastro else None
+        }
+
+# Modelo Perfil
+class Perfil(db.Model):
+    __tablename__ = 'Perfil'
+    __table_args__ = {'schema': 'Sindplast'}
+
+    IdPerfil = db.Column(db.Integer, primary_key=True)
+    Perfil = db.Column(db.String(50), unique=True, nullable=False)
+    Descricao = db.Column(db.String(255))
+    DataCadastro = db.Column(db.DateTime, default=datetime.utcnow)
+    Cadastrante = db.Column(db.String(100))
+
+    def to_dict(self):
+        return {
+            'IdPerfil': self.IdPerfil,
+            'Perfil': self.Perfil,
+            'Descricao': self.Descricao,
+            'DataCadastro': self.DataCadastro.isoformat() if self.DataCadastro else None,
+            'Cadastrante': self.Cadastrante
+        }
+
+# Modelo Permissoes
+class Permissoes(db.Model):
+    __tablename__ = 'Permissoes'
+    __table_args__ = {'schema': 'Sindplast'}
+
+    IdPermissao = db.Column(db.Integer, primary_key=True)
+    Nome = db.Column(db.String(50), unique=True, nullable=False)
+    Descricao = db.Column(db.String(255))
+    Tela = db.Column(db.String(100))
+    DataCadastro = db.Column(db.DateTime, default=datetime.utcnow)
+    Cadastrante = db.Column(db.String(100))
+
+    def to_dict(self):
+        return {
+            'IdPermissao': self.IdPermissao,
+            'Nome': self.Nome,
+            'Descricao': self.Descricao,
+            'Tela': self.Tela,
+            'DataCadastro': self.DataCadastro.isoformat() if self.DataCadastro else None,
+            'Cadastrante': self.Cadastrante
+        }
+
+# Modelo PerfilPermissao
+class PerfilPermissao(db.Model):
+    __tablename__ = 'PerfilPermissao'
+    __table_args__ = {'schema': 'Sindplast'}
+    IdPerfil = db.Column(db.Integer, db.ForeignKey('Sindplast.Perfil.IdPerfil'), primary_key=True)
+    IdPermissao = db.Column(db.Integer, db.ForeignKey('Sindplast.Permissoes.IdPermissao'), primary_key=True)
+
+
+def inicializar_banco(engine):
+    """
+    Cria o schema (PostgreSQL), as tabelas que faltarem (inclusive as de
+    sessões e de versões do cache de respostas) e o usuário Admin padrão. Idempotente; retorna True se o Admin
+    foi criado agora.
+    """
+    if engine.dialect.name == 'postgresql':
+        with engine.begin() as conn:
+            conn.execute(text(f'CREATE SCHEMA IF NOT EXISTS "{SCHEMA}"'))
+    db.metadata.create_all(engine)
+    metadata_sessoes.create_all(engine)
+    metadata_cache.create_all(engine)
+
+    usuarios = Usuario.__table__
+    with engine.begin() as conn:
+        if conn.execute(select(usuarios.c.IdUsuarios).where(usuarios.c.Usuario == 'Admin')).first():
+            return False
+        conn.execute(insert(usuarios).values(
+            Nome='Administrador',
+            Usuario='Admin',
+            Email='admin@sindplast.com',
+            Senha=generate_password_hash('Sindplast'),
+            Perfil='Administrador',
+            Cadastrante='Sistema',
+            DataCadastro=datetime.utcnow()
+        ))
+    return True
@@ -0,0 +1,147 @@
+"""
+Normalização de documentos e contatos - SINDPLAST
+CPF, CNPJ, telefone e CEP: extração de dígitos, máscaras e validação dos
+dígitos verificadores. Usado pela API (app.py) e pelos scripts de migração
+(Scripts/transformacao.py).
+
+A extração de dígitos usa uma expressão regular compilada uma vez, que
+descarta tudo o que não é dígito ASCII; as funções *_lote recebem e devolvem
+listas.
+"""
+
+import re
+from operator import mul
+
+# Só 0-9: \D manteria dígitos de outros alfabetos (ex.: '٣')
+_NAO_DIGITOS = re.compile(r'[^0-9]+')
+
+_PESOS_CPF_1 = tuple(range(10, 1, -1))
+_PESOS_CPF_2 = tuple(range(11, 1, -1))
+_PESOS_CNPJ_1 = (5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+_PESOS_CNPJ_2 = (6, 5, 4, 3, 2, 9, 8, 7, 6, 5, 4, 3, 2)
+
+
+def digitos(valor):
+    """Somente os dígitos do valor ('' para None)"""
+    if valor is None:
+        return ''
+    if not isinstance(valor, str):
+        valor = str(valor)
+    if valor.isdigit() and valor.isascii():
+        return valor  # já normalizado (caso mais comum)
+    return _NAO_DIGITOS.sub('', valor)
+
+
+def _digito_verificador(numeros, pesos):
+    resto = sum(map(mul, numeros, pesos)) % 11
+    return 0 if resto < 2 else 11 - resto
+
+
+def _numeros(valor, tamanho):
+    """Dígitos como inteiros, ou None se não tiver o tamanho ou forem todos iguais"""
+    texto = digitos(valor)
+    if len(texto) != tamanho or texto == texto[0] * tamanho:
+        return None
+    return [c - 48 for c in texto.encode('ascii')]
+
+
+def validar_cpf(valor):
+    numeros = _numeros(valor, 11)
+    if numeros is None:
+        return False
+    return (_digito_verificador(numeros, _PESOS_CPF_1) == numeros[9]
+            and _digito_verificador(numeros, _PESOS_CPF_2) == numeros[10])
+
+
+def validar_cnpj(valor):
+    numeros = _numeros(valor, 14)
+    if numeros is None:
+        return False
+    return (_digito_verificador(numeros, _PESOS_CNPJ_1) == numeros[12]
+            and _digito_verificador(numeros, _PESOS_CNPJ_2) == numeros[13])
+
+
+def formatar_cpf(cpf):
+    """XXX.XXX.XXX-XX; devolve o original se não tiver 11 dígitos"""
+    if not cpf:
+        return None
+    d = digitos(cpf)
+    if len(d) != 11:
+        return cpf
+    return f'{d[:3]}.{d[3:6]}.{d[6:9]}-{d[9:]}'
+
+
+def formatar_cnpj(cnpj):
+    """XX.XXX.XXX/XXXX-XX; devolve o original se não tiver 14 dígitos"""
+    if not cnpj:
+        return None
+    d = digitos(cnpj)
+    if len(d) != 14:
+        return cnpj
+    return f'{d[:2]}.{d[2:5]}.{d[5:8]}/{d[8:12]}-{d[12:]}'
+
+
+def formatar_telefone(telefone):
+    """(XX) XXXX-XXXX ou (XX) XXXXX-XXXX; devolve o original nos demais casos"""
+    if not telefone:
+        return None
+    d = digitos(telefone)
+    if len(d) == 10:
+        return f'({d[:2]}) {d[2:6]}-{d[6:]}'
+    if len(d) == 11:
+        return f'({d[:2]}) {d[2:7]}-{d[7:]}'
+    return telefone
+
+
+def formatar_celular(celular):
+    """(XX) XXXXX-XXXX; devolve o original se não tiver 11 dígitos"""
+    if not celular:
+        return None
+    d = digitos(celular)
+    if len(d) != 11:
+        return celular
+    return f'({d[:2]}) {d[2:7]}-{d[7:]}'
+
+
+def formatar_cep(cep):
+    """XXXXX-XXX; devolve o original se não tiver 8 dígitos"""
+    if not cep:
+        return None
+    d = digitos(cep)
+    if len(d) != 8:
+        return cep
+    return f'{d[:5]}-{d[5:]}'
+
+
+# Versões em lote: lista -> lista, na mesma ordem
+
+def digitos_lote(valores):
+    return [digitos(v) for v in valores]
+
+
+def validar_cpf_lote(valores):
+    return [validar_cpf(v) for v in valores]
+
+
+def validar_cnpj_lote(valores):
+    return [validar_cnpj(v) for v in valores]
+
+
+def formatar_cpf_lote(valores):
+    return [formatar_cpf(v) for v in valores]
+
+
+def formatar_cnpj_lote(valores):
+    return [formatar_cnpj(v) for v in valores]
+
+
+def formatar_telefone_lote(valores):
+    return [formatar_telefone(v) for v in valores]
+
+
+def formatar_celular_lote(valores):
+    return [formatar_celular(v) for v in valores]
+
+
+def formatar_cep_lote(valores):
+    return [formatar_cep(v) for v in valores]
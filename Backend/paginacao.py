@@ -0,0 +1,86 @@
+"""
+Paginação por cursor (keyset) - SINDPLAST
+Funções auxiliares para listar tabelas grandes em páginas de custo constante
+"""
+
+import base64
+import json
+
+from sqlalchemy import and_, func, or_
+
+LIMITE_PADRAO = 50
+LIMITE_MAXIMO = 500
+
+
+class CursorInvalido(ValueError):
+    """Cursor recebido não pode ser decodificado ou não corresponde à ordenação"""
+
+
+def ler_limite(valor, padrao=LIMITE_PADRAO, maximo=LIMITE_MAXIMO):
+    """Converte o parâmetro limit da query string, respeitando o máximo"""
+    if valor in (None, ''):
+        return padrao
+    try:
+        limite = int(valor)
+    except (TypeError, ValueError):
+        raise CursorInvalido('Parâmetro limit inválido')
+    return max(1, min(limite, maximo))
+
+
+def codificar_cursor(ordem, valor, id_registro):
+    """Gera um cursor opaco a partir do último registro da página"""
+    payload = json.dumps({'o': ordem, 'v': valor, 'id': id_registro}, separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decodificar_cursor(cursor, ordem):
+    """Retorna (valor, id) do cursor, validando que foi gerado para a mesma ordenação"""
+    try:
+        preenchimento = '=' * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(cursor + preenchimento).decode('utf-8'))
+        if payload['o'] != ordem:
+            raise CursorInvalido('Cursor gerado para outra ordenação')
+        return payload['v'], payload['id']
+    except CursorInvalido:
+        raise
+    except Exception:
+        raise CursorInvalido('Cursor inválido')
+
+
+def expressao_ordem(coluna, coluna_id):
+    """
+    Expressão usada na ordenação. Colunas de texto são envolvidas em COALESCE
+    para que valores nulos tenham posição estável (NULL quebraria a comparação
+    do keyset) e o mesmo comportamento no PostgreSQL e no SQLite.
+    """
+    if coluna is coluna_id:
+        return coluna
+    return func.coalesce(coluna, '')
+
+
+def aplicar_keyset(stmt, expressao, coluna_id, cursor_valor=None, cursor_id=None, descendente=False):
+    """
+    Aplica ORDER BY (expressao, id) e o filtro de continuação do cursor.
+    O id funciona como desempate, tornando a ordenação total e o cursor estável.
+    """
+    if cursor_id is not None:
+        if expressao is coluna_id:
+            condicao = coluna_id < cursor_id if descendente else coluna_id > cursor_id
+        elif descendente:
+            condicao = or_(expressao < cursor_valor, and_(expressao == cursor_valor, coluna_id < cursor_id))
+        else:
+            condicao = or_(expressao > cursor_valor, and_(expressao == cursor_valor, coluna_id > cursor_id))
+        stmt = stmt.where(condicao)
+
+    if expressao is coluna_id:
+        ordem = [coluna_id.desc() if descendente else coluna_id.asc()]
+    elif descendente:
+        ordem = [expressao.desc(), coluna_id.desc()]
+    else:
+        ordem = [expressao.asc(), coluna_id.asc()]
+    return stmt.order_by(*ordem)
+
+
+def escapar_like(valor):
+    """Escapa curingas do LIKE para buscas por prefixo"""
+    return valor.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_')
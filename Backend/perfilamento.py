@@ -0,0 +1,181 @@
+"""
+Perfil de requisições - SINDPLAST
+Mede, por requisição, quantas consultas SQL foram feitas e o tempo gasto em
+cada fase: banco (cursor execute), serialização (hidratação do ORM + to_dict)
+e codificação JSON (jsonify). O resultado vai no cabeçalho Server-Timing e,
+acima dos limites configurados, num log estruturado (uma linha JSON).
+
+Desligado por padrão: sem PROFILING_ENABLED nenhum evento é registrado e
+fase() só verifica o contexto da requisição.
+
+Configuração (app.config):
+    PROFILING_ENABLED          liga a instrumentação
+    PROFILING_SLOW_QUERY_MS    registra consultas acima deste tempo (200)
+    PROFILING_SLOW_REQUEST_MS  registra requisições acima deste tempo (1000)
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+from flask import g, has_request_context, request
+from sqlalchemy import event
+
+# Tamanho máximo do SQL gravado no log (os parâmetros nunca são gravados: CPF, senhas...)
+TAMANHO_MAXIMO_SQL = 1000
+
+logger = logging.getLogger('sindplast.lento')
+
+
+class _Perfil:
+    __slots__ = ('inicio', 'consultas', 'tempo_banco', 'fases', 'mais_lenta', 'tempo_mais_lenta')
+
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.consultas = 0
+        self.tempo_banco = 0.0
+        self.fases = {}
+        self.mais_lenta = None
+        self.tempo_mais_lenta = 0.0
+
+
+def _perfil_atual():
+    if has_request_context():
+        return g.get('_perfil')
+    return None
+
+
+@contextmanager
+def fase(nome):
+    """Soma o tempo do bloco na fase nome da requisição atual (nada faz se desligado)"""
+    perfil = _perfil_atual()
+    if perfil is None:
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        perfil.fases[nome] = perfil.fases.get(nome, 0.0) + time.perf_counter() - inicio
+
+
+def _sql_log(statement):
+    statement = ' '.join(statement.split())
+    return statement[:TAMANHO_MAXIMO_SQL]
+
+
+def _ms(segundos):
+    return round(segundos * 1000, 2)
+
+
+class PerfilRequisicoes:
+
+    def __init__(self):
+        self.app = None
+
+    def init_app(self, app, obter_engine):
+        app.config.setdefault('PROFILING_ENABLED', False)
+        app.config.setdefault('PROFILING_SLOW_QUERY_MS', 200)
+        app.config.setdefault('PROFILING_SLOW_REQUEST_MS', 1000)
+        self.app = app
+        app.extensions['perfil_requisicoes'] = self
+        if not app.config['PROFILING_ENABLED']:
+            return
+
+        self.limite_consulta = app.config['PROFILING_SLOW_QUERY_MS'] / 1000
+        self.limite_requisicao = app.config['PROFILING_SLOW_REQUEST_MS'] / 1000
+        with app.app_context():
+            engine = obter_engine()
+        event.listen(engine, 'before_cursor_execute', self._antes)
+        event.listen(engine, 'after_cursor_execute', self._depois)
+        event.listen(engine, 'handle_error', self._erro)
+        app.before_request(self._inicio)
+        app.after_request(self._server_timing)
+        app.teardown_request(self._fim)
+        app.json = self._json_medido(app)
+
+    @staticmethod
+    def _json_medido(app):
+        """Provider JSON atual com dumps() contado na fase 'json'"""
+        base = type(app.json)
+
+        class ProviderMedido(base):
+            def dumps(self, obj, **kwargs):
+                with fase('json'):
+                    return super().dumps(obj, **kwargs)
+
+        medido = ProviderMedido(app)
+        medido.__dict__.update(app.json.__dict__)  # mantém ajustes feitos na instância
+        return medido
+
+    @staticmethod
+    def _inicio():
+        g._perfil = _Perfil()
+
+    @staticmethod
+    def _antes(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault('inicio_perfil', []).append(time.perf_counter())
+
+    @staticmethod
+    def _erro(contexto):
+        if contexto.connection is not None and contexto.connection.info.get('inicio_perfil'):
+            contexto.connection.info['inicio_perfil'].pop()
+
+    def _depois(self, conn, cursor, statement, parameters, context, executemany):
+        duracao = time.perf_counter() - conn.info['inicio_perfil'].pop()
+        perfil = _perfil_atual()
+        if perfil is not None:
+            perfil.consultas += 1
+            perfil.tempo_banco += duracao
+            if duracao > perfil.tempo_mais_lenta:
+                perfil.tempo_mais_lenta = duracao
+                perfil.mais_lenta = statement
+        if duracao >= self.limite_consulta:
+            self._registrar({
+                'tipo': 'consulta',
+                'endpoint': request.endpoint if has_request_context() else None,
+                'duracaoMs': _ms(duracao),
+                'executemany': executemany,
+                'linhas': cursor.rowcount,
+                'sql': _sql_log(statement),
+            })
+
+    @staticmethod
+    def _server_timing(resposta):
+        perfil = _perfil_atual()
+        if perfil is None:
+            return resposta
+        partes = [f'db;dur={_ms(perfil.tempo_banco)};desc="{perfil.consultas} consultas"']
+        partes += [f'{nome};dur={_ms(tempo)}' for nome, tempo in perfil.fases.items()]
+        # Em respostas em streaming o total cobre só o que rodou antes do envio dos cabeçalhos
+        partes.append(f'total;dur={_ms(time.perf_counter() - perfil.inicio)}')
+        resposta.headers['Server-Timing'] = ', '.join(partes)
+        return resposta
+
+    def _fim(self, erro=None):
+        perfil = g.pop('_perfil', None)
+        if perfil is None:
+            return
+        total = time.perf_counter() - perfil.inicio
+        if total >= self.limite_requisicao:
+            self._registrar({
+                'tipo': 'requisicao',
+                'endpoint': request.endpoint,
+                'metodo': request.method,
+                'caminho': request.path,
+                'duracaoMs': _ms(total),
+                'consultas': perfil.consultas,
+                'bancoMs': _ms(perfil.tempo_banco),
+                'fasesMs': {nome: _ms(tempo) for nome, tempo in perfil.fases.items()},
+                'consultaMaisLentaMs': _ms(perfil.tempo_mais_lenta),
+                'consultaMaisLenta': _sql_log(perfil.mais_lenta) if perfil.mais_lenta else None,
+                'erro': repr(erro) if erro else None,
+            })
+
+    @staticmethod
+    def _registrar(registro):
+        logger.warning(json.dumps(registro, ensure_ascii=False, default=str))
+
+
+perfil_requisicoes = PerfilRequisicoes()
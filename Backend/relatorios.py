@@ -0,0 +1,120 @@
+"""
+Relatórios agrupados - SINDPLAST
+Sócios ativos por empresa: o agrupamento, a contagem por empresa e a ordem
+alfabética dos nomes (collation pt-BR) ficam no banco; a resposta é enviada
+em streaming, empresa por empresa, conforme as linhas chegam do cursor.
+
+Formato da resposta:
+    {"grupos": [{"codEmpresa", "razaoSocial", "total", "socios": [...]}, ...],
+     "totalEmpresas": N, "totalSocios": M}
+"""
+
+import logging
+
+from flask import Response, stream_with_context
+from sqlalchemy import func, select
+
+from serializacao import codificar_json
+from streaming import LINHAS_POR_LOTE
+
+# Collation ICU do PostgreSQL para ordenar nomes como o localeCompare('pt-BR')
+COLLATION_PADRAO = 'pt-BR-x-icu'
+
+logger = logging.getLogger(__name__)
+
+
+def ordenacao_nome(coluna, dialeto, collation=COLLATION_PADRAO):
+    """Coluna com a collation pt-BR no PostgreSQL; nos demais bancos, a ordem padrão"""
+    if collation and dialeto == 'postgresql':
+        return coluna.collate(collation)
+    return coluna
+
+
+def consulta_ativos_por_empresa(modelo, dialeto, collation=COLLATION_PADRAO,
+                                cod_empresa=None, sem_empresa=True):
+    """
+    Linhas (codEmpresa, razaoSocial, total, id, matricula, nome, dataCadastro)
+    dos sócios ativos, ordenadas por empresa e nome. A ordem segue o índice
+    (upper(Status), CodEmpresa, Nome) e o total de cada empresa vem de uma
+    janela. Status é comparado sem diferenciar maiúsculas, como no frontend.
+    """
+    condicoes = [func.upper(modelo.Status) == 'ATIVO']
+    if cod_empresa is not None:
+        condicoes.append(modelo.CodEmpresa == cod_empresa)
+    elif not sem_empresa:
+        condicoes.append(modelo.CodEmpresa.isnot(None))
+    return (
+        select(
+            modelo.CodEmpresa,
+            modelo.RazaoSocial,
+            func.count().over(partition_by=modelo.CodEmpresa).label('total'),
+            modelo.IdSocio,
+            modelo.Matricula,
+            modelo.Nome,
+            modelo.DataCadastro,
+        )
+        .where(*condicoes)
+        .order_by(modelo.CodEmpresa.nulls_last(), ordenacao_nome(modelo.Nome, dialeto, collation), modelo.IdSocio)
+    )
+
+
+def _socio(linha):
+    return {
+        'id': linha.IdSocio,
+        'matricula': linha.Matricula,
+        'nome': linha.Nome,
+        'dataCadastro': linha.DataCadastro.isoformat() if linha.DataCadastro else None,
+    }
+
+
+def gerar_grupos_json(linhas, linhas_por_bloco=LINHAS_POR_LOTE, dumps=codificar_json):
+    """
+    Gera o JSON em blocos de bytes, codificados por dumps (obj -> bytes). O
+    cabeçalho da empresa (com o total) sai na primeira linha do grupo e os
+    sócios em seguida, sem acumular o grupo.
+    """
+    yield b'{"grupos":['
+    bloco = []
+    empresa_atual = object()
+    total_empresas = total_socios = 0
+    try:
+        for linha in linhas:
+            if linha.CodEmpresa != empresa_atual:
+                cabecalho = dumps({
+                    'codEmpresa': linha.CodEmpresa,
+                    'razaoSocial': linha.RazaoSocial,
+                    'total': linha.total,
+                })
+                # Abre o grupo sem o '}' final para acrescentar a lista de sócios
+                bloco.append((b'' if total_empresas == 0 else b']},') + cabecalho[:-1] + b',"socios":[')
+                empresa_atual = linha.CodEmpresa
+                total_empresas += 1
+                primeiro = True
+            bloco.append((b'' if primeiro else b',') + dumps(_socio(linha)))
+            primeiro = False
+            total_socios += 1
+            if len(bloco) >= linhas_por_bloco:
+                yield b''.join(bloco)
+                bloco = []
+    except Exception:
+        # Mesmo tratamento de streaming.py: JSON fica inválido em vez de truncado
+        logger.exception('Erro durante o relatório em streaming')
+        if bloco:
+            yield b''.join(bloco)
+        return
+    if total_empresas:
+        bloco.append(b']}')
+    bloco.append(f'],"totalEmpresas":{total_empresas},"totalSocios":{total_socios}}}'.encode())
+    yield b''.join(bloco)
+
+
+def resposta_grupos_stream(sessao, stmt, linhas_por_lote=LINHAS_POR_LOTE, dumps=codificar_json):
+    """Response em streaming com os grupos das linhas de stmt (yield_per no cursor)"""
+    def gerar():
+        resultado = sessao.execute(stmt.execution_options(yield_per=linhas_por_lote))
+        try:
+            yield from gerar_grupos_json(resultado, linhas_por_lote, dumps)
+        finally:
+            resultado.close()
+
+    return Response(stream_with_context(gerar()), mimetype='application/json')
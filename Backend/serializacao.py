@@ -0,0 +1,189 @@
+"""
+Serialização de modelos - SINDPLAST
+Mapeamento chave JSON -> atributo do modelo, usado para projeções parciais
+(?fields=) com as mesmas conversões de to_dict().
+
+As listagens usam serializador_linhas(): linhas do Core (sem instâncias do
+ORM) convertidas em dicionários com a forma de to_dict() e codificadas por
+codificar_json() com o orjson, que já grava date/datetime no formato
+isoformat(). Sem o orjson instalado, as datas são convertidas em Python e o
+JSON vem do módulo json.
+"""
+
+import json
+
+try:
+    import orjson
+except ImportError:  # dependência opcional: só acelera as listagens
+    orjson = None
+
+# Ordenação de chaves padrão, a mesma do jsonify() (sort_keys do provider do Flask)
+ORDENAR_CHAVES = True
+
+
+def _data(valor):
+    return valor.isoformat() if valor else None
+
+
+def _decimal(valor):
+    return float(valor) if valor else None
+
+
+# chave JSON: (atributo do modelo, conversão)
+CAMPOS_EMPRESA = {
+    'id': ('IdEmpresa', None),
+    'codEmpresa': ('CodEmpresa', None),
+    'cnpj': ('CNPJ', None),
+    'razaoSocial': ('RazaoSocial', None),
+    'nomeFantasia': ('NomeFantasia', None),
+    'endereco': ('Endereco', None),
+    'numero': ('Numero', None),
+    'complemento': ('Complemento', None),
+    'bairro': ('Bairro', None),
+    'cep': ('CEP', None),
+    'cidade': ('Cidade', None),
+    'uf': ('UF', None),
+    'telefone01': ('Telefone01', None),
+    'telefone02': ('Telefone02', None),
+    'fax': ('Fax', None),
+    'celular': ('Celular', None),
+    'whatsapp': ('WhatsApp', None),
+    'instagram': ('Instagram', None),
+    'linkedin': ('Linkedin', None),
+    'nFuncionarios': ('NFuncionarios', None),
+    'dataContribuicao': ('DataContribuicao', _data),
+    'valorContribuicao': ('ValorContribuicao', _decimal),
+    'dataCadastro': ('DataCadastro', _data),
+    'cadastrante': ('Cadastrante', None),
+    'observacao': ('Observacao', None),
+}
+
+CAMPOS_SOCIO = {
+    'id': ('IdSocio', None),
+    'nome': ('Nome', None),
+    'rg': ('RG', None),
+    'emissor': ('Emissor', None),
+    'cpf': ('CPF', None),
+    'nascimento': ('Nascimento', _data),
+    'sexo': ('Sexo', None),
+    'naturalidade': ('Naturalidade', None),
+    'naturalidadeUF': ('NaturalidadeUF', None),
+    'nacionalidade': ('Nacionalidade', None),
+    'estadoCivil': ('EstadoCivil', None),
+    'endereco': ('Endereco', None),
+    'complemento': ('Complemento', None),
+    'bairro': ('Bairro', None),
+    'cep': ('CEP', None),
+    'celular': ('Celular', None),
+    'redeSocial': ('RedeSocial', None),
+    'pai': ('Pai', None),
+    'mae': ('Mae', None),
+    'dataCadastro': ('DataCadastro', _data),
+    'cadastrante': ('Cadastrante', None),
+    'status': ('Status', None),
+    'matricula': ('Matricula', None),
+    'dataMensalidade': ('DataMensalidade', _data),
+    'valorMensalidade': ('ValorMensalidade', _decimal),
+    'dataAdmissao': ('DataAdmissao', _data),
+    'ctps': ('CTPS', None),
+    'funcao': ('Funcao', None),
+    'codEmpresa': ('CodEmpresa', None),
+    'cnpj': ('CNPJ', None),
+    'razaoSocial': ('RazaoSocial', None),
+    'nomeFantasia': ('NomeFantasia', None),
+    'dataDemissao': ('DataDemissao', _data),
+    'motivoDemissao': ('MotivoDemissao', None),
+    'carta': ('Carta', None),
+    'carteira': ('Carteira', None),
+    'ficha': ('Ficha', None),
+    'observacao': ('Observacao', None),
+    'telefone': ('Telefone', None),
+}
+
+
+class CamposInvalidos(ValueError):
+    """Parâmetro fields contém chaves que não existem no recurso"""
+
+
+def ler_campos(valor, campos):
+    """
+    Interpreta ?fields=nome,status. Retorna None quando o parâmetro não foi
+    informado (serialização completa). O 'id' é sempre incluído.
+    """
+    if not valor:
+        return None
+    chaves = [c.strip() for c in valor.split(',') if c.strip()]
+    invalidas = [c for c in chaves if c not in campos]
+    if invalidas:
+        raise CamposInvalidos(f"Campos inválidos: {', '.join(invalidas)}")
+    selecionadas = ['id']
+    for chave in chaves:
+        if chave not in selecionadas:
+            selecionadas.append(chave)
+    return selecionadas
+
+
+def atributos(modelo, chaves, campos):
+    """Atributos do modelo correspondentes às chaves (para load_only)"""
+    return [getattr(modelo, campos[chave][0]) for chave in chaves]
+
+
+def serializador_parcial(chaves, campos):
+    """Retorna uma função que serializa apenas as chaves pedidas de uma instância"""
+    projecao = [(chave, campos[chave][0], campos[chave][1]) for chave in chaves]
+
+    def serializar(obj):
+        resultado = {}
+        for chave, atributo, converter in projecao:
+            valor = getattr(obj, atributo)
+            resultado[chave] = converter(valor) if converter else valor
+        return resultado
+
+    return serializar
+
+
+def serializador_linhas(chaves, campos):
+    """
+    Função que converte uma linha do Core (colunas na ordem de chaves, extras
+    ao final são ignorados) no dicionário de to_dict(). Só as colunas que
+    precisam de conversão passam por uma chamada Python.
+    """
+    conversoes = []
+    for posicao, chave in enumerate(chaves):
+        converter = campos[chave][1]
+        # Decimal fica em Python: to_dict() grava 0 como null
+        if converter is _decimal or (converter is not None and orjson is None):
+            conversoes.append((posicao, chave, converter))
+
+    def serializar(linha):
+        resultado = dict(zip(chaves, linha))
+        for posicao, chave, converter in conversoes:
+            resultado[chave] = converter(linha[posicao])
+        return resultado
+
+    return serializar
+
+
+def projecao_linhas(modelo, campos, fields, extras=()):
+    """
+    Para listagens lidas pelo Core: a partir de ?fields= (None: todos os
+    campos), retorna (colunas para select(), serializador de linhas) sem
+    hidratar instâncias do ORM. extras são colunas lidas mas não serializadas.
+    """
+    chaves = ler_campos(fields, campos) or list(campos)
+    colunas = atributos(modelo, chaves, campos)
+    presentes = {coluna.key for coluna in colunas}
+    colunas += [coluna for coluna in extras if coluna.key not in presentes]
+    return colunas, serializador_linhas(chaves, campos)
+
+
+def codificar_json(obj, ordenar=ORDENAR_CHAVES):
+    """
+    JSON compacto em bytes (orjson quando instalado, senão o json da
+    biblioteca padrão). No app Flask, ordenar vem do sort_keys do provider
+    (ver app.codificar_json_app()). Texto em UTF-8 sem escapes \\uXXXX nos
+    dois casos, como o orjson grava.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if ordenar else 0)
+    return json.dumps(obj, sort_keys=ordenar, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,291 @@
+"""
+Sessões no servidor - SINDPLAST
+Substitui o armazenamento em arquivos do Flask-Session por backends com
+expiração: memória (LRU com TTL) ou tabela SQL com índice na data de expiração.
+A tabela é criada por 'flask --app app init-db' (ou create_sessoes_table.sql),
+nunca em tempo de execução. Uma thread em segundo plano por processo remove
+as sessões expiradas.
+
+Configuração (app.config):
+    SESSION_BACKEND            'sql' (padrão), 'memory' ou 'filesystem' (Flask-Session original)
+    SESSION_MEMORY_MAX         máximo de sessões no backend em memória
+    SESSION_SWEEP_INTERVAL     segundos entre as limpezas de sessões expiradas (0 desativa)
+    SESSION_REFRESH_INTERVAL   segundos mínimos entre renovações da expiração sem alteração
+"""
+
+import logging
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta
+
+from flask.json.tag import TaggedJSONSerializer
+from flask.sessions import SessionInterface, SessionMixin
+from sqlalchemy import Column, DateTime, Index, MetaData, String, Table, Text, delete, insert, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import IntegrityError
+from werkzeug.datastructures import CallbackDict
+
+logger = logging.getLogger(__name__)
+
+metadata = MetaData()
+
+tabela_sessoes = Table(
+    'Sessoes', metadata,
+    Column('IdSessao', String(64), primary_key=True),
+    Column('Dados', Text, nullable=False),
+    Column('ExpiraEm', DateTime, nullable=False),
+    Index('IX_Sessoes_ExpiraEm', 'ExpiraEm'),
+    schema='Sindplast',
+)
+
+
+class ArmazenamentoMemoria:
+    """Sessões em um OrderedDict com TTL; ao atingir o máximo descarta a menos usada"""
+
+    def __init__(self, max_sessoes=10000):
+        self.max_sessoes = max_sessoes
+        self._dados = OrderedDict()
+        self._lock = threading.Lock()
+
+    def obter(self, sid):
+        with self._lock:
+            item = self._dados.get(sid)
+            if item is None:
+                return None
+            expira_em, dados = item
+            if expira_em <= datetime.utcnow():
+                del self._dados[sid]
+                return None
+            self._dados.move_to_end(sid)
+            return dados, expira_em
+
+    def gravar(self, sid, dados, expira_em):
+        with self._lock:
+            self._dados[sid] = (expira_em, dados)
+            self._dados.move_to_end(sid)
+            while len(self._dados) > self.max_sessoes:
+                self._dados.popitem(last=False)
+
+    def remover(self, sid):
+        with self._lock:
+            self._dados.pop(sid, None)
+
+    def limpar_expiradas(self):
+        agora = datetime.utcnow()
+        with self._lock:
+            expiradas = [sid for sid, (expira_em, _) in self._dados.items() if expira_em <= agora]
+            for sid in expiradas:
+                del self._dados[sid]
+        return len(expiradas)
+
+    def __len__(self):
+        return len(self._dados)
+
+
+# INSERT ... ON CONFLICT DO UPDATE por dialeto
+_INSERT_UPSERT = {'postgresql': postgresql.insert, 'sqlite': sqlite.insert}
+
+
+class ArmazenamentoSQL:
+    """Sessões na tabela "Sindplast"."Sessoes"; obter_engine é chamado a cada operação"""
+
+    def __init__(self, obter_engine):
+        self._obter_engine = obter_engine
+
+    def _engine(self):
+        return self._obter_engine()
+
+    def obter(self, sid):
+        with self._engine().connect() as conn:
+            linha = conn.execute(
+                select(tabela_sessoes.c.Dados, tabela_sessoes.c.ExpiraEm)
+                .where(tabela_sessoes.c.IdSessao == sid, tabela_sessoes.c.ExpiraEm > datetime.utcnow())
+            ).first()
+        return (linha.Dados, linha.ExpiraEm) if linha else None
+
+    def gravar(self, sid, dados, expira_em):
+        """Upsert: duas primeiras gravações simultâneas do mesmo sid não colidem na chave primária"""
+        engine = self._engine()
+        valores = {'Dados': dados, 'ExpiraEm': expira_em}
+        inserir = _INSERT_UPSERT.get(engine.dialect.name)
+        if inserir is not None:
+            stmt = inserir(tabela_sessoes).values(IdSessao=sid, **valores)
+            with engine.begin() as conn:
+                conn.execute(stmt.on_conflict_do_update(index_elements=[tabela_sessoes.c.IdSessao], set_=valores))
+            return
+
+        atualizar = update(tabela_sessoes).where(tabela_sessoes.c.IdSessao == sid).values(**valores)
+        try:
+            with engine.begin() as conn:
+                if conn.execute(atualizar).rowcount == 0:
+                    conn.execute(insert(tabela_sessoes).values(IdSessao=sid, **valores))
+        except IntegrityError:
+            # Outra requisição inseriu o mesmo sid entre o UPDATE e o INSERT
+            with engine.begin() as conn:
+                conn.execute(atualizar)
+
+    def remover(self, sid):
+        with self._engine().begin() as conn:
+            conn.execute(delete(tabela_sessoes).where(tabela_sessoes.c.IdSessao == sid))
+
+    def limpar_expiradas(self):
+        with self._engine().begin() as conn:
+            resultado = conn.execute(delete(tabela_sessoes).where(tabela_sessoes.c.ExpiraEm <= datetime.utcnow()))
+        return resultado.rowcount
+
+
+class SessaoServidor(CallbackDict, SessionMixin):
+    # Sempre permanente (expiração controlada pelo servidor); atributo de classe
+    # para não gravar a chave '_permanent' em sessões vazias
+    permanent = True
+
+    def __init__(self, inicial=None, sid=None, expira_em=None, nova=False):
+        def ao_alterar(sessao):
+            sessao.modified = True
+        CallbackDict.__init__(self, inicial, ao_alterar)
+        self.sid = sid
+        self.expira_em = expira_em
+        self.new = nova
+        self.modified = False
+
+
+class InterfaceSessaoServidor(SessionInterface):
+    """SessionInterface que guarda apenas o id no cookie e os dados no armazenamento"""
+
+    serializer = TaggedJSONSerializer()
+    session_class = SessaoServidor
+
+    def __init__(self, armazenamento, intervalo_renovacao=3600):
+        self.armazenamento = armazenamento
+        self.intervalo_renovacao = intervalo_renovacao
+
+    def open_session(self, app, request):
+        sid = request.cookies.get(self.get_cookie_name(app))
+        if sid:
+            try:
+                item = self.armazenamento.obter(sid)
+            except Exception:
+                logger.exception('Erro ao ler sessão')
+                item = None
+            if item is not None:
+                dados, expira_em = item
+                try:
+                    return self.session_class(self.serializer.loads(dados), sid=sid, expira_em=expira_em)
+                except Exception:
+                    logger.warning('Sessão %s com dados inválidos descartada', sid[:8])
+        return self.session_class(sid=secrets.token_urlsafe(32), nova=True)
+
+    def _precisa_renovar(self, app, sessao):
+        if sessao.expira_em is None or not app.config.get('SESSION_REFRESH_EACH_REQUEST', True):
+            return False
+        renovada_em = sessao.expira_em - app.permanent_session_lifetime
+        return datetime.utcnow() - renovada_em >= timedelta(seconds=self.intervalo_renovacao)
+
+    def save_session(self, app, session, response):
+        nome_cookie = self.get_cookie_name(app)
+        dominio = self.get_cookie_domain(app)
+        caminho = self.get_cookie_path(app)
+
+        if not session:
+            if session.modified and not session.new:
+                self.armazenamento.remover(session.sid)
+                response.delete_cookie(nome_cookie, domain=dominio, path=caminho)
+            return
+
+        if not session.modified and not self._precisa_renovar(app, session):
+            return
+
+        expira_em = datetime.utcnow() + app.permanent_session_lifetime
+        self.armazenamento.gravar(session.sid, self.serializer.dumps(dict(session)), expira_em)
+        response.set_cookie(
+            nome_cookie, session.sid,
+            expires=expira_em,
+            httponly=self.get_cookie_httponly(app),
+            domain=dominio,
+            path=caminho,
+            secure=self.get_cookie_secure(app),
+            samesite=self.get_cookie_samesite(app),
+        )
+
+
+class LimpadorSessoes(threading.Thread):
+    """Thread daemon que remove periodicamente as sessões expiradas"""
+
+    def __init__(self, armazenamento, intervalo, contexto=None):
+        super().__init__(name='limpador-sessoes', daemon=True)
+        self.armazenamento = armazenamento
+        self.intervalo = intervalo
+        self.contexto = contexto
+        self._parar = threading.Event()
+
+    def executar_uma_vez(self):
+        inicio = time.perf_counter()
+        if self.contexto is not None:
+            with self.contexto():
+                removidas = self.armazenamento.limpar_expiradas()
+        else:
+            removidas = self.armazenamento.limpar_expiradas()
+        if removidas:
+            logger.info('%s sessões expiradas removidas em %.1f ms', removidas, (time.perf_counter() - inicio) * 1000)
+        return removidas
+
+    def run(self):
+        while not self._parar.wait(self.intervalo):
+            try:
+                self.executar_uma_vez()
+            except Exception:
+                logger.exception('Erro ao limpar sessões expiradas')
+
+    def parar(self):
+        self._parar.set()
+
+
+# Um limpador por processo: create_app() chamado várias vezes (testes,
+# fábricas) não acumula threads. Depois de um fork o objeto herdado não está
+# vivo e um novo é iniciado no worker.
+_limpador_processo = None
+_limpador_lock = threading.Lock()
+
+
+def iniciar_limpador(armazenamento, intervalo, contexto=None):
+    """Inicia o limpador do processo, se ainda não houver um ativo; retorna o limpador ativo"""
+    global _limpador_processo
+    with _limpador_lock:
+        if _limpador_processo is None or not _limpador_processo.is_alive():
+            _limpador_processo = LimpadorSessoes(armazenamento, intervalo, contexto)
+            _limpador_processo.start()
+        return _limpador_processo
+
+
+def init_app(app, obter_engine=None):
+    """
+    Configura a interface de sessão conforme SESSION_BACKEND.
+    obter_engine é necessário para o backend 'sql' (ex.: lambda: db.engine).
+    """
+    backend = app.config.get('SESSION_BACKEND', 'sql')
+
+    if backend == 'filesystem':
+        from flask_session import Session
+        Session(app)
+        return None
+
+    if backend == 'memory':
+        armazenamento = ArmazenamentoMemoria(app.config.get('SESSION_MEMORY_MAX', 10000))
+        contexto = None
+    elif backend == 'sql':
+        if obter_engine is None:
+            raise ValueError('SESSION_BACKEND=sql requer obter_engine')
+        armazenamento = ArmazenamentoSQL(obter_engine)
+        contexto = app.app_context
+    else:
+        raise ValueError(f'SESSION_BACKEND desconhecido: {backend}')
+
+    app.session_interface = InterfaceSessaoServidor(
+        armazenamento, app.config.get('SESSION_REFRESH_INTERVAL', 3600))
+
+    intervalo = app.config.get('SESSION_SWEEP_INTERVAL', 300)
+    if intervalo:
+        app.extensions['limpador_sessoes'] = iniciar_limpador(armazenamento, intervalo, contexto)
+    return armazenamento
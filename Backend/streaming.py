@@ -0,0 +1,77 @@
+"""
+Respostas JSON em streaming - SINDPLAST
+Emite arrays JSON incrementalmente a partir de um cursor do banco, sem montar
+a lista completa de objetos nem a string final em memória.
+"""
+
+import logging
+
+from flask import Response, current_app, stream_with_context
+
+# Linhas buscadas por vez no cursor do servidor (yield_per)
+LINHAS_POR_LOTE = 500
+
+logger = logging.getLogger(__name__)
+
+
+def parametro_ativo(valor):
+    """Interpreta flags da query string (?stream=1, ?stream=true)"""
+    return str(valor).lower() in ('1', 'true', 'sim', 'yes')
+
+
+def gerar_json_array(linhas, serializar, linhas_por_bloco=LINHAS_POR_LOTE, dumps=None):
+    """
+    Gera o array JSON em blocos. Cada bloco contém até linhas_por_bloco itens
+    já codificados. dumps (obj -> bytes, ex.: codificar_json) gera blocos em
+    bytes; sem ele, texto do provider JSON do Flask.
+    """
+    if dumps is None:
+        dumps = current_app.json.dumps
+        abre, virgula, fecha, vazio = '[', ',', ']', ''
+    else:
+        abre, virgula, fecha, vazio = b'[', b',', b']', b''
+    yield abre
+    bloco = []
+    primeiro = True
+    try:
+        for linha in linhas:
+            item = dumps(serializar(linha))
+            if primeiro:
+                bloco.append(item)
+                primeiro = False
+            else:
+                bloco.append(virgula + item)
+            if len(bloco) >= linhas_por_bloco:
+                yield vazio.join(bloco)
+                bloco = []
+    except Exception:
+        # O status 200 já foi enviado; encerra sem fechar o array para que o
+        # cliente perceba o JSON inválido em vez de receber uma lista truncada
+        logger.exception('Erro durante a resposta em streaming')
+        if bloco:
+            yield vazio.join(bloco)
+        return
+    if bloco:
+        yield vazio.join(bloco)
+    yield fecha
+
+
+def resposta_json_stream(sessao, stmt, serializar, linhas_por_lote=LINHAS_POR_LOTE, dumps=None, escalares=None):
+    """
+    Executa stmt com yield_per (cursor do lado do servidor no PostgreSQL) e
+    devolve uma Response que produz o array JSON conforme as linhas chegam.
+    escalares=None entrega instâncias quando o select tem uma só entidade;
+    False entrega sempre as linhas (serializador_linhas).
+    """
+    def gerar():
+        resultado = sessao.execute(stmt.execution_options(yield_per=linhas_por_lote))
+        if escalares is None:
+            linhas = resultado.scalars() if len(resultado.keys()) == 1 else resultado
+        else:
+            linhas = resultado.scalars() if escalares else resultado
+        try:
+            yield from gerar_json_array(linhas, serializar, linhas_por_lote, dumps)
+        finally:
+            resultado.close()
+
+    return Response(stream_with_context(gerar()), mimetype='application/json')
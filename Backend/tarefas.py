@@ -0,0 +1,90 @@
+"""
+Tarefas em segundo plano - SINDPLAST
+Fila com um único worker (as tarefas rodam em ordem, uma de cada vez) para
+trabalhos que não precisam bloquear a resposta, como a propagação dos dados
+da empresa para os sócios. Cada tarefa roda dentro do app context e registra
+métricas por nome: execuções, erros, linhas afetadas e duração.
+
+Configuração (app.config):
+    TAREFAS_SINCRONAS   executa na própria requisição (útil em testes e scripts)
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class FilaTarefas:
+
+    def __init__(self):
+        self.app = None
+        self._executor = None
+        self._metricas = {}
+        self._lock = threading.Lock()
+
+    def init_app(self, app):
+        self.app = app
+        app.extensions['fila_tarefas'] = self
+
+    def _obter_executor(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tarefas')
+            return self._executor
+
+    def agendar(self, nome, funcao, *args, depois=None):
+        """
+        Agenda funcao(*args). A função deve retornar o número de linhas
+        afetadas (ou None). depois(linhas) é chamado ao final, se houver sucesso.
+        Retorna um Future.
+        """
+        if self.app.config.get('TAREFAS_SINCRONAS'):
+            futuro = Future()
+            try:
+                futuro.set_result(self._executar(nome, funcao, args, depois))
+            except Exception as e:
+                futuro.set_exception(e)
+            return futuro
+        return self._obter_executor().submit(self._executar, nome, funcao, args, depois)
+
+    def _executar(self, nome, funcao, args, depois):
+        inicio = time.perf_counter()
+        try:
+            with self.app.app_context():
+                linhas = funcao(*args)
+                if depois is not None:
+                    depois(linhas)
+        except Exception:
+            self._registrar(nome, None, time.perf_counter() - inicio, erro=True)
+            logger.exception('Erro na tarefa %s', nome)
+            raise
+        duracao = time.perf_counter() - inicio
+        self._registrar(nome, linhas, duracao)
+        logger.info('Tarefa %s: %s linhas em %.1f ms', nome, linhas, duracao * 1000)
+        return linhas
+
+    def _registrar(self, nome, linhas, duracao, erro=False):
+        with self._lock:
+            m = self._metricas.setdefault(nome, {
+                'execucoes': 0, 'erros': 0, 'linhasAfetadas': 0,
+                'ultimaExecucao': None, 'ultimaDuracaoMs': None, 'ultimasLinhas': None,
+            })
+            m['execucoes'] += 1
+            m['ultimaExecucao'] = datetime.utcnow().isoformat()
+            m['ultimaDuracaoMs'] = round(duracao * 1000, 2)
+            if erro:
+                m['erros'] += 1
+            else:
+                m['linhasAfetadas'] += linhas or 0
+                m['ultimasLinhas'] = linhas
+
+    def metricas(self):
+        with self._lock:
+            return {nome: dict(valores) for nome, valores in self._metricas.items()}
+
+
+fila_tarefas = FilaTarefas()
@@ -0,0 +1,95 @@
+"""
+Fixtures dos testes - SINDPLAST
+Cada teste usa uma aplicação criada por create_app() sobre um SQLite novo
+(o schema "Sindplast" é anexado por banco.preparar_engine), sem cache de
+respostas e com as tarefas em segundo plano executadas na requisição.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import insert  # noqa: E402
+
+from app import create_app  # noqa: E402
+from autorizacao import cache_permissoes, perfis_usuarios  # noqa: E402
+from busca import indices_busca  # noqa: E402
+from models import Socio, db  # noqa: E402
+
+
+@pytest.fixture
+def url_banco(tmp_path):
+    return f"sqlite:///{tmp_path / 'sindplast.db'}"
+
+
+def configuracao_teste(url, **extras):
+    config = {
+        'TESTING': True,
+        'SQLALCHEMY_DATABASE_URI': url,
+        'SESSION_BACKEND': 'memory',
+        'SESSION_SWEEP_INTERVAL': 0,
+        'RESPONSE_CACHE_ENABLED': False,
+        'DASHBOARD_CACHE_TTL': 0,
+        'TAREFAS_SINCRONAS': True,
+    }
+    config.update(extras)
+    return config
+
+
+def criar_app_teste(url, **extras):
+    """Aplicação com o banco criado por 'flask init-db'"""
+    aplicacao = create_app(configuracao_teste(url, **extras))
+    resultado = aplicacao.test_cli_runner().invoke(args=['init-db'])
+    assert resultado.exit_code == 0, resultado.output
+    # Caches de permissões e índices de busca são do processo: nada de um teste anterior
+    cache_permissoes.invalidar()
+    perfis_usuarios.invalidar()
+    indices_busca.invalidar()
+    return aplicacao
+
+
+@pytest.fixture
+def app(url_banco):
+    aplicacao = criar_app_teste(url_banco)
+    yield aplicacao
+    with aplicacao.app_context():
+        db.engine.dispose()
+
+
+def entrar(cliente, usuario='Admin', senha='Sindplast'):
+    """Login pela API; a sessão fica no cookie do cliente. Retorna o access token"""
+    resposta = cliente.post('/api/auth/login', json={'usuario': usuario, 'senha': senha})
+    assert resposta.status_code == 200, resposta.get_json()
+    return resposta.get_json()['access_token']
+
+
+@pytest.fixture
+def cliente(app):
+    """Cliente autenticado como o Admin de init-db (perfil Administrador)"""
+    cliente = app.test_client()
+    entrar(cliente)
+    return cliente
+
+
+@pytest.fixture
+def cliente_anonimo(app):
+    return app.test_client()
+
+
+SOCIOS = [
+    {'IdSocio': 1, 'Nome': 'ANA SOUZA', 'Status': 'ATIVO', 'CodEmpresa': 'E1', 'Carta': False},
+    {'IdSocio': 2, 'Nome': 'BRUNO LIMA', 'Status': 'ATIVO', 'CodEmpresa': 'E1', 'Carta': False},
+    {'IdSocio': 3, 'Nome': 'CARLA DIAS', 'Status': 'INATIVO', 'CodEmpresa': 'E2', 'Carta': False},
+    {'IdSocio': 4, 'Nome': 'DANIEL ROCHA', 'Status': 'ATIVO', 'CodEmpresa': 'E2', 'Carta': False},
+]
+
+
+@pytest.fixture
+def socios(app):
+    with app.app_context():
+        db.session.execute(insert(Socio.__table__), SOCIOS)
+        db.session.commit()
+    return SOCIOS
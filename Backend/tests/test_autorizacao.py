@@ -0,0 +1,112 @@
+"""requires_permission nas rotas de escrita e invalidação do cache de permissões"""
+
+import pytest
+from sqlalchemy import insert, select
+from werkzeug.security import generate_password_hash
+
+from conftest import criar_app_teste, entrar
+from models import Perfil, Permissoes, Usuario, db
+
+
+@pytest.fixture
+def app(url_banco):
+    # TTL longo: as mudanças só aparecem se as rotas invalidarem o cache
+    aplicacao = criar_app_teste(url_banco, PERMISSOES_CACHE_TTL=3600)
+    with aplicacao.app_context():
+        db.session.execute(insert(Perfil.__table__), [{'IdPerfil': 10, 'Perfil': 'Operador'}])
+        db.session.execute(insert(Permissoes.__table__), [
+            {'IdPermissao': 1, 'Nome': 'Cadastro de sócios', 'Tela': 'socios'},
+            {'IdPermissao': 2, 'Nome': 'empresas', 'Tela': None},
+        ])
+        db.session.execute(insert(Usuario.__table__), {
+            'IdUsuarios': 50, 'Nome': 'OPERADOR', 'Email': 'operador@sindplast.com', 'Usuario': 'operador',
+            'Senha': generate_password_hash('senha'), 'Perfil': 'Operador', 'Cadastrante': 'Admin',
+        })
+        db.session.commit()
+    yield aplicacao
+    with aplicacao.app_context():
+        db.engine.dispose()
+
+
+@pytest.fixture
+def operador(app):
+    """Cliente com o token JWT do operador (sem sessão)"""
+    token = entrar(app.test_client(), 'operador', 'senha')
+    cliente = app.test_client()
+    cliente.environ_base['HTTP_AUTHORIZATION'] = f'Bearer {token}'
+    return cliente
+
+
+def vincular(cliente, id_permissao, ids_perfis):
+    resposta = cliente.put(f'/api/permissoes/{id_permissao}/perfis', json={'ids_perfis': ids_perfis})
+    assert resposta.status_code == 200
+
+
+ESCRITAS = [
+    ('post', '/api/empresas', {}),
+    ('put', '/api/empresas/1', {}),
+    ('delete', '/api/empresas/1', None),
+    ('post', '/api/socios', {}),
+    ('put', '/api/socios/1', {}),
+    ('delete', '/api/socios/1', None),
+    ('patch', '/api/socios/batch', {}),
+    ('post', '/api/socios/batch-delete', {}),
+    ('post', '/api/usuarios', {}),
+    ('put', '/api/usuarios/1', {}),
+    ('delete', '/api/usuarios/1', None),
+    ('post', '/api/perfis', {}),
+    ('put', '/api/perfis/10', {}),
+    ('delete', '/api/perfis/10', None),
+    ('post', '/api/permissoes', {}),
+    ('put', '/api/permissoes/1', {}),
+    ('delete', '/api/permissoes/1', None),
+    ('put', '/api/permissoes/1/perfis', {}),
+]
+
+
+@pytest.mark.parametrize('metodo, rota, corpo', ESCRITAS)
+def test_escritas_exigem_usuario(cliente_anonimo, metodo, rota, corpo):
+    assert getattr(cliente_anonimo, metodo)(rota, json=corpo).status_code == 401
+
+
+@pytest.mark.parametrize('metodo, rota, corpo', ESCRITAS)
+def test_escritas_sem_permissao(operador, metodo, rota, corpo):
+    assert getattr(operador, metodo)(rota, json=corpo).status_code == 403
+
+
+def test_token_invalido(cliente_anonimo):
+    resposta = cliente_anonimo.post('/api/socios/batch-delete', json={'ids': [1]},
+                                    headers={'Authorization': 'Bearer nao-e-um-jwt'})
+    assert resposta.status_code == 401
+
+
+def test_permissao_por_tela_e_por_nome(cliente, operador, socios):
+    vincular(cliente, 1, [10])  # Tela 'socios'
+    assert operador.post('/api/socios/batch-delete', json={'ids': [4]}).status_code == 200
+    assert operador.put('/api/empresas/1', json={}).status_code == 403
+    vincular(cliente, 2, [10])  # Nome 'empresas'
+    assert operador.put('/api/empresas/1', json={}).status_code == 404
+
+
+def test_vinculo_removido_vale_na_hora(cliente, operador, socios):
+    vincular(cliente, 1, [10])
+    assert operador.patch('/api/socios/batch', json={'ids': [1], 'valores': {'status': 'INATIVO'}}).status_code == 200
+    vincular(cliente, 1, [])
+    assert operador.patch('/api/socios/batch', json={'ids': [1], 'valores': {'status': 'ATIVO'}}).status_code == 403
+
+
+def test_troca_de_perfil_do_usuario_vale_na_hora(app, cliente, operador, socios):
+    vincular(cliente, 1, [10])
+    assert operador.post('/api/socios/batch-delete', json={'ids': [4]}).status_code == 200
+    resposta = cliente.put('/api/usuarios/50', json={'Nome': 'OPERADOR', 'Email': 'operador@sindplast.com',
+                                                     'Cadastrante': 'Admin', 'Perfil': 'Consulta'})
+    assert resposta.status_code == 200
+    assert operador.post('/api/socios/batch-delete', json={'ids': [3]}).status_code == 403
+    with app.app_context():
+        assert db.session.scalar(select(Usuario.Perfil).where(Usuario.IdUsuarios == 50)) == 'Consulta'
+
+
+def test_permissoes_do_usuario(cliente, operador):
+    vincular(cliente, 1, [10])
+    dados = operador.get('/api/auth/me/permissoes').get_json()
+    assert (dados['perfil'], dados['permissoes'], dados['telas']) == ('Operador', ['Cadastro de sócios'], ['socios'])
@@ -0,0 +1,101 @@
+"""Busca sem acentos por trigramas: IndiceTrigrama e as rotas /search fora do PostgreSQL"""
+
+import pytest
+from sqlalchemy import insert
+
+from busca import IndiceTrigrama, documento_busca, normalizar, trigramas
+from models import Empresa, Socio, db
+
+
+def test_normalizar_remove_acentos():
+    assert normalizar('JOÃO Çé D\'ÁVILA') == "joao ce d'avila"
+    assert normalizar(None) == ''
+
+
+def test_trigramas_no_formato_do_pg_trgm():
+    assert trigramas('ab') == {'  a', ' ab', 'ab '}
+    assert trigramas('a-b') == {'  a', ' a ', '  b', ' b '}
+
+
+def test_documento_inclui_somente_digitos():
+    assert documento_busca('Zé', '12.345.678-9', None, 'M01') == 'ze 12.345.678-9 123456789 m01 01'
+
+
+@pytest.fixture
+def indice():
+    indice = IndiceTrigrama()
+    for id_registro, nome in [(1, 'JOÃO SILVA'), (2, 'JOANA SOUZA'), (3, 'MARIA JOÃO'), (4, 'PEDRO')]:
+        indice.adicionar(id_registro, documento_busca(nome), {'id': id_registro, 'nome': nome})
+    return indice
+
+
+def test_indice_ignora_acentos_e_caixa(indice):
+    resultados = indice.buscar('joao', chave_desempate=lambda r: r['nome'])
+    # JOANA tem 3 dos 5 trigramas de 'joao': no limiar padrão (0,6)
+    assert [(r['id'], r['score']) for r in resultados] == [(1, 1.0), (3, 1.0), (2, 0.6)]
+    assert indice.buscar('JOÃO', chave_desempate=lambda r: r['nome']) == resultados
+
+
+def test_indice_ranqueia_por_similaridade(indice):
+    resultados = indice.buscar('joana', limiar=0.3)
+    assert resultados[0] == {'id': 2, 'nome': 'JOANA SOUZA', 'score': 1.0}
+    assert all(r['score'] < 1.0 for r in resultados[1:])
+    assert [r['score'] for r in resultados] == sorted((r['score'] for r in resultados), reverse=True)
+
+
+def test_indice_limite_e_termo_vazio(indice):
+    assert len(indice.buscar('joao', limite=1)) == 1
+    assert indice.buscar('--') == []
+    assert indice.buscar('xyz') == []
+
+
+@pytest.fixture
+def cadastro(app):
+    with app.app_context():
+        db.session.execute(insert(Socio.__table__), [
+            {'IdSocio': 1, 'Nome': 'JOÃO DA SILVA', 'CPF': '529.982.247-25', 'Status': 'ATIVO', 'Carta': False},
+            {'IdSocio': 2, 'Nome': 'JOSÉ SOUZA', 'CPF': '11144477735', 'Status': 'ATIVO', 'Carta': False},
+            {'IdSocio': 3, 'Nome': 'MARIA JOAO', 'CPF': None, 'Status': 'INATIVO', 'Carta': False},
+        ])
+        db.session.execute(insert(Empresa.__table__), [
+            {'IdEmpresa': 1, 'CodEmpresa': 'E1', 'RazaoSocial': 'PLÁSTICOS DO SUL LTDA', 'CNPJ': '11.222.333/0001-81',
+             'NomeFantasia': None},
+            {'IdEmpresa': 2, 'CodEmpresa': 'E2', 'RazaoSocial': 'EMBALAGENS NORTE', 'CNPJ': None,
+             'NomeFantasia': 'PLASTNORTE'},
+        ])
+        db.session.commit()
+
+
+def test_busca_socios_sem_acentos(cliente, cadastro):
+    resposta = cliente.get('/api/socios/search?q=joao')
+    assert resposta.status_code == 200
+    dados = resposta.get_json()
+    # Mesmo score: desempate pelo nome
+    assert [s['id'] for s in dados] == [1, 3]
+    assert dados[0] == {'id': 1, 'nome': 'JOÃO DA SILVA', 'cpf': '529.982.247-25', 'rg': None,
+                        'matricula': None, 'status': 'ATIVO', 'razaoSocial': None, 'score': 1.0}
+
+
+def test_busca_socios_por_cpf_sem_pontuacao(cliente, cadastro):
+    assert [s['id'] for s in cliente.get('/api/socios/search?q=52998224725').get_json()] == [1]
+
+
+def test_busca_empresas(cliente, cadastro):
+    assert [e['id'] for e in cliente.get('/api/empresas/search?q=plasticos').get_json()] == [1]
+    assert [e['id'] for e in cliente.get('/api/empresas/search?q=11222333000181').get_json()] == [1]
+    assert [e['id'] for e in cliente.get('/api/empresas/search?q=plastnorte').get_json()] == [2]
+
+
+def test_busca_limite(cliente, cadastro):
+    assert len(cliente.get('/api/socios/search?q=joao&limit=1').get_json()) == 1
+
+
+@pytest.mark.parametrize('termo', ['', 'a', '%20j%20'])
+def test_termo_curto(cliente, cadastro, termo):
+    assert cliente.get(f'/api/socios/search?q={termo}').status_code == 400
+
+
+def test_indice_reconstruido_apos_escrita(cliente, cadastro):
+    assert cliente.get('/api/socios/search?q=joana').get_json() == []
+    assert cliente.put('/api/socios/2', json={'nome': 'JOANA SOUZA'}).status_code == 200
+    assert [s['id'] for s in cliente.get('/api/socios/search?q=joana').get_json()] == [2]
@@ -0,0 +1,72 @@
+"""Cache de respostas das listagens (@em_cache)"""
+
+import pytest
+from sqlalchemy import text, update
+
+from banco import criar_engine
+from cache_respostas import VersoesSQL
+from conftest import criar_app_teste
+from models import Socio, db
+
+
+@pytest.fixture
+def app(url_banco):
+    aplicacao = criar_app_teste(url_banco, RESPONSE_CACHE_ENABLED=True)
+    yield aplicacao
+    with aplicacao.app_context():
+        db.engine.dispose()
+
+
+@pytest.mark.parametrize('stream', ['0', 'false', 'nao', ''])
+def test_stream_desligado_usa_o_cache(cliente, socios, stream):
+    resposta = cliente.get(f'/api/socios?stream={stream}')
+    assert resposta.status_code == 200
+    assert resposta.headers.get('ETag')
+    assert cliente.get(f'/api/socios?stream={stream}', headers={'If-None-Match': resposta.headers['ETag']}).status_code == 304
+
+
+@pytest.mark.parametrize('stream', ['1', 'true'])
+def test_stream_ligado_ignora_o_cache(cliente, socios, stream):
+    resposta = cliente.get(f'/api/socios?stream={stream}')
+    assert resposta.status_code == 200
+    assert 'ETag' not in resposta.headers
+    assert len(resposta.get_json()) == len(socios)
+
+
+def test_escrita_em_outro_worker_invalida_o_cache(app, cliente, url_banco, socios):
+    primeira = cliente.get('/api/socios')
+    etag = primeira.headers['ETag']
+    assert cliente.get('/api/socios', headers={'If-None-Match': etag}).status_code == 304
+
+    # Outro worker: grava e incrementa a versão pelo banco, sem passar por este processo
+    engine = criar_engine(url_banco)
+    with engine.begin() as conn:
+        conn.execute(update(Socio.__table__).where(Socio.__table__.c.IdSocio == 1).values(Nome='ANA NOVA'))
+    VersoesSQL(lambda: engine).incrementar('socios')
+    engine.dispose()
+
+    resposta = cliente.get('/api/socios', headers={'If-None-Match': etag})
+    assert resposta.status_code == 200
+    assert resposta.headers['ETag'] != etag
+    assert resposta.get_json()[0]['nome'] == 'ANA NOVA'
+
+
+def test_escrita_local_registra_a_versao_no_banco(app, cliente, socios):
+    etag = cliente.get('/api/socios').headers['ETag']
+    assert cliente.post('/api/socios/batch-delete', json={'ids': [4]}).status_code == 200
+    with app.app_context():
+        versao = db.session.execute(text('SELECT "Versao" FROM "Sindplast"."VersoesRecursos" '
+                                         'WHERE "Recurso" = \'socios\'')).scalar()
+    assert versao == 1
+    resposta = cliente.get('/api/socios', headers={'If-None-Match': etag})
+    assert resposta.status_code == 200 and len(resposta.get_json()) == 3
+
+
+def test_sem_tabela_de_versoes_responde_sem_cache(app, cliente, socios):
+    with app.app_context():
+        db.session.execute(text('DROP TABLE "Sindplast"."VersoesRecursos"'))
+        db.session.commit()
+    resposta = cliente.get('/api/socios')
+    assert resposta.status_code == 200
+    assert 'ETag' not in resposta.headers
+    assert len(resposta.get_json()) == len(socios)
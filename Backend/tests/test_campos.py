@@ -0,0 +1,82 @@
+"""Projeção ?fields= nas rotas de empresas e sócios: mesma forma de to_dict()"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert
+
+from models import Empresa, Socio, db
+
+CAMPOS_SOCIO = 'nome,nascimento,valorMensalidade,dataCadastro,carta,redeSocial'
+CAMPOS_EMPRESA = 'razaoSocial,dataContribuicao,valorContribuicao,dataCadastro,nFuncionarios'
+
+
+@pytest.fixture
+def cadastro(app):
+    with app.app_context():
+        db.session.execute(insert(Empresa), [
+            {'IdEmpresa': 1, 'CodEmpresa': 'E1', 'RazaoSocial': 'PLÁSTICOS UM LTDA', 'NFuncionarios': 12,
+             'DataContribuicao': date(2024, 3, 10), 'ValorContribuicao': Decimal('1234.50'),
+             'DataCadastro': datetime(2024, 1, 2, 8, 30, 15)},
+            {'IdEmpresa': 2, 'CodEmpresa': 'E2', 'RazaoSocial': 'SEM DATAS', 'ValorContribuicao': Decimal('0')},
+        ])
+        db.session.execute(insert(Socio), [
+            {'IdSocio': 1, 'Nome': 'JOÃO ÇÉSAR', 'Nascimento': date(1980, 5, 17), 'RedeSocial': '@joao',
+             'ValorMensalidade': Decimal('45.90'), 'DataCadastro': datetime(2023, 12, 31, 23, 59, 59),
+             'Carta': True, 'Status': 'ATIVO'},
+            {'IdSocio': 2, 'Nome': 'MARIA', 'ValorMensalidade': Decimal('0'), 'Carta': False},
+        ])
+        db.session.commit()
+
+
+def esperado(app, modelo, ids, campos=None):
+    with app.app_context():
+        completos = [db.session.get(modelo, i).to_dict() for i in ids]
+    if campos is None:
+        return completos
+    chaves = ['id'] + campos.split(',')
+    return [{chave: item[chave] for chave in chaves} for item in completos]
+
+
+@pytest.mark.parametrize('rota, modelo, campos', [
+    ('/api/socios', Socio, None),
+    ('/api/socios', Socio, CAMPOS_SOCIO),
+    ('/api/empresas', Empresa, None),
+    ('/api/empresas', Empresa, CAMPOS_EMPRESA),
+])
+def test_listagem_igual_a_to_dict(app, cliente, cadastro, rota, modelo, campos):
+    query = {'fields': campos} if campos else {}
+    previsto = esperado(app, modelo, [1, 2], campos)
+    assert cliente.get(rota, query_string=query).get_json() == previsto
+    assert cliente.get(rota, query_string=dict(query, stream=1)).get_json() == previsto
+
+
+def test_listagem_paginada_igual_a_to_dict(app, cliente, cadastro):
+    resposta = cliente.get('/api/socios', query_string={'fields': CAMPOS_SOCIO, 'limit': 5}).get_json()
+    assert resposta['items'] == esperado(app, Socio, [1, 2], CAMPOS_SOCIO)
+
+
+@pytest.mark.parametrize('rota, modelo, campos', [
+    ('/api/socios/1', Socio, CAMPOS_SOCIO),
+    ('/api/empresas/1', Empresa, CAMPOS_EMPRESA),
+])
+def test_registro_igual_a_to_dict(app, cliente, cadastro, rota, modelo, campos):
+    assert cliente.get(rota, query_string={'fields': campos}).get_json() == esperado(app, modelo, [1], campos)[0]
+    assert cliente.get(rota).get_json() == esperado(app, modelo, [1])[0]
+
+
+def test_id_sempre_incluido_e_sem_repeticao(cliente, cadastro):
+    dados = cliente.get('/api/socios?fields=nome,,nome,%20status').get_json()
+    assert [list(item) for item in dados] == [['id', 'nome', 'status']] * 2
+
+
+@pytest.mark.parametrize('rota', [
+    '/api/socios', '/api/socios?limit=5', '/api/socios/1', '/api/socios/export',
+    '/api/empresas', '/api/empresas/1', '/api/empresas/export',
+])
+def test_campo_desconhecido(cliente, cadastro, rota):
+    separador = '&' if '?' in rota else '?'
+    resposta = cliente.get(f'{rota}{separador}fields=nome,senha')
+    assert resposta.status_code == 400
+    assert 'senha' in resposta.get_json()['message']
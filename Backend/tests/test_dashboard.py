@@ -0,0 +1,73 @@
+"""Agregados de /api/dashboard/stats (uma consulta UNION ALL) e o cache por TTL"""
+
+import pytest
+from sqlalchemy import insert
+
+import app as modulo_app
+from models import Empresa, Socio, Usuario, db
+
+
+@pytest.fixture
+def cadastro(app, socios):
+    with app.app_context():
+        db.session.execute(insert(Usuario.__table__), {
+            'IdUsuarios': 50, 'Nome': 'OPERADOR', 'Usuario': 'operador', 'Senha': 'x',
+            'Perfil': 'Operador', 'Cadastrante': 'Admin',
+        })
+        db.session.execute(insert(Socio.__table__), [
+            {'IdSocio': 5, 'Nome': 'EVA', 'Status': None, 'Carta': False},
+            {'IdSocio': 6, 'Nome': 'FABIO', 'Status': 'INATIVO', 'Carta': False},
+        ])
+        db.session.execute(insert(Empresa.__table__), [
+            {'IdEmpresa': 1, 'CodEmpresa': 'E1', 'NomeFantasia': 'UM', 'NFuncionarios': 120},
+            {'IdEmpresa': 2, 'CodEmpresa': 'E2', 'NomeFantasia': 'DOIS', 'NFuncionarios': None},
+            {'IdEmpresa': 3, 'CodEmpresa': 'E3', 'NomeFantasia': None, 'NFuncionarios': 7},
+        ])
+        db.session.commit()
+
+
+def ordenados(itens):
+    return sorted(itens, key=lambda item: (item['name'] or '', item['value'] or 0))
+
+
+def test_agregados(cliente, cadastro):
+    resposta = cliente.get('/api/dashboard/stats')
+    assert resposta.status_code == 200
+    dados = resposta.get_json()
+    assert dados['totais'] == {'usuarios': 2, 'socios': 6, 'empresas': 3}
+    assert ordenados(dados['usuariosPorPerfil']) == [
+        {'name': 'Administrador', 'value': 1},
+        {'name': 'Operador', 'value': 1},
+    ]
+    assert ordenados(dados['sociosPorStatus']) == [
+        {'name': None, 'value': 1},
+        {'name': 'ATIVO', 'value': 3},
+        {'name': 'INATIVO', 'value': 2},
+    ]
+    assert ordenados(dados['empresasPorFuncionarios']) == [
+        {'name': None, 'value': 7},
+        {'name': 'DOIS', 'value': None},
+        {'name': 'UM', 'value': 120},
+    ]
+    assert dados['atualizadoEm']
+
+
+def test_banco_sem_cadastros(cliente):
+    dados = cliente.get('/api/dashboard/stats').get_json()
+    # Apenas o usuário Admin criado pelo init-db
+    assert dados['totais'] == {'usuarios': 1, 'socios': 0, 'empresas': 0}
+    assert dados['sociosPorStatus'] == [] and dados['empresasPorFuncionarios'] == []
+
+
+def test_cache_por_ttl(app, cliente, cadastro, monkeypatch):
+    monkeypatch.setitem(app.config, 'DASHBOARD_CACHE_TTL', 30)
+    monkeypatch.setattr(modulo_app, '_cache_dashboard', {'dados': None, 'expira_em': 0.0})
+    primeira = cliente.get('/api/dashboard/stats')
+    assert primeira.headers['Cache-Control'] == 'private, max-age=30'
+    with app.app_context():
+        db.session.execute(insert(Socio.__table__), {'IdSocio': 7, 'Nome': 'GIL', 'Carta': False})
+        db.session.commit()
+    # Dentro do TTL a resposta vem do cache, sem consultar o banco
+    assert cliente.get('/api/dashboard/stats').get_json() == primeira.get_json()
+    modulo_app._cache_dashboard['expira_em'] = 0.0
+    assert cliente.get('/api/dashboard/stats').get_json()['totais']['socios'] == 7
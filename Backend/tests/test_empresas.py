@@ -0,0 +1,73 @@
+"""Código da empresa (CodEmpresa) e propagação para os sócios"""
+
+import pytest
+from sqlalchemy import insert, select, text
+from sqlalchemy.exc import IntegrityError
+
+from app import propagar_empresa_socios
+from models import Empresa, Socio, db
+
+
+@pytest.fixture
+def empresas(app):
+    with app.app_context():
+        db.session.execute(insert(Empresa.__table__), [
+            {'IdEmpresa': 1, 'CodEmpresa': 'E1', 'RazaoSocial': 'PLASTICOS UM LTDA'},
+            {'IdEmpresa': 2, 'CodEmpresa': 'E2', 'RazaoSocial': 'PLASTICOS DOIS LTDA'},
+        ])
+        db.session.commit()
+
+
+def socios_por_empresa(app):
+    with app.app_context():
+        linhas = db.session.execute(select(Socio.IdSocio, Socio.CodEmpresa, Socio.RazaoSocial)).all()
+    return {linha.IdSocio: (linha.CodEmpresa, linha.RazaoSocial) for linha in linhas}
+
+
+def test_codigo_unico_no_banco(app, empresas):
+    with app.app_context():
+        with pytest.raises(IntegrityError):
+            db.session.execute(insert(Empresa.__table__), {'CodEmpresa': 'E1'})
+        db.session.rollback()
+
+
+def test_cria_com_codigo_repetido(cliente, empresas):
+    resposta = cliente.post('/api/empresas', json={'codEmpresa': 'E1', 'razaoSocial': 'OUTRA'})
+    assert resposta.status_code == 400
+
+
+def test_atualiza_para_codigo_de_outra_empresa(cliente, empresas):
+    assert cliente.put('/api/empresas/1', json={'codEmpresa': 'E2'}).status_code == 400
+
+
+def test_troca_de_codigo_leva_os_socios(app, cliente, empresas, socios):
+    resposta = cliente.put('/api/empresas/1', json={'codEmpresa': 'E9', 'razaoSocial': 'PLASTICOS NOVO LTDA'})
+    assert resposta.status_code == 200
+    assert socios_por_empresa(app) == {
+        1: ('E9', 'PLASTICOS NOVO LTDA'),
+        2: ('E9', 'PLASTICOS NOVO LTDA'),
+        3: ('E2', None),
+        4: ('E2', None),
+    }
+
+
+def test_codigo_vazio_com_socios(app, cliente, empresas, socios):
+    assert cliente.put('/api/empresas/1', json={'codEmpresa': ''}).status_code == 400
+    with app.app_context():
+        assert db.session.get(Empresa, 1).CodEmpresa == 'E1'
+    assert socios_por_empresa(app)[1][0] == 'E1'
+
+
+def test_propagacao_ignora_codigo_repetido(app, empresas, socios):
+    # Banco antigo, ainda sem UX_Empresas_CodEmpresa
+    with app.app_context():
+        db.session.execute(text('DROP INDEX "Sindplast"."UX_Empresas_CodEmpresa"'))
+        db.session.execute(insert(Empresa.__table__), {'CodEmpresa': 'E2', 'RazaoSocial': 'DUPLICADA'})
+        db.session.commit()
+        propagar_empresa_socios()
+    assert socios_por_empresa(app) == {
+        1: ('E1', 'PLASTICOS UM LTDA'),
+        2: ('E1', 'PLASTICOS UM LTDA'),
+        3: ('E2', None),
+        4: ('E2', None),
+    }
@@ -0,0 +1,128 @@
+"""Exportação CSV/XLSX (/api/socios/export, /api/empresas/export)"""
+
+import csv
+import io
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import insert, select, update
+
+from exportacao import resposta_csv
+from models import Empresa, Socio, db
+from serializacao import CAMPOS_SOCIO
+
+FORMULAS = ['=HYPERLINK("http://x","y")', '+5+5', '-2+3', '@SUM(A1)', '\tTAB', '\rCR']
+
+
+def ler_csv(resposta):
+    texto = resposta.get_data(as_text=True)
+    assert texto.startswith('﻿')
+    return list(csv.reader(io.StringIO(texto[1:]), delimiter=';'))
+
+
+@pytest.fixture
+def socios_formula(app, socios):
+    with app.app_context():
+        for id_socio, texto in zip((1, 2, 3, 4), FORMULAS):
+            db.session.execute(update(Socio).where(Socio.IdSocio == id_socio).values(Observacao=texto))
+        db.session.execute(update(Socio).where(Socio.IdSocio == 1).values(Nome=FORMULAS[4]))
+        db.session.commit()
+
+
+def test_csv_neutraliza_formulas(cliente, socios_formula):
+    linhas = ler_csv(cliente.get('/api/socios/export?fields=id,nome,observacao'))
+    assert linhas[0] == ['id', 'nome', 'observacao']
+    assert linhas[1:] == [
+        ['1', "'\tTAB", "'" + FORMULAS[0]],
+        ['2', 'BRUNO LIMA', "'+5+5"],
+        ['3', 'CARLA DIAS', "'-2+3"],
+        ['4', 'DANIEL ROCHA', "'@SUM(A1)"],
+    ]
+
+
+def test_xlsx_grava_formulas_como_texto(cliente, socios_formula):
+    openpyxl = pytest.importorskip('openpyxl')
+    resposta = cliente.get('/api/socios/export?format=xlsx&fields=id,observacao')
+    aba = openpyxl.load_workbook(io.BytesIO(resposta.data)).active
+    celula = aba['B2']
+    assert (celula.value, celula.data_type) == (FORMULAS[0], 's')
+
+
+@pytest.fixture
+def socios_completos(app, socios):
+    with app.app_context():
+        db.session.execute(update(Socio).where(Socio.IdSocio == 1).values(
+            Nome='ANA "NINA"; SOUZA', Nascimento=date(1980, 5, 17), ValorMensalidade=Decimal('1234.50'),
+            DataCadastro=datetime(2024, 1, 2, 8, 30, 15), Carta=True, Observacao='linha 1\nlinha 2'))
+        db.session.execute(update(Socio).where(Socio.IdSocio == 2).values(
+            Nome='BRUNO LIMA ÇÃO', ValorMensalidade=Decimal('-12.05')))
+        db.session.execute(insert(Empresa), [
+            {'IdEmpresa': 1, 'CodEmpresa': 'E1', 'RazaoSocial': 'PLÁSTICOS UM', 'ValorContribuicao': Decimal('99.9'),
+             'DataContribuicao': date(2024, 3, 10)},
+        ])
+        db.session.commit()
+
+
+def test_csv_conteudo(cliente, socios_completos):
+    resposta = cliente.get('/api/socios/export?fields=nome,nascimento,valorMensalidade,dataCadastro,carta,'
+                           'observacao,codEmpresa')
+    assert resposta.status_code == 200
+    assert resposta.mimetype == 'text/csv'
+    assert resposta.headers['Content-Disposition'] == 'attachment; filename="socios.csv"'
+    texto = resposta.get_data(as_text=True)
+    # Separador ';', campos com ';', aspas ou quebra de linha entre aspas e linhas terminadas em CRLF
+    assert texto.split('\r\n')[1] == (
+        '1;"ANA ""NINA""; SOUZA";1980-05-17;1234,50;2024-01-02T08:30:15;Sim;"linha 1\nlinha 2";E1')
+    assert ler_csv(resposta)[1:3] == [
+        ['1', 'ANA "NINA"; SOUZA', '1980-05-17', '1234,50', '2024-01-02T08:30:15', 'Sim', 'linha 1\nlinha 2', 'E1'],
+        ['2', 'BRUNO LIMA ÇÃO', '', '-12,05', '', 'Não', '', 'E1'],
+    ]
+
+
+def test_csv_todos_os_campos(cliente, socios_completos):
+    linhas = ler_csv(cliente.get('/api/socios/export'))
+    assert linhas[0] == list(CAMPOS_SOCIO)
+    assert len(linhas) == 5 and all(len(linha) == len(CAMPOS_SOCIO) for linha in linhas)
+
+
+def test_csv_filtros_e_ordem(cliente, socios_completos):
+    linhas = ler_csv(cliente.get('/api/socios/export?fields=id&status=ativo&ordem=-nome'))
+    assert linhas == [['id'], ['4'], ['2'], ['1']]
+
+
+def test_csv_empresas(cliente, socios_completos):
+    linhas = ler_csv(cliente.get('/api/empresas/export?fields=razaoSocial,valorContribuicao,dataContribuicao'))
+    assert linhas == [['id', 'razaoSocial', 'valorContribuicao', 'dataContribuicao'],
+                      ['1', 'PLÁSTICOS UM', '99,90', '2024-03-10']]
+
+
+def test_csv_em_lotes(app, socios_completos):
+    with app.test_request_context():
+        stmt = select(Socio.IdSocio, Socio.Nome).order_by(Socio.IdSocio)
+        partes = list(resposta_csv(db.session, stmt, ['id', 'nome'], 'socios', linhas_por_lote=1).response)
+    # Cabeçalho, uma parte por linha e o restante (vazio) ao final
+    assert len(partes) == 6
+    assert ''.join(partes).split('\r\n')[1:3] == ['1;"ANA ""NINA""; SOUZA"', '2;BRUNO LIMA ÇÃO']
+
+
+@pytest.mark.parametrize('rota', ['/api/socios/export?format=pdf', '/api/empresas/export?format=json'])
+def test_formato_invalido(cliente, socios_completos, rota):
+    resposta = cliente.get(rota)
+    assert resposta.status_code == 400
+    assert 'Formato inválido' in resposta.get_json()['message']
+
+
+def test_xlsx_conteudo(cliente, socios_completos):
+    openpyxl = pytest.importorskip('openpyxl')
+    resposta = cliente.get('/api/socios/export?format=xlsx&fields=nome,nascimento,valorMensalidade,carta')
+    assert resposta.status_code == 200
+    assert resposta.headers['Content-Disposition'].startswith('attachment; filename=socios.xlsx')
+    aba = openpyxl.load_workbook(io.BytesIO(resposta.data)).active
+    linhas = list(aba.iter_rows(values_only=True))
+    assert aba.title == 'socios'
+    assert linhas[0] == ('id', 'nome', 'nascimento', 'valorMensalidade', 'carta')
+    # Tipos nativos da planilha: data, número e booleano (a vírgula decimal fica a cargo do Excel)
+    assert linhas[1] == (1, 'ANA "NINA"; SOUZA', datetime(1980, 5, 17), 1234.5, True)
+    assert linhas[2] == (2, 'BRUNO LIMA ÇÃO', None, -12.05, False)
+    assert len(linhas) == 5
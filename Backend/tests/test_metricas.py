@@ -0,0 +1,15 @@
+"""GET /metrics (formato texto do Prometheus)"""
+
+import pytest
+
+pytest.importorskip('prometheus_client')
+
+from prometheus_client import CONTENT_TYPE_LATEST  # noqa: E402
+
+
+def test_content_type(cliente):
+    cliente.get('/api/status')
+    resposta = cliente.get('/metrics')
+    assert resposta.status_code == 200
+    assert resposta.headers['Content-Type'] == CONTENT_TYPE_LATEST
+    assert resposta.headers['Content-Type'].count('charset') == 1
@@ -0,0 +1,76 @@
+"""Upsert da migração de empresas (Scripts/Sindplast_Migracao_Empresas.py) e o CodEmpresa único"""
+
+import os
+import sys
+
+import pytest
+from sqlalchemy import insert, select
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Scripts'))
+
+import Sindplast_Migracao_Empresas as migracao  # noqa: E402
+from models import Empresa, Socio, db  # noqa: E402
+from transformacao import transformar_empresa  # noqa: E402
+
+
+def legado(codigo, cnpj, nome):
+    return transformar_empresa({'ECODIG': codigo, 'ECGC': cnpj, 'ENOME': nome})
+
+
+@pytest.fixture
+def empresas(app):
+    with app.app_context():
+        with db.engine.begin() as conn:
+            migracao.upsert_lote(conn, [legado('E1', '11222333000181', 'UM'), legado('E2', '44555666000199', 'DOIS')])
+
+
+def gravar(app, empresas_legado):
+    with app.app_context():
+        with db.engine.begin() as conn:
+            return migracao.upsert_lote(conn, empresas_legado)
+
+
+def estado(app):
+    with app.app_context():
+        empresas = dict(db.session.execute(select(Empresa.CodEmpresa, Empresa.RazaoSocial)).all())
+        socios = dict(db.session.execute(select(Socio.IdSocio, Socio.CodEmpresa)).all())
+    return empresas, socios
+
+
+def test_codigo_de_outra_empresa_vira_conflito(app, empresas, socios):
+    # CNPJ novo com o código de E1 e, no mesmo lote, uma empresa válida
+    resultado = gravar(app, [legado('E1', '77888999000155', 'OUTRA'), legado('E3', '12345678000195', 'TRES')])
+    inseridas, atualizadas, inalteradas, repetidas, conflitos, movidos = resultado
+    assert (inseridas, atualizadas, inalteradas, movidos) == (1, 0, 0, 0)
+    assert [c['CodEmpresa'] for c in conflitos] == ['E1']
+    assert estado(app)[0] == {'E1': 'UM', 'E2': 'DOIS', 'E3': 'TRES'}
+
+
+def test_codigo_repetido_no_lote(app, empresas):
+    resultado = gravar(app, [legado('E5', '12345678000195', 'CINCO'), legado('E5', '98765432000110', 'OUTRA')])
+    assert resultado[0] == 1
+    assert [c['RazaoSocial'] for c in resultado[4]] == ['OUTRA']
+
+
+def test_troca_de_codigo_leva_os_socios(app, empresas, socios):
+    resultado = gravar(app, [legado('E9', '11222333000181', 'UM')])
+    assert resultado[1] == 1 and resultado[5] == 2
+    empresas, socios_atuais = estado(app)
+    assert empresas == {'E9': 'UM', 'E2': 'DOIS'}
+    assert socios_atuais == {1: 'E9', 2: 'E9', 3: 'E2', 4: 'E2'}
+
+
+def test_troca_para_codigo_em_uso(app, empresas, socios):
+    resultado = gravar(app, [legado('E2', '11222333000181', 'UM')])
+    assert (resultado[1], len(resultado[4]), resultado[5]) == (0, 1, 0)
+    assert estado(app)[1] == {1: 'E1', 2: 'E1', 3: 'E2', 4: 'E2'}
+
+
+def test_codigo_vazio_com_socios(app, empresas, socios):
+    resultado = gravar(app, [legado('', '11222333000181', 'UM')])
+    assert len(resultado[4]) == 1
+    assert 'E1' in estado(app)[0]
+
+
+def test_reexecucao_sem_alteracoes(app, empresas):
+    assert gravar(app, [legado('E1', '11222333000181', 'UM')])[:3] == (0, 0, 1)
@@ -0,0 +1,25 @@
+"""normalizacao.py: dígitos, máscaras e dígitos verificadores"""
+
+import pytest
+
+from normalizacao import digitos, formatar_cnpj, formatar_cpf, validar_cnpj, validar_cpf
+
+
+@pytest.mark.parametrize('valor, esperado', [
+    (None, ''),
+    (12345, '12345'),
+    ('123.456.789-09', '12345678909'),
+    ('(92) 9 8888-7777', '92988887777'),
+    ('٣12x', '12'),  # dígitos de outros alfabetos são descartados
+    ('sem dígitos', ''),
+])
+def test_digitos(valor, esperado):
+    assert digitos(valor) == esperado
+
+
+def test_documentos():
+    assert validar_cpf('529.982.247-25') and not validar_cpf('529.982.247-24')
+    assert not validar_cpf('111.111.111-11')
+    assert validar_cnpj('11.222.333/0001-81') and not validar_cnpj('11.222.333/0001-82')
+    assert formatar_cpf('52998224725') == '529.982.247-25'
+    assert formatar_cnpj('11222333000181') == '11.222.333/0001-81'
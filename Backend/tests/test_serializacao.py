@@ -0,0 +1,71 @@
+"""codificar_json() (orjson ou json da biblioteca padrão) gera os mesmos bytes que jsonify()"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+import pytest
+from flask import jsonify
+from sqlalchemy import insert, select
+
+import serializacao
+from app import codificar_json_app
+from models import Socio, db
+from serializacao import CAMPOS_SOCIO, codificar_json, projecao_linhas
+
+CARGA = [
+    {'id': 1, 'nome': 'JOÃO D\'ÁVILA "Zé"', 'obs': 'linha\ttab fim </script>', 'valor': 45.9,
+     'grande': 99999999.99, 'ativo': True, 'nada': None, 'lista': [1, 'ç', {'b': 2, 'a': 1}]},
+    {'id': 2, 'nome': 'MARIA', 'emoji': '\U0001F600', 'zero': 0, 'negativo': -0.5},
+]
+
+
+@pytest.fixture(params=['orjson', 'json'])
+def codificador(request, monkeypatch):
+    if request.param == 'orjson':
+        if serializacao.orjson is None:
+            pytest.skip('orjson não instalado')
+    else:
+        monkeypatch.setattr(serializacao, 'orjson', None)
+    return request.param
+
+
+def test_mesmos_bytes_que_jsonify(app, codificador):
+    with app.test_request_context():
+        # jsonify() acrescenta uma quebra de linha ao final
+        assert jsonify(CARGA).get_data() == codificar_json_app(CARGA) + b'\n'
+
+
+def test_orjson_e_json_iguais(monkeypatch):
+    if serializacao.orjson is None:
+        pytest.skip('orjson não instalado')
+    rapidos = [codificar_json(CARGA), codificar_json(CARGA, ordenar=False)]
+    monkeypatch.setattr(serializacao, 'orjson', None)
+    assert [codificar_json(CARGA), codificar_json(CARGA, ordenar=False)] == rapidos
+
+
+@pytest.fixture
+def socios_variados(app):
+    with app.app_context():
+        db.session.execute(insert(Socio), [
+            {'IdSocio': 1, 'Nome': 'JOÃO ÇÉSAR', 'Nascimento': date(1980, 5, 17), 'Carta': True,
+             'ValorMensalidade': Decimal('45.90'), 'DataCadastro': datetime(2023, 12, 31, 23, 59, 59, 123456)},
+            {'IdSocio': 2, 'Nome': 'MARIA', 'ValorMensalidade': Decimal('0'), 'Observacao': 'a\nb'},
+        ])
+        db.session.commit()
+
+
+def test_linhas_do_core_iguais_a_to_dict(app, socios_variados, codificador):
+    with app.test_request_context():
+        colunas, serializar = projecao_linhas(Socio, CAMPOS_SOCIO, None)
+        linhas = db.session.execute(select(*colunas).order_by(Socio.IdSocio))
+        rapido = codificar_json_app([serializar(linha) for linha in linhas])
+        completos = [socio.to_dict() for socio in db.session.scalars(select(Socio).order_by(Socio.IdSocio))]
+        assert rapido + b'\n' == jsonify(completos).get_data()
+
+
+def test_rota_igual_a_jsonify(app, cliente, socios_variados, codificador):
+    with app.test_request_context():
+        completos = [socio.to_dict() for socio in db.session.scalars(select(Socio).order_by(Socio.IdSocio))]
+        esperado = jsonify(completos).get_data().rstrip(b'\n')
+    assert cliente.get('/api/socios').get_data() == esperado
+    assert cliente.get('/api/socios?stream=1').get_data() == esperado
@@ -0,0 +1,74 @@
+"""Sessões no servidor (sessoes.py)"""
+
+import threading
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.exc import OperationalError
+
+import sessoes
+from app import create_app
+from banco import criar_engine
+from conftest import configuracao_teste
+from models import db
+
+
+@pytest.fixture
+def armazenamento(app):
+    with app.app_context():
+        engine = db.engine
+    return sessoes.ArmazenamentoSQL(lambda: engine)
+
+
+def test_gravar_insere_e_atualiza(armazenamento):
+    expira_em = datetime.utcnow() + timedelta(hours=1)
+    armazenamento.gravar('sid-1', '{"a": 1}', expira_em)
+    armazenamento.gravar('sid-1', '{"a": 2}', expira_em)
+    assert armazenamento.obter('sid-1')[0] == '{"a": 2}'
+
+
+def test_primeiras_gravacoes_simultaneas(armazenamento):
+    expira_em = datetime.utcnow() + timedelta(hours=1)
+    erros = []
+    barreira = threading.Barrier(8)
+
+    def gravar(n):
+        barreira.wait()
+        try:
+            armazenamento.gravar('sid-concorrente', f'{{"n": {n}}}', expira_em)
+        except Exception as e:  # noqa: BLE001
+            erros.append(e)
+
+    threads = [threading.Thread(target=gravar, args=(n,)) for n in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert erros == []
+    assert armazenamento.obter('sid-concorrente') is not None
+
+
+def test_nao_cria_tabela_em_execucao(url_banco):
+    engine = criar_engine(url_banco)
+    armazenamento = sessoes.ArmazenamentoSQL(lambda: engine)
+    with pytest.raises(OperationalError):
+        armazenamento.obter('sid')
+    assert not inspect(engine).has_table('Sessoes', schema='Sindplast')
+    engine.dispose()
+
+
+def test_sessao_sql_apos_init_db(url_banco):
+    app = create_app(configuracao_teste(url_banco, SESSION_BACKEND='sql'))
+    assert app.test_cli_runner().invoke(args=['init-db']).exit_code == 0
+    cliente = app.test_client()
+    resposta = cliente.post('/api/auth/login', json={'usuario': 'Admin', 'senha': 'Sindplast'})
+    assert resposta.status_code == 200
+    assert cliente.get('/api/auth/me').status_code == 200
+
+
+def test_um_limpador_por_processo(url_banco):
+    apps = [create_app(configuracao_teste(url_banco, SESSION_SWEEP_INTERVAL=3600)) for _ in range(3)]
+    limpadores = {id(app.extensions['limpador_sessoes']) for app in apps}
+    assert len(limpadores) == 1
+    assert sum(t.name == 'limpador-sessoes' for t in threading.enumerate()) == 1
@@ -0,0 +1,129 @@
+"""PATCH /api/socios/batch e POST /api/socios/batch-delete"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+
+from models import Socio, db
+
+
+def ler_socios(app):
+    with app.app_context():
+        return {s.IdSocio: s for s in db.session.execute(select(Socio)).scalars()}
+
+
+@pytest.fixture(params=[True, False], ids=['returning', 'sem_returning'])
+def returning(request, app, monkeypatch):
+    """Executa cada teste com e sem RETURNING no dialeto"""
+    with app.app_context():
+        dialeto = db.engine.dialect
+    monkeypatch.setattr(dialeto, 'update_returning', request.param)
+    monkeypatch.setattr(dialeto, 'delete_returning', request.param)
+    return request.param
+
+
+def test_atualiza_por_ids(app, cliente, socios, returning):
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [1, 3], 'valores': {'status': 'inativo'}})
+    assert resposta.status_code == 200
+    assert resposta.get_json() == {'ids': [1, 3], 'total': 2}
+    atuais = ler_socios(app)
+    assert [atuais[i].Status for i in (1, 2, 3, 4)] == ['INATIVO', 'ATIVO', 'INATIVO', 'ATIVO']
+
+
+def test_atualiza_por_filtro(app, cliente, socios, returning):
+    resposta = cliente.patch('/api/socios/batch',
+                             json={'filtro': {'codEmpresa': 'E2'}, 'valores': {'funcao': 'MONTADOR'}})
+    assert resposta.get_json() == {'ids': [3, 4], 'total': 2}
+    atuais = ler_socios(app)
+    assert [atuais[i].Funcao for i in (1, 2, 3, 4)] == [None, None, 'MONTADOR', 'MONTADOR']
+
+
+def test_exclui_por_ids_e_por_filtro(app, cliente, socios, returning):
+    assert cliente.post('/api/socios/batch-delete', json={'ids': [2]}).get_json() == {'ids': [2], 'total': 1}
+    resposta = cliente.post('/api/socios/batch-delete', json={'filtro': {'status': 'ATIVO', 'codEmpresa': 'E2'}})
+    assert resposta.get_json() == {'ids': [4], 'total': 1}
+    assert sorted(ler_socios(app)) == [1, 3]
+
+
+def test_selecao_sem_linhas(cliente, socios, returning):
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [99], 'valores': {'status': 'ATIVO'}})
+    assert resposta.get_json() == {'ids': [], 'total': 0}
+
+
+@pytest.mark.parametrize('corpo', [
+    {},
+    {'filtro': {}},
+    {'filtro': {'status': ''}},
+    {'ids': []},
+])
+def test_recusa_selecao_vazia(app, cliente, socios, corpo):
+    for url, metodo in (('/api/socios/batch', 'PATCH'), ('/api/socios/batch-delete', 'POST')):
+        resposta = cliente.open(url, method=metodo, json=dict(corpo, valores={'status': 'INATIVO'}))
+        assert resposta.status_code == 400
+    assert {s.Status for s in ler_socios(app).values()} == {'ATIVO', 'INATIVO'}
+    assert len(ler_socios(app)) == 4
+
+
+@pytest.mark.parametrize('corpo', [
+    {'ids': [1], 'filtro': {'status': 'ATIVO'}},
+    {'ids': [1, 'x']},
+    {'ids': [True]},
+    {'filtro': ['status']},
+    {'filtro': {'senha': 'x'}},
+])
+def test_recusa_selecao_invalida(cliente, socios, corpo):
+    resposta = cliente.patch('/api/socios/batch', json=dict(corpo, valores={'status': 'INATIVO'}))
+    assert resposta.status_code == 400
+
+
+@pytest.mark.parametrize('valores', [
+    {},
+    {'nome': 'X'},
+    {'cpf': '123'},
+])
+def test_recusa_campos_invalidos(cliente, socios, valores):
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [1], 'valores': valores})
+    assert resposta.status_code == 400
+
+
+@pytest.mark.parametrize('valores', [
+    {'carta': 'talvez'},
+    {'carta': 2},
+    {'ficha': []},
+    {'valorMensalidade': 'abc'},
+    {'valorMensalidade': 'NaN'},
+    {'valorMensalidade': True},
+    {'valorMensalidade': 1e12},
+    {'dataDemissao': '31/12/2024'},
+])
+def test_recusa_valores_invalidos(app, cliente, socios, valores):
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [1, 2], 'valores': valores})
+    assert resposta.status_code == 400
+    atuais = ler_socios(app)
+    assert atuais[1].Carta is False and atuais[1].ValorMensalidade is None
+
+
+@pytest.mark.parametrize('valor, esperado', [
+    (True, True), (False, False), ('false', False), ('0', False), ('Não', False),
+    ('true', True), ('1', True), ('SIM', True), (None, None),
+])
+def test_booleanos(app, cliente, socios, valor, esperado):
+    cliente.patch('/api/socios/batch', json={'ids': [1, 2], 'valores': {'carta': True}})
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [1, 2], 'valores': {'carta': valor}})
+    assert resposta.status_code == 200
+    atuais = ler_socios(app)
+    assert atuais[1].Carta is esperado and atuais[2].Carta is esperado
+    assert atuais[3].Carta is False
+
+
+def test_valor_mensalidade(app, cliente, socios):
+    resposta = cliente.patch('/api/socios/batch', json={'ids': [1], 'valores': {'valorMensalidade': '35.50'}})
+    assert resposta.status_code == 200
+    assert ler_socios(app)[1].ValorMensalidade == Decimal('35.50')
+
+
+@pytest.mark.parametrize('url, metodo', [('/api/socios/batch', 'PATCH'), ('/api/socios/batch-delete', 'POST')])
+def test_corpo_nao_objeto(cliente, socios, url, metodo):
+    resposta = cliente.open(url, method=metodo, json=[1, 2])
+    assert resposta.status_code == 400
@@ -0,0 +1,104 @@
+"""GET /api/socios paginado por cursor (keyset), com filtros no servidor"""
+
+import pytest
+from sqlalchemy import insert
+
+from models import Socio, db
+
+NOMES = ['ANA', 'BRUNO', 'ANA', None, 'CARLA', 'BRUNO', 'DANIEL', 'ANA', None, 'EVA', 'CARLA', 'FABIO']
+
+
+@pytest.fixture
+def muitos_socios(app):
+    linhas = [{
+        'IdSocio': i,
+        'Nome': nome,
+        'Matricula': None if i % 4 == 0 else f'M{(i * 7) % 5:03d}',
+        'Status': 'ATIVO' if i % 3 else 'INATIVO',
+        'CodEmpresa': 'E1' if i % 2 else 'E2',
+        'RazaoSocial': 'EMPRESA UM' if i % 2 else 'EMPRESA DOIS',
+        'Carta': False,
+    } for i, nome in enumerate(NOMES, start=1)]
+    with app.app_context():
+        db.session.execute(insert(Socio.__table__), linhas)
+        db.session.commit()
+    return linhas
+
+
+def esperado(linhas, chave, descendente):
+    """Mesma ordem do keyset: (COALESCE(valor, ''), IdSocio)"""
+    if chave == 'IdSocio':
+        ordenadas = sorted(linhas, key=lambda l: l['IdSocio'])
+    else:
+        ordenadas = sorted(linhas, key=lambda l: (l[chave] or '', l['IdSocio']))
+    ids = [l['IdSocio'] for l in ordenadas]
+    return ids[::-1] if descendente else ids
+
+
+def percorrer(cliente, parametros, limite=5):
+    ids, cursor, paginas = [], None, 0
+    while True:
+        query = dict(parametros, limit=limite)
+        if cursor:
+            query['cursor'] = cursor
+        resposta = cliente.get('/api/socios', query_string=query)
+        assert resposta.status_code == 200, resposta.get_json()
+        dados = resposta.get_json()
+        assert len(dados['items']) <= limite and dados['limit'] == limite
+        ids += [item['id'] for item in dados['items']]
+        paginas += 1
+        cursor = dados['next_cursor']
+        if cursor is None:
+            return ids, paginas
+
+
+@pytest.mark.parametrize('ordem, chave', [
+    ('id', 'IdSocio'), ('-id', 'IdSocio'),
+    ('nome', 'Nome'), ('-nome', 'Nome'),
+    ('matricula', 'Matricula'), ('-matricula', 'Matricula'),
+    ('razaoSocial', 'RazaoSocial'), ('-status', 'Status'),
+])
+def test_cursor_percorre_todas_as_linhas_uma_vez(cliente, muitos_socios, ordem, chave):
+    ids, paginas = percorrer(cliente, {'ordem': ordem})
+    assert ids == esperado(muitos_socios, chave, ordem.startswith('-'))
+    assert paginas == 3
+
+
+def test_cursor_com_filtros(cliente, muitos_socios):
+    ids, _ = percorrer(cliente, {'ordem': 'nome', 'status': 'ativo', 'codEmpresa': 'E1'}, limite=2)
+    filtradas = [l for l in muitos_socios if l['Status'] == 'ATIVO' and l['CodEmpresa'] == 'E1']
+    assert ids == esperado(filtradas, 'Nome', False)
+
+
+def test_filtros_por_prefixo(cliente, muitos_socios):
+    assert [s['id'] for s in cliente.get('/api/socios?nome=an').get_json()] == [1, 3, 8]
+    # Curingas do LIKE são literais
+    assert cliente.get('/api/socios?nome=%25').get_json() == []
+
+
+def test_sem_limit_nem_cursor_responde_lista(cliente, muitos_socios):
+    resposta = cliente.get('/api/socios').get_json()
+    assert [s['id'] for s in resposta] == list(range(1, len(NOMES) + 1))
+
+
+@pytest.mark.parametrize('limite, efetivo', [('0', 1), ('-3', 1), ('100000', 500)])
+def test_limite_dentro_da_faixa(cliente, muitos_socios, limite, efetivo):
+    assert cliente.get(f'/api/socios?limit={limite}').get_json()['limit'] == efetivo
+
+
+@pytest.mark.parametrize('query', [
+    'limit=abc',
+    'limit=5&cursor=nao-e-base64!',
+    'limit=5&cursor=eyJ4IjoxfQ',  # JSON válido, sem os campos do cursor
+    'ordem=senha',
+])
+def test_parametros_invalidos(cliente, muitos_socios, query):
+    resposta = cliente.get(f'/api/socios?{query}')
+    assert resposta.status_code == 400
+    assert resposta.get_json()['message']
+
+
+def test_cursor_de_outra_ordenacao(cliente, muitos_socios):
+    cursor = cliente.get('/api/socios?ordem=nome&limit=2').get_json()['next_cursor']
+    resposta = cliente.get('/api/socios', query_string={'ordem': 'matricula', 'limit': 2, 'cursor': cursor})
+    assert resposta.status_code == 400
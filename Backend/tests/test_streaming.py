@@ -0,0 +1,27 @@
+"""Respostas em streaming (?stream=1): mesma codificação compacta de codificar_json()"""
+
+from sqlalchemy import update
+
+from models import Socio, db
+from serializacao import codificar_json
+
+
+def test_usuarios_em_streaming(cliente):
+    lista = cliente.get('/api/usuarios').get_json()
+    assert lista
+    resposta = cliente.get('/api/usuarios?stream=1')
+    assert resposta.status_code == 200
+    assert resposta.data == codificar_json(lista)
+
+
+def test_relatorio_ativos_por_empresa(app, cliente, socios):
+    with app.app_context():
+        # Status gravado como veio do formulário
+        db.session.execute(update(Socio).where(Socio.IdSocio == 2).values(Status='Ativo'))
+        db.session.commit()
+    resposta = cliente.get('/api/relatorios/socios-ativos-por-empresa')
+    assert resposta.status_code == 200
+    assert b': ' not in resposta.data and b', ' not in resposta.data
+    dados = resposta.get_json()
+    assert (dados['totalEmpresas'], dados['totalSocios']) == (2, 3)
+    assert [[s['id'] for s in grupo['socios']] for grupo in dados['grupos']] == [[1, 2], [4]]
@@ -9,31 +9,21 @@ import ReactECharts from 'echarts-for-react';
 
 const { Title, Paragraph } = Typography;
 
-interface Usuario {
-  IdUsuarios: number;
-  Nome: string;
-  CPF: string;
-  Funcao: string;
-  Email: string;
-  Usuario: string;
-  Perfil: string;
-  Cadastrante: string;
-  DataCadastro: string;
+interface ItemGrafico {
+  name: string;
+  value: number;
 }
 
-interface Socio {
-  id: number;
-  nome: string;
-  status: string;
-}
-
-interface Empresa {
-  id: number;
-  codEmpresa: string;
-  cnpj: string;
-  razaoSocial: string;
-  nomeFantasia: string;
-  nFuncionarios: number;
+interface DashboardStats {
+  totais: {
+    usuarios: number;
+    socios: number;
+    empresas: number;
+  };
+  usuariosPorPerfil: ItemGrafico[];
+  sociosPorStatus: ItemGrafico[];
+  empresasPorFuncionarios: ItemGrafico[];
+  atualizadoEm: string;
 }
 
 const Dashboard: React.FC = () => {
@@ -60,97 +50,36 @@ const Dashboard: React.FC = () => {
     });
   };
 
-  const fetchTotalUsuarios = async () => {
+  // Totais e dados dos gráficos vêm agregados do backend em uma única chamada
+  const fetchDashboardStats = async () => {
     try {
       setLoadingUsuarios(true);
-      const response = await axios.get<Usuario[]>('http://localhost:5000/api/usuarios');
-      setTotalUsuarios(response.data.length);
-    } catch (error) {
-      console.error('❌ Dashboard.tsx: Erro ao carregar usuários:', error);
-      message.error('Erro ao carregar total de usuários');
-    } finally {
-      setLoadingUsuarios(false);
-    }
-  };
-
-  const fetchTotalSocios = async () => {
-    try {
       setLoadingSocios(true);
-      const response = await axios.get<Socio[]>('http://localhost:5000/api/socios');
-      setTotalSocios(response.data.length);
-    } catch (error) {
-      console.error('❌ Dashboard.tsx: Erro ao carregar sócios:', error);
-      message.error('Erro ao carregar total de sócios');
-    } finally {
-      setLoadingSocios(false);
-    }
-  };
-
-  const fetchTotalEmpresas = async () => {
-    try {
       setLoadingEmpresas(true);
-      const response = await axios.get<Empresa[]>('http://localhost:5000/api/empresas');
-      setTotalEmpresas(response.data.length);
-    } catch (error) {
-      console.error('❌ Dashboard.tsx: Erro ao carregar empresas:', error);
-      message.error('Erro ao carregar total de empresas');
-    } finally {
-      setLoadingEmpresas(false);
-    }
-  };
-
-  // Função para buscar dados para os gráficos
-  const fetchChartData = async () => {
-    try {
       setLoadingCharts(true);
-      
-      // Dados de usuários por perfil
-      const usuariosResponse = await axios.get<Usuario[]>('http://localhost:5000/api/usuarios');
-      const perfis = usuariosResponse.data.reduce((acc: any, usuario) => {
-        acc[usuario.Perfil] = (acc[usuario.Perfil] || 0) + 1;
-        return acc;
-      }, {});
-      
-      const perfisData = Object.entries(perfis).map(([name, value]) => ({
-        name,
-        value
-      }));
-      setUsuariosPorPerfil(perfisData);
-      
-      // Dados de empresas por número de funcionários
-      const empresasResponse = await axios.get<Empresa[]>('http://localhost:5000/api/empresas');
-      const empresasData = empresasResponse.data.map(empresa => ({
-        name: empresa.nomeFantasia,
-        value: empresa.nFuncionarios
-      }));
-      setEmpresasPorFuncionarios(empresasData);
-      
-      // Dados de sócios por status
-      const sociosResponse = await axios.get<Socio[]>('http://localhost:5000/api/socios');
-      const status = sociosResponse.data.reduce((acc: any, socio) => {
-        acc[socio.status] = (acc[socio.status] || 0) + 1;
-        return acc;
-      }, {});
-      
-      const statusData = Object.entries(status).map(([name, value]) => ({
-        name,
-        value
-      }));
-      setSociosPorStatus(statusData);
-      
+
+      const response = await axios.get<DashboardStats>('http://localhost:5000/api/dashboard/stats');
+      const stats = response.data;
+
+      setTotalUsuarios(stats.totais.usuarios);
+      setTotalSocios(stats.totais.socios);
+      setTotalEmpresas(stats.totais.empresas);
+      setUsuariosPorPerfil(stats.usuariosPorPerfil);
+      setEmpresasPorFuncionarios(stats.empresasPorFuncionarios);
+      setSociosPorStatus(stats.sociosPorStatus);
     } catch (error) {
-      console.error('❌ Dashboard.tsx: Erro ao carregar dados dos gráficos:', error);
-      message.error('Erro ao carregar dados dos gráficos');
+      console.error('❌ Dashboard.tsx: Erro ao carregar estatísticas:', error);
+      message.error('Erro ao carregar estatísticas do dashboard');
     } finally {
+      setLoadingUsuarios(false);
+      setLoadingSocios(false);
+      setLoadingEmpresas(false);
       setLoadingCharts(false);
     }
   };
 
   useEffect(() => {
-    fetchTotalUsuarios();
-    fetchTotalSocios();
-    fetchTotalEmpresas();
-    fetchChartData();
+    fetchDashboardStats();
     setLastUpdate(new Date());
   }, []);
 
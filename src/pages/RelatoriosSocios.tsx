@@ -443,24 +443,29 @@ const RelatoriosSocios: React.FC = () => {
   };
 
   // Função para gerar PDF de todos os sócios ativos, agrupados por empresa (cada empresa em uma página)
-  const gerarListaTodasEmpresas = () => {
-    // Agrupar sócios ativos por empresa, descartando os que não têm empresa
+  const gerarListaTodasEmpresas = async () => {
+    // Sócios ativos já agrupados por empresa e ordenados por nome (pt-BR) no servidor
+    let relatorio;
+    try {
+      relatorio = await apiService.getAtivosPorEmpresa({ semEmpresa: false });
+    } catch (error) {
+      console.error('Erro ao gerar relatório por empresa:', error);
+      return;
+    }
     const ativosPorEmpresa: { [empresa: string]: { matricula?: string; nome?: string; cadastro?: string; codEmpresa?: string }[] } = {};
-    socios.filter(s => s.status?.toUpperCase() === 'ATIVO' && s.razaoSocial && s.razaoSocial !== 'SEM EMPRESA')
-      .forEach(socio => {
-        const empresa = socio.razaoSocial!;
+    relatorio.grupos.filter(grupo => grupo.razaoSocial && grupo.razaoSocial !== 'SEM EMPRESA')
+      .forEach(grupo => {
+        const empresa = grupo.razaoSocial!;
         if (!ativosPorEmpresa[empresa]) ativosPorEmpresa[empresa] = [];
-        ativosPorEmpresa[empresa].push({
-          matricula: socio.matricula || '',
-          nome: socio.nome || '',
-          cadastro: socio.dataCadastro ? moment(socio.dataCadastro).format('DD/MM/YYYY') : '',
-          codEmpresa: socio.codEmpresa || ''
+        grupo.socios.forEach(socio => {
+          ativosPorEmpresa[empresa].push({
+            matricula: socio.matricula || '',
+            nome: socio.nome || '',
+            cadastro: socio.dataCadastro ? moment(socio.dataCadastro).format('DD/MM/YYYY') : '',
+            codEmpresa: grupo.codEmpresa || ''
+          });
         });
       });
-    // Ordenar os sócios de cada empresa por nome
-    Object.keys(ativosPorEmpresa).forEach(empresa => {
-      ativosPorEmpresa[empresa].sort((a, b) => (a.nome || '').localeCompare(b.nome || '', 'pt-BR'));
-    });
     // Criar um único PDF
     const doc = new jsPDF({ orientation: orientacaoPDF, unit: 'mm', format: 'a4' });
     let primeira = true;
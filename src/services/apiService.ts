@@ -1,6 +1,6 @@
 import api from '../utils/axiosConfig';
 import { toast } from 'react-toastify';
-import { Socio } from '../types/socioTypes';
+import { Socio, RelatorioAtivosPorEmpresa } from '../types/socioTypes';
 import { Empresa } from '../types/empresaTypes';
 
 // Interceptador para logs de API
@@ -324,4 +324,21 @@ export const apiService = {
       throw error;
     }
   },
+
+  // Sócios ativos agrupados por empresa (agrupamento e ordem feitos no servidor)
+  getAtivosPorEmpresa: async (params?: { codEmpresa?: string; semEmpresa?: boolean }): Promise<RelatorioAtivosPorEmpresa> => {
+    try {
+      const response = await api.get('/api/relatorios/socios-ativos-por-empresa', {
+        params: {
+          codEmpresa: params?.codEmpresa,
+          semEmpresa: params?.semEmpresa === false ? 0 : undefined
+        }
+      });
+      return response.data as RelatorioAtivosPorEmpresa;
+    } catch (error: any) {
+      const errorMessage = handleApiError(error, 'Falha ao gerar o relatório de sócios ativos por empresa');
+      toast.error(errorMessage);
+      throw error;
+    }
+  },
 };
\ No newline at end of file
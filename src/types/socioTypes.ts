@@ -39,4 +39,25 @@ export interface Socio {
   ficha: boolean | null;
   observacao: string | null;
   telefone: string | null;
-} 
\ No newline at end of file
+} 
+
+// Relatório de sócios ativos agrupados por empresa (/api/relatorios/socios-ativos-por-empresa)
+export interface SocioAtivoEmpresa {
+  id: number;
+  matricula: string | null;
+  nome: string | null;
+  dataCadastro: string | null;
+}
+
+export interface GrupoAtivosEmpresa {
+  codEmpresa: string | null;
+  razaoSocial: string | null;
+  total: number;
+  socios: SocioAtivoEmpresa[];
+}
+
+export interface RelatorioAtivosPorEmpresa {
+  grupos: GrupoAtivosEmpresa[];
+  totalEmpresas: number;
+  totalSocios: number;
+}